@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from ...domain.entities.embedding import Embedding
 from ...domain.entities.transcription import Transcription
@@ -12,3 +13,14 @@ class EmbeddingService(ABC):
     @abstractmethod
     def create_query_embedding(self, query_text: str) -> list[float]:
         pass
+
+    def create_query_embeddings(self, query_texts: list[str]) -> list[list[float]]:
+        return [self.create_query_embedding(query_text) for query_text in query_texts]
+
+    def create_embeddings_batch(
+        self, transcriptions: Iterable[Transcription]
+    ) -> dict[str, list[Embedding]]:
+        return {
+            transcription.episode_id: self.create_embeddings(transcription)
+            for transcription in transcriptions
+        }
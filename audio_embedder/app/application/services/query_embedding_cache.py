@@ -0,0 +1,117 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from ...domain.repositories.embedding_cache_repository import (
+    EmbeddingCacheRepository,
+)
+from ...shared.hashing import sha256_text
+from ...shared.logger import get_logger
+
+
+class QueryEmbeddingCache:
+    """Caché de dos niveles para embeddings de consultas.
+
+    Primer nivel: LRU en memoria del proceso. Segundo nivel: caché persistente
+    en disco. La clave es el texto normalizado de la consulta y el modelo.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        disk_cache: Optional[EmbeddingCacheRepository] = None,
+        capacity: int = 1024,
+    ):
+        self.model_name = model_name
+        self.disk_cache = disk_cache
+        self.capacity = capacity
+        self.logger = get_logger(self.__class__.__name__)
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        normalized = unicodedata.normalize("NFC", query).casefold()
+        return re.sub(r"\s+", " ", normalized).strip()
+
+    def get_or_compute(
+        self, query: str, compute: Callable[[str], list[float]]
+    ) -> list[float]:
+        """Devuelve el embedding cacheado o lo calcula con `compute` sobre la
+        consulta normalizada"""
+        normalized = self.normalize_query(query)
+        key = sha256_text(normalized)
+
+        vector = self._get_from_memory(key)
+        if vector is not None:
+            self.logger.debug(f"Query embedding memory hit: '{normalized}'")
+            return vector
+
+        if self.disk_cache:
+            vector = self.disk_cache.get_many(self.model_name, [key]).get(key)
+            if vector is not None:
+                self.logger.debug(f"Query embedding disk hit: '{normalized}'")
+                self._put_in_memory(key, vector)
+                return vector
+
+        vector = compute(normalized)
+        if vector:
+            self._put_in_memory(key, vector)
+            if self.disk_cache:
+                self.disk_cache.save_many(self.model_name, {key: vector})
+        return vector
+
+    def get_or_compute_many(
+        self, queries: list[str], compute_many: Callable[[list[str]], list[list[float]]]
+    ) -> list[list[float]]:
+        """Como `get_or_compute` para varias consultas: una lectura del disco y
+        una sola llamada a `compute_many` con las consultas que falten"""
+        normalized = [self.normalize_query(query) for query in queries]
+        keys = [sha256_text(query) for query in normalized]
+
+        vectors: dict[str, list[float]] = {}
+        for key in keys:
+            vector = self._get_from_memory(key)
+            if vector is not None:
+                vectors[key] = vector
+
+        pending = [key for key in dict.fromkeys(keys) if key not in vectors]
+        if pending and self.disk_cache:
+            stored = self.disk_cache.get_many(self.model_name, pending)
+            for key, vector in stored.items():
+                self._put_in_memory(key, vector)
+            vectors.update(stored)
+
+        misses = {
+            key: query for key, query in zip(keys, normalized) if key not in vectors
+        }
+        if misses:
+            computed = dict(zip(misses, compute_many(list(misses.values()))))
+            computed = {key: vector for key, vector in computed.items() if vector}
+            for key, vector in computed.items():
+                self._put_in_memory(key, vector)
+            if computed and self.disk_cache:
+                self.disk_cache.save_many(self.model_name, computed)
+            vectors.update(computed)
+
+        self.logger.debug(
+            f"Query embeddings: {len(set(keys)) - len(misses)} cached, "
+            f"{len(misses)} computed"
+        )
+        return [vectors.get(key, []) for key in keys]
+
+    def _get_from_memory(self, key: str) -> Optional[list[float]]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+            return vector
+
+    def _put_in_memory(self, key: str, vector: list[float]) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.capacity:
+                self._memory.popitem(last=False)
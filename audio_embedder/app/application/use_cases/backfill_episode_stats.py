@@ -0,0 +1,38 @@
+from ...domain.entities.episode_stats import EpisodeStats
+from ...domain.repositories.episode_stats_repository import EpisodeStatsRepository
+from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...shared.logger import get_logger
+from ...shared.semantic_chunker import SemanticChunker
+
+
+class BackfillEpisodeStatsUseCase:
+    """Calcula las estadísticas de episodios ya ingeridos re-aplicando el
+    chunker (determinista) a sus transcripciones, sin llamar a ninguna API"""
+
+    def __init__(
+        self,
+        transcription_repository: TranscriptionRepository,
+        stats_repository: EpisodeStatsRepository,
+    ):
+        self.transcription_repository = transcription_repository
+        self.stats_repository = stats_repository
+        self.logger = get_logger(self.__class__.__name__)
+        self.chunker = SemanticChunker()
+
+    def execute(self) -> int:
+        saved = 0
+        for handle in self.transcription_repository.iter_handles():
+            episode_metadata = {
+                "episode_id": handle.episode_id,
+                "title": handle.episode_id,
+            }
+            chunks = self.chunker.chunk_transcript(handle.text, episode_metadata)
+            self.stats_repository.save(
+                EpisodeStats.from_chunk_metadata(
+                    handle.episode_id, [chunk["metadata"] for chunk in chunks]
+                )
+            )
+            saved += 1
+
+        self.logger.info(f"Stored stats for {saved} episodes")
+        return saved
@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Optional
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.lexical_index_repository import LexicalIndexRepository
+from ...domain.repositories.positional_index_repository import (
+    PositionalIndexRepository,
+)
+from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...shared.hashing import chunk_id
+from ...shared.logger import get_logger
+from ...shared.semantic_chunker import SemanticChunker
+
+
+class BuildLexicalIndexUseCase:
+    """Construye el índice BM25 a partir de las transcripciones.
+
+    Usa el mismo chunker y los mismos ids deterministas que el servicio de
+    embeddings, así que cada chunk del índice léxico es el mismo chunk del
+    almacén de vectores y la búsqueda híbrida puede fusionarlos por id.
+
+    Si se le da un índice posicional, lo reconstruye también con las
+    transcripciones completas (búsqueda de frases y NEAR/k).
+    """
+
+    def __init__(
+        self,
+        transcription_repository: TranscriptionRepository,
+        lexical_index: LexicalIndexRepository,
+        positional_index: Optional[PositionalIndexRepository] = None,
+    ):
+        self.transcription_repository = transcription_repository
+        self.lexical_index = lexical_index
+        self.positional_index = positional_index
+        self.logger = get_logger(self.__class__.__name__)
+        self.chunker = SemanticChunker()
+
+    def execute(self) -> int:
+        chunks = []
+        created_at = datetime.now()
+        for handle in self.transcription_repository.iter_handles():
+            episode_metadata = {
+                "episode_id": handle.episode_id,
+                "title": handle.episode_id,
+                "duration": handle.duration or 0,
+                "language": handle.language or "es",
+                "file_path": handle.file_path or "",
+            }
+            for chunk in self.chunker.chunk_transcript(handle.text, episode_metadata):
+                metadata = chunk["metadata"]
+                metadata["chunker_version"] = self.chunker.VERSION
+                metadata["chunk_id"] = chunk_id(
+                    handle.episode_id,
+                    self.chunker.VERSION,
+                    metadata["chunk_index"],
+                    chunk["content"],
+                )
+                chunks.append(
+                    Embedding(
+                        episode_id=handle.episode_id,
+                        transcription_id=handle.episode_id,
+                        vector=[],
+                        model_name="bm25",
+                        created_at=created_at,
+                        chunk_index=metadata["chunk_index"],
+                        chunk_text=chunk["content"],
+                        metadata=metadata,
+                    )
+                )
+
+        indexed = self.lexical_index.rebuild(chunks)
+        if self.positional_index:
+            # Segunda pasada: los textos se vuelven a leer de uno en uno
+            self.positional_index.rebuild(
+                handle.load() for handle in self.transcription_repository.iter_handles()
+            )
+        self.logger.info(f"Indexed {indexed} chunks for lexical search")
+        return indexed
@@ -0,0 +1,72 @@
+import time
+from typing import Any
+
+from ...domain.repositories.compressible_transcription_repository import (
+    CompressibleTranscriptionRepository,
+)
+from ...shared.logger import get_logger
+
+
+class CompressTranscriptionsUseCase:
+    """Reescribe el directorio de transcripciones con la compresión del
+    repositorio y mide el efecto: bytes en disco y tiempo de leer el corpus
+    completo, antes y después.
+
+    Con zstd, si el directorio aún no tiene diccionario, primero se entrena
+    uno con las propias transcripciones.
+    """
+
+    def __init__(self, repository: CompressibleTranscriptionRepository):
+        self.repository = repository
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self, read_repeats: int = 3) -> dict[str, Any]:
+        bytes_before = self.repository.disk_usage()
+        read_before = self._time_full_read(read_repeats)
+
+        dictionary_bytes = 0
+        if (
+            self.repository.compression == "zstd"
+            and not self.repository.has_dictionary()
+        ):
+            dictionary_bytes = self.repository.train_dictionary(
+                self.repository.iter_all()
+            )
+
+        rewritten = 0
+        for transcription in self.repository.iter_all():
+            self.repository.rewrite(transcription)
+            rewritten += 1
+        if not rewritten:
+            raise ValueError("No hay transcripciones que comprimir")
+
+        bytes_after = self.repository.disk_usage()
+        read_after = self._time_full_read(read_repeats)
+
+        report = {
+            "transcriptions": rewritten,
+            "compression": self.repository.compression,
+            "dictionary_bytes": dictionary_bytes,
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+            "compression_ratio": bytes_before / bytes_after,
+            "read_seconds_before": read_before,
+            "read_seconds_after": read_after,
+        }
+        self.logger.info(
+            f"📦 {rewritten} transcripciones en {report['compression']}: "
+            f"{bytes_before / 1e6:.2f} MB -> {bytes_after / 1e6:.2f} MB "
+            f"(x{report['compression_ratio']:.2f}) | lectura completa: "
+            f"{read_before * 1000:.0f} ms -> {read_after * 1000:.0f} ms"
+        )
+        return report
+
+    def _time_full_read(self, repeats: int) -> float:
+        """Mejor tiempo de leer y decodificar todas las transcripciones"""
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in self.repository.iter_all():
+                pass
+            best = min(best, time.perf_counter() - start)
+        return best
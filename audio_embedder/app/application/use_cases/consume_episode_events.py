@@ -0,0 +1,64 @@
+import threading
+from typing import Optional
+
+from ...domain.repositories.episode_event_repository import EpisodeEventRepository
+from ...shared.logger import get_logger
+from .process_episodes import ProcessEpisodesUseCase
+
+
+class ConsumeEpisodeEventsUseCase:
+    """Worker: procesa los episodios que el crawler va descargando.
+
+    En lugar de recorrer todos los episodios buscando los que faltan por
+    transcribir, lee de la cola sólo los eventos pendientes. Cada episodio
+    se procesa con `ProcessEpisodesUseCase.process_episode`.
+    """
+
+    def __init__(
+        self,
+        event_repository: EpisodeEventRepository,
+        process_episodes: ProcessEpisodesUseCase,
+    ):
+        self.event_repository = event_repository
+        self.process_episodes = process_episodes
+        self.logger = get_logger(self.__class__.__name__)
+
+    def run_once(self, batch_size: int = 10) -> int:
+        """Procesa los eventos pendientes y devuelve cuántos se consumieron.
+        Un evento que falla se reintenta en la siguiente pasada, no en esta"""
+        consumed = 0
+        last_seq = 0
+        while events := self.event_repository.pending(batch_size, last_seq):
+            for event in events:
+                last_seq = event.seq
+                label = f"[event {event.seq}]"
+                try:
+                    processed = self.process_episodes.process_episode(
+                        event.episode, label
+                    )
+                except Exception as e:
+                    self.event_repository.fail(event.seq, str(e))
+                    continue
+
+                if processed:
+                    self.event_repository.ack(event.seq)
+                    consumed += 1
+                else:
+                    self.event_repository.fail(event.seq, "transcription failed")
+        return consumed
+
+    def run(
+        self,
+        poll_interval: float = 30.0,
+        once: bool = False,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        stop = stop or threading.Event()
+        self.logger.info(f"👷 Worker escuchando eventos (cada {poll_interval:g}s)")
+        while not stop.is_set():
+            consumed = self.run_once()
+            if consumed:
+                self.logger.info(f"✅ {consumed} episodios procesados")
+            if once:
+                return
+            stop.wait(poll_interval)
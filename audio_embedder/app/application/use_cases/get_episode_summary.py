@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from ...domain.repositories.episode_stats_repository import EpisodeStatsRepository
+
+
+class GetEpisodeSummaryUseCase:
+    """Resumen de un episodio leído de las estadísticas guardadas al ingerir,
+    sin embeddings ni búsquedas"""
+
+    def __init__(self, stats_repository: EpisodeStatsRepository):
+        self.stats_repository = stats_repository
+
+    def execute(self, episode_id: str) -> Optional[dict[str, Any]]:
+        stats = self.stats_repository.get(episode_id)
+        if stats is None:
+            return None
+        return {
+            "episode_id": stats.episode_id,
+            "title": stats.title,
+            "chunks_count": stats.chunks_count,
+            "chunk_types": stats.chunk_types,
+            "total_words": stats.total_words,
+            "duration_minutes": stats.duration_minutes,
+            "avg_chunk_words": stats.avg_chunk_words,
+        }
+
+    @staticmethod
+    def missing_stats(episode_id: str) -> dict[str, Any]:
+        """Resultado para un episodio sin estadísticas guardadas. No se estima
+        con una búsqueda: un límite de chunks daría recuentos incompletos"""
+        return {
+            "episode_id": episode_id,
+            "chunks_count": 0,
+            "error": (
+                f"No hay estadísticas del episodio {episode_id}; "
+                "ejecuta --command backfill-stats"
+            ),
+        }
@@ -0,0 +1,22 @@
+from ...domain.repositories.episode_repository import EpisodeRepository
+from ...shared.logger import get_logger
+
+
+class MigrateEpisodesUseCase:
+    """Copia los episodios de un repositorio a otro (p. ej. de episodes.json
+    al catálogo SQLite compartido con el crawler). Sólo se escriben los
+    episodios nuevos o que han cambiado, así que se puede repetir."""
+
+    def __init__(self, source: EpisodeRepository, target: EpisodeRepository):
+        self.source = source
+        self.target = target
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self) -> tuple[int, int]:
+        """Devuelve (episodios leídos, nuevos o cambiados)"""
+        episodes = self.source.get_all()
+        changed = self.target.save_many(episodes)
+        self.logger.info(
+            f"Migrated {len(episodes)} episodes ({changed} new or changed)"
+        )
+        return len(episodes), changed
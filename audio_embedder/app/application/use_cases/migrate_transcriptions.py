@@ -0,0 +1,30 @@
+from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...shared.logger import get_logger
+
+
+class MigrateTranscriptionsUseCase:
+    """Copia las transcripciones de un repositorio a otro (p. ej. del
+    directorio de JSON a SQLite). Las que ya existen en el destino no se
+    tocan, así que se puede repetir tras transcribir episodios nuevos."""
+
+    def __init__(
+        self, source: TranscriptionRepository, target: TranscriptionRepository
+    ):
+        self.source = source
+        self.target = target
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self) -> tuple[int, int]:
+        """Devuelve (copiadas, ya existentes)"""
+        imported = skipped = 0
+        for transcription in self.source.iter_all():
+            if self.target.exists(transcription.episode_id):
+                skipped += 1
+                continue
+            self.target.save(transcription)
+            imported += 1
+
+        self.logger.info(
+            f"Migrated {imported} transcriptions ({skipped} already present)"
+        )
+        return imported, skipped
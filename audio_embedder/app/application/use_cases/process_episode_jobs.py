@@ -0,0 +1,107 @@
+import threading
+
+from ...domain.repositories.episode_job_queue import EpisodeJobQueue
+from ...shared.logger import get_logger
+from .process_episodes import ProcessEpisodesUseCase
+
+
+class _LeaseHeartbeat:
+    """Renueva el lease en un hilo mientras el episodio se procesa"""
+
+    def __init__(
+        self,
+        job_queue: EpisodeJobQueue,
+        episode_id: str,
+        worker_id: str,
+        lease_seconds: float,
+    ):
+        self.job_queue = job_queue
+        self.episode_id = episode_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        # Tres renovaciones por lease: perder una no basta para que caduque
+        while not self._stop.wait(self.lease_seconds / 3):
+            if not self.job_queue.heartbeat(
+                self.episode_id, self.worker_id, self.lease_seconds
+            ):
+                self.lost = True
+                return
+
+
+class ProcessEpisodeJobsUseCase:
+    """Procesa episodios desde una cola con leases compartida por varios
+    workers.
+
+    Cada worker añade a la cola los episodios del catálogo (los que ya están
+    no se duplican) y después reserva uno cada vez. Mientras lo transcribe
+    renueva el lease; si el worker muere, el lease caduca y otro worker
+    retoma el episodio. Así cada episodio se transcribe una sola vez aunque
+    haya varios workers.
+    """
+
+    def __init__(
+        self,
+        job_queue: EpisodeJobQueue,
+        process_episodes: ProcessEpisodesUseCase,
+        worker_id: str,
+        lease_seconds: float = 600.0,
+    ):
+        self.job_queue = job_queue
+        self.process_episodes = process_episodes
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self) -> int:
+        """Procesa episodios hasta vaciar la cola. Devuelve cuántos completó"""
+        episodes = self.process_episodes.episode_repository.get_all()
+        added = self.job_queue.enqueue(episodes)
+        self.logger.info(
+            f"📋 Worker {self.worker_id}: {added} episodios nuevos en la cola"
+        )
+
+        completed = 0
+        while job := self.job_queue.claim(self.worker_id, self.lease_seconds):
+            episode_id = job.episode.id
+            label = f"[{self.worker_id} #{job.attempts}]"
+            with _LeaseHeartbeat(
+                self.job_queue, episode_id, self.worker_id, self.lease_seconds
+            ) as heartbeat:
+                try:
+                    processed = self.process_episodes.process_episode(
+                        job.episode, label
+                    )
+                except Exception as e:
+                    self.job_queue.fail(episode_id, self.worker_id, str(e))
+                    self.logger.error(f"{label} {episode_id} failed: {e}")
+                    continue
+
+            if heartbeat.lost:
+                self.logger.warning(
+                    f"{label} Lease of {episode_id} was lost while processing it"
+                )
+            if not processed:
+                self.job_queue.fail(episode_id, self.worker_id, "transcription failed")
+            elif self.job_queue.complete(episode_id, self.worker_id):
+                completed += 1
+
+        counts = self.job_queue.counts()
+        self.logger.info(
+            f"✅ Worker {self.worker_id}: {completed} episodios completados | "
+            f"cola: {counts['done']} hechos, {counts['leased']} en curso, "
+            f"{counts['pending']} pendientes, {counts['failed']} fallidos"
+        )
+        return completed
@@ -1,3 +1,4 @@
+from ...domain.entities.episode import Episode
 from ...domain.repositories.embedding_repository import EmbeddingRepository
 from ...domain.repositories.episode_repository import EpisodeRepository
 from ...domain.repositories.transcription_repository import TranscriptionRepository
@@ -44,38 +45,7 @@ class ProcessEpisodesUseCase:
         )
 
         for i, episode in enumerate(episodes, 1):
-            self.logger.info(f"[{i}/{total_episodes}] Processing: {episode.title}")
-
-            existing_transcription = self.transcription_repository.get_by_episode_id(
-                episode.id
-            )
-
-            if existing_transcription:
-                self.logger.info(
-                    f"[{i}/{total_episodes}] Skipping - transcription already exists"
-                )
-                continue
-
-            transcription = self.audio_transcriptor.transcribe(episode)
-            if not transcription:
-                self.logger.warning(
-                    f"[{i}/{total_episodes}] Failed to transcribe episode"
-                )
-                continue
-
-            saved_transcription = self.transcription_repository.save(transcription)
-            self.logger.info(f"[{i}/{total_episodes}] Transcription saved")
-
-            if dry_run:
-                self.logger.info(
-                    f"[{i}/{total_episodes}] DRY RUN: Skipping embeddings creation"
-                )
-            else:
-                embeddings = self.embedding_service.create_embeddings(
-                    saved_transcription
-                )
-                self.embedding_repository.save_batch(embeddings)
-                self.logger.info(f"[{i}/{total_episodes}] Embeddings created and saved")
+            self.process_episode(episode, f"[{i}/{total_episodes}]", dry_run)
 
         if dry_run:
             self.logger.info(
@@ -85,3 +55,34 @@ class ProcessEpisodesUseCase:
         if self.cost_repository:
             total_cost = self.cost_repository.get_total_cost()
             self.logger.info(f"💰 Total OpenAI transcription costs: ${total_cost:.4f}")
+
+    def process_episode(
+        self, episode: Episode, label: str = "[1/1]", dry_run: bool = False
+    ) -> bool:
+        """Transcribe y crea los embeddings de un episodio. Devuelve False si
+        no se pudo transcribir; True si se procesó o ya estaba transcrito"""
+        self.logger.info(f"{label} Processing: {episode.title}")
+
+        existing_transcription = self.transcription_repository.get_by_episode_id(
+            episode.id
+        )
+
+        if existing_transcription:
+            self.logger.info(f"{label} Skipping - transcription already exists")
+            return True
+
+        transcription = self.audio_transcriptor.transcribe(episode)
+        if not transcription:
+            self.logger.warning(f"{label} Failed to transcribe episode")
+            return False
+
+        saved_transcription = self.transcription_repository.save(transcription)
+        self.logger.info(f"{label} Transcription saved")
+
+        if dry_run:
+            self.logger.info(f"{label} DRY RUN: Skipping embeddings creation")
+        else:
+            embeddings = self.embedding_service.create_embeddings(saved_transcription)
+            self.embedding_repository.save_batch(embeddings)
+            self.logger.info(f"{label} Embeddings created and saved")
+        return True
@@ -0,0 +1,58 @@
+from typing import Any
+
+from ...infrastructure.repositories.local_embedding_repository import (
+    LocalEmbeddingRepository,
+)
+from ...infrastructure.repositories.supabase_embedding_repository import (
+    SupabaseEmbeddingRepository,
+)
+from ...shared.logger import get_logger
+
+
+class ReconcileEmbeddingsUseCase:
+    """Compara el espejo local con la tabla de Supabase por id de chunk y
+    detecta los que sólo existen en uno de los dos lados (incluidas filas
+    remotas antiguas con ids aleatorios)"""
+
+    def __init__(
+        self,
+        local_repository: LocalEmbeddingRepository,
+        remote_repository: SupabaseEmbeddingRepository,
+    ):
+        self.local_repository = local_repository
+        self.remote_repository = remote_repository
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self) -> dict[str, Any]:
+        local_keys = self.local_repository.get_chunk_keys()
+        remote_keys = self.remote_repository.get_chunk_keys()
+
+        only_local = sorted(
+            (local_keys[chunk_id], chunk_id)
+            for chunk_id in local_keys.keys() - remote_keys.keys()
+        )
+        only_remote = sorted(
+            (remote_keys[chunk_id], chunk_id)
+            for chunk_id in remote_keys.keys() - local_keys.keys()
+        )
+
+        report = {
+            "local_chunks": len(local_keys),
+            "remote_chunks": len(remote_keys),
+            "only_local": [chunk_id for _, chunk_id in only_local],
+            "only_remote": [chunk_id for _, chunk_id in only_remote],
+        }
+
+        self.logger.info(
+            f"🔄 Local: {len(local_keys)} chunks | Supabase: {len(remote_keys)} chunks | "
+            f"sólo local: {len(only_local)} | sólo Supabase: {len(only_remote)}"
+        )
+        for (episode_id, chunk_index), chunk_id in only_local:
+            self.logger.warning(
+                f"Sólo local: {episode_id} chunk {chunk_index} ({chunk_id})"
+            )
+        for (episode_id, chunk_index), chunk_id in only_remote:
+            self.logger.warning(
+                f"Sólo Supabase: {episode_id} chunk {chunk_index} ({chunk_id})"
+            )
+        return report
@@ -15,3 +15,8 @@ class SearchEpisodesUseCase:
     def execute(self, query: str, top_k: int = 10) -> list[Embedding]:
         query_vector = self.embedding_service.create_query_embedding(query)
         return self.embedding_repository.search_similar(query_vector, top_k)
+
+    def search_many(self, queries: list[str], top_k: int = 10) -> list[list[Embedding]]:
+        """Resultados de varias consultas con un solo cálculo de embeddings"""
+        query_vectors = self.embedding_service.create_query_embeddings(queries)
+        return self.embedding_repository.search_similar_many(query_vectors, top_k)
@@ -0,0 +1,43 @@
+import time
+from typing import Any, Optional
+
+from ...domain.repositories.lexical_index_repository import LexicalIndexRepository
+from ...shared.logger import get_logger
+from .search_supabase import chunk_to_result
+
+
+class SearchLexicalUseCase:
+    """Búsqueda por palabras (BM25) sobre el índice léxico local.
+
+    No calcula embeddings ni llama a ninguna API: sirve para nombres, fechas
+    y lugares ("Luis XIV", "1492") que la búsqueda semántica resuelve mal.
+    Devuelve resultados con la misma forma que `SearchSupabaseUseCase`.
+    """
+
+    def __init__(self, lexical_index: LexicalIndexRepository):
+        self.lexical_index = lexical_index
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(
+        self, query: str, k: int = 5, filter_metadata: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        started = time.perf_counter()
+        chunks = self.lexical_index.search(query, k, filter_metadata)
+        self.logger.info(
+            f"✅ Búsqueda léxica: {len(chunks)} documentos en "
+            f"{1000 * (time.perf_counter() - started):.1f} ms"
+        )
+        return [chunk_to_result(rank, chunk) for rank, chunk in enumerate(chunks, 1)]
+
+    def search_by_episode(
+        self, query: str, episode_id: str, k: int = 5
+    ) -> list[dict[str, Any]]:
+        return self.execute(query, k, {"episode_id": episode_id})
+
+    def search_many(
+        self,
+        queries: list[str],
+        k: int = 5,
+        filter_metadata: Optional[dict[str, Any]] = None,
+    ) -> list[list[dict[str, Any]]]:
+        return [self.execute(query, k, filter_metadata) for query in queries]
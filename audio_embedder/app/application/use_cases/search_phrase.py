@@ -0,0 +1,77 @@
+import re
+import time
+from typing import Any, Optional
+
+from ...domain.entities.text_match import TextMatch
+from ...domain.repositories.positional_index_repository import (
+    PositionalIndexRepository,
+)
+from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...shared.logger import get_logger
+
+_NEAR = re.compile(r"^\s*(\S+)\s+NEAR/(\d+)\s+(\S+)\s*$")
+
+
+class SearchPhraseUseCase:
+    """Búsqueda de frases exactas y de proximidad en las transcripciones.
+
+    La consulta es una frase (`rey Sol`, con o sin comillas) o
+    `palabra NEAR/k palabra` (a k palabras o menos, en cualquier orden). Las
+    apariciones salen del índice posicional; el texto de la transcripción
+    sólo se lee para recortar los fragmentos de los resultados devueltos.
+    """
+
+    def __init__(
+        self,
+        positional_index: PositionalIndexRepository,
+        transcription_repository: Optional[TranscriptionRepository] = None,
+        snippet_chars: int = 200,
+    ):
+        self.positional_index = positional_index
+        self.transcription_repository = transcription_repository
+        self.snippet_chars = snippet_chars
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(self, query: str, limit: int = 20) -> list[dict[str, Any]]:
+        started = time.perf_counter()
+        near = _NEAR.match(query)
+        if near:
+            first, distance, second = near.groups()
+            matches = self.positional_index.find_near(first, second, int(distance))
+        else:
+            matches = self.positional_index.find_phrase(query.strip().strip('"'))
+        self.logger.info(
+            f"✅ {len(matches)} apariciones de '{query}' en "
+            f"{1000 * (time.perf_counter() - started):.1f} ms"
+        )
+
+        texts: dict[str, Optional[str]] = {}
+        return [
+            {
+                "rank": rank,
+                "episode_id": match.episode_id,
+                "char_offset": match.char_offset,
+                "estimated_timestamp_minutes": match.estimated_timestamp_minutes,
+                "snippet": self._snippet(match, texts),
+            }
+            for rank, match in enumerate(matches[:limit], 1)
+        ]
+
+    def search_many(
+        self, queries: list[str], limit: int = 20
+    ) -> list[list[dict[str, Any]]]:
+        return [self.execute(query, limit) for query in queries]
+
+    def _snippet(self, match: TextMatch, texts: dict[str, Optional[str]]) -> str:
+        if self.transcription_repository is None:
+            return ""
+        if match.episode_id not in texts:
+            transcription = self.transcription_repository.get_by_episode_id(
+                match.episode_id
+            )
+            texts[match.episode_id] = transcription.text if transcription else None
+        text = texts[match.episode_id]
+        if text is None:
+            return ""
+        start = max(0, match.char_offset - self.snippet_chars // 2)
+        return text[start : start + self.snippet_chars].replace("\n", " ")
@@ -1,39 +1,87 @@
 import os
-from typing import List, Dict, Any
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import SupabaseVectorStore
-from supabase import create_client, Client
+import numpy as np
 
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...domain.repositories.episode_stats_repository import EpisodeStatsRepository
+from ...domain.repositories.lexical_index_repository import LexicalIndexRepository
+from ...shared.episode_aggregation import aggregate_scores
+from ...shared.episode_dates import parse_date
 from ...shared.logger import get_logger
+from ...shared.mmr import mmr_indices
+from ...shared.rank_fusion import reciprocal_rank_fusion
+from ..services.query_embedding_cache import QueryEmbeddingCache
+from .get_episode_summary import GetEpisodeSummaryUseCase
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+
+def chunk_to_result(rank: int, chunk: Embedding) -> Dict[str, Any]:
+    """Resultado de búsqueda (dict) a partir de un chunk"""
+    metadata = chunk.metadata or {}
+    return {
+        "rank": rank,
+        "content": chunk.chunk_text,
+        "metadata": metadata,
+        "similarity_score": metadata.get("similarity_score"),
+        "episode_id": metadata.get("episode_id", "unknown"),
+        "title": metadata.get("title", "unknown"),
+        "chunk_type": metadata.get("chunk_type", "unknown"),
+        "estimated_timestamp_minutes": metadata.get("estimated_timestamp_minutes", 0),
+    }
 
 
 class SearchSupabaseUseCase:
-    """Caso de uso para búsquedas semánticas directas en Supabase"""
+    """Caso de uso para búsquedas semánticas directas en Supabase (o en un
+    almacén local con la misma semántica)"""
+
+    MODEL_NAME = "text-embedding-3-small"
     
-    def __init__(self):
+    def __init__(
+        self,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        embedding_repository: Optional[EmbeddingRepository] = None,
+        embeddings: Optional["Embeddings"] = None,
+        mmr_lambda: Optional[float] = None,
+        mmr_fetch_k: Optional[int] = None,
+        stats_repository: Optional[EpisodeStatsRepository] = None,
+        lexical_index: Optional[LexicalIndexRepository] = None,
+    ):
         self.logger = get_logger(self.__class__.__name__)
+        self.query_cache = query_cache
+        self.stats_repository = stats_repository
+        self.lexical_index = lexical_index
         
-        # Configurar OpenAI Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small",
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        # Re-ranking MMR opcional: se piden mmr_fetch_k candidatos (por defecto
+        # 4*k) y se eligen k diversos. lambda=1 equivale a no diversificar
+        self.mmr_lambda = mmr_lambda
+        self.mmr_fetch_k = mmr_fetch_k
         
-        # Configurar Supabase
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
-        
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL y SUPABASE_KEY deben estar configurados")
+        # Los clientes de OpenAI y Supabase se importan sólo si hacen falta:
+        # son lo más lento del arranque del CLI
+        if embeddings is None:
+            from langchain_openai import OpenAIEmbeddings
+
+            embeddings = OpenAIEmbeddings(
+                model=self.MODEL_NAME,
+                openai_api_key=os.getenv("OPENAI_API_KEY")
+            )
+        self.embeddings = embeddings
         
-        self.supabase_client: Client = create_client(supabase_url, supabase_key)
-        self.vector_store = SupabaseVectorStore(
-            client=self.supabase_client,
-            embedding=self.embeddings,
-            table_name="podcast_embeddings",
-            query_name="match_documents"
-        )
+        # Almacén de vectores: Supabase por defecto (requiere SUPABASE_URL y
+        # SUPABASE_KEY) o cualquier otro con la misma semántica de filtros
+        if embedding_repository is None:
+            from ...infrastructure.repositories.supabase_embedding_repository import (
+                SupabaseEmbeddingRepository,
+            )
+
+            embedding_repository = SupabaseEmbeddingRepository.from_env()
+        self.embedding_repository = embedding_repository
     
     def execute(self, query: str, k: int = 5, filter_metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
@@ -54,37 +102,29 @@ class SearchSupabaseUseCase:
                 self.logger.info(f"📋 Aplicando filtros: {filter_metadata}")
             
             # Realizar búsqueda con filtros opcionales
-            if filter_metadata:
-                docs = self.vector_store.similarity_search(
-                    query=query, 
-                    k=k,
-                    filter=filter_metadata
-                )
-            else:
-                docs = self.vector_store.similarity_search(
-                    query=query, 
-                    k=k
-                )
+            started = time.perf_counter()
+            query_vector = self.embed_query(query)
+            embedded = time.perf_counter()
+            chunks = self.embedding_repository.search_similar(
+                query_vector, top_k=self._fetch_size(k), filter_metadata=filter_metadata
+            )
+            chunks = self._diversify(query_vector, chunks, k)
+            searched = time.perf_counter()
             
-            self.logger.info(f"✅ Búsqueda exitosa, encontrados {len(docs)} documentos")
+            self.logger.info(
+                f"✅ Búsqueda exitosa, encontrados {len(chunks)} documentos "
+                f"(embedding {1000 * (embedded - started):.1f} ms, "
+                f"búsqueda {1000 * (searched - embedded):.1f} ms)"
+            )
             
             results = []
             i = 0
-            for doc in docs:
+            for chunk in chunks:
                 i += 1
-                result = {
-                    "rank": i,
-                    "content": doc.page_content,
-                    "metadata": doc.metadata,
-                    # "similarity_score": float(score),
-                    "episode_id": doc.metadata.get("episode_id", "unknown"),
-                    "title": doc.metadata.get("title", "unknown"),
-                    "chunk_type": doc.metadata.get("chunk_type", "unknown"),
-                    "estimated_timestamp_minutes": doc.metadata.get("estimated_timestamp_minutes", 0),
-                }
+                result = self._to_result(i, chunk)
                 results.append(result)
                 
-                content_preview = doc.page_content[:100] + "..." if len(doc.page_content) > 100 else doc.page_content
+                content_preview = chunk.chunk_text[:100] + "..." if len(chunk.chunk_text) > 100 else chunk.chunk_text
                 self.logger.info(f"  [{i}] | Episodio: {result['episode_id']} | Contenido: {content_preview}")
             
             return results
@@ -96,65 +136,276 @@ class SearchSupabaseUseCase:
             self.logger.error(f"Traceback completo:\n{traceback.format_exc()}")
             return []
     
+    def search_many(self, queries: List[str], k: int = 5, filter_metadata: Dict[str, Any] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Ejecuta varias búsquedas con una sola petición de embeddings y, en los
+        almacenes locales, un único producto matriz-matriz
+        
+        Returns:
+            Una lista de resultados por consulta, en el mismo orden que `queries`
+        """
+        started = time.perf_counter()
+        query_vectors = self.embed_queries(queries)
+        embedded = time.perf_counter()
+        chunks_per_query = self.embedding_repository.search_similar_many(
+            query_vectors, top_k=self._fetch_size(k), filter_metadata=filter_metadata
+        )
+        chunks_per_query = [
+            self._diversify(query_vector, chunks, k)
+            for query_vector, chunks in zip(query_vectors, chunks_per_query)
+        ]
+        searched = time.perf_counter()
+        
+        self.logger.info(
+            f"✅ {len(queries)} búsquedas completadas "
+            f"(embedding {1000 * (embedded - started):.1f} ms, "
+            f"búsqueda {1000 * (searched - embedded):.1f} ms)"
+        )
+        return [
+            [self._to_result(rank, chunk) for rank, chunk in enumerate(chunks, 1)]
+            for chunks in chunks_per_query
+        ]
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embedding de la consulta, usando la caché si está configurada"""
+        if self.query_cache:
+            return self.query_cache.get_or_compute(query, self.embeddings.embed_query)
+        return self.embeddings.embed_query(query)
+    
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embeddings de varias consultas en una sola petición"""
+        if self.query_cache:
+            return self.query_cache.get_or_compute_many(
+                queries, self.embeddings.embed_documents
+            )
+        return self.embeddings.embed_documents(queries)
+    
+    def _fetch_size(self, k: int) -> int:
+        if self.mmr_lambda is None:
+            return k
+        return max(k, self.mmr_fetch_k or 4 * k)
+    
+    def _diversify(self, query_vector: List[float], chunks: List[Embedding], k: int) -> List[Embedding]:
+        """Re-ordena los candidatos con MMR y se queda con k"""
+        if self.mmr_lambda is None or len(chunks) <= 1 or not query_vector:
+            return chunks[:k]
+        
+        vectors = self._candidate_vectors(chunks)
+        if vectors is None:
+            return chunks[:k]
+        
+        started = time.perf_counter()
+        order = mmr_indices(
+            np.asarray(query_vector, dtype=np.float32), vectors, k, self.mmr_lambda
+        )
+        self.logger.debug(
+            f"MMR sobre {len(chunks)} candidatos: "
+            f"{1e6 * (time.perf_counter() - started):.0f} µs"
+        )
+        return [chunks[i] for i in order]
+    
+    def _candidate_vectors(self, chunks: List[Embedding]) -> Optional[np.ndarray]:
+        """Vectores de los candidatos; los pide al almacén si la búsqueda no
+        los devolvió (p. ej. `match_documents` en Supabase)"""
+        if all(chunk.vector for chunk in chunks):
+            return np.asarray([chunk.vector for chunk in chunks], dtype=np.float32)
+        
+        ids = [(chunk.metadata or {}).get("chunk_id") for chunk in chunks]
+        try:
+            vectors = self.embedding_repository.get_vectors([i for i in ids if i])
+        except NotImplementedError as e:
+            self.logger.warning(f"⚠️ MMR desactivado: {e}")
+            return None
+        if not all(i in vectors for i in ids):
+            self.logger.warning("⚠️ MMR desactivado: faltan vectores de candidatos")
+            return None
+        return np.asarray([vectors[i] for i in ids], dtype=np.float32)
+    
+    def _to_result(self, rank: int, chunk: Embedding) -> Dict[str, Any]:
+        return chunk_to_result(rank, chunk)
+    
+    def search_hybrid(
+        self,
+        query: str,
+        k: int = 5,
+        filter_metadata: Dict[str, Any] = None,
+        fetch_k: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Búsqueda híbrida: BM25 del índice léxico + similitud de vectores
+        
+        Pide `fetch_k` candidatos (por defecto 4*k) a cada búsqueda y los
+        fusiona por Reciprocal Rank Fusion, que sólo usa las posiciones. Los
+        chunks se emparejan por su id determinista; el score fusionado queda
+        en `metadata["rrf_score"]`.
+        """
+        if self.lexical_index is None:
+            raise ValueError("Hybrid search requires a lexical index")
+        
+        fetch_k = fetch_k or 4 * k
+        started = time.perf_counter()
+        lexical_chunks = self.lexical_index.search(query, fetch_k, filter_metadata)
+        searched_lexical = time.perf_counter()
+        if query_vector is None:
+            query_vector = self.embed_query(query)
+        vector_chunks = self.embedding_repository.search_similar(
+            query_vector, top_k=fetch_k, filter_metadata=filter_metadata
+        )
+        searched = time.perf_counter()
+        
+        chunks: Dict[Any, Embedding] = {}
+        rankings = []
+        for ranking in (vector_chunks, lexical_chunks):
+            keys = []
+            for chunk in ranking:
+                key = _chunk_key(chunk)
+                if key in chunks:
+                    # Mismo chunk en las dos búsquedas: se conservan ambos scores
+                    chunk = replace(
+                        chunk,
+                        metadata={**(chunk.metadata or {}), **chunks[key].metadata},
+                    )
+                chunks[key] = chunk
+                keys.append(key)
+            rankings.append(keys)
+        
+        fused = reciprocal_rank_fusion(rankings)[:k]
+        self.logger.info(
+            f"✅ Búsqueda híbrida: {len(vector_chunks)} vectoriales + "
+            f"{len(lexical_chunks)} léxicos -> {len(fused)} "
+            f"(léxica {1000 * (searched_lexical - started):.1f} ms, "
+            f"vectorial {1000 * (searched - searched_lexical):.1f} ms)"
+        )
+        return [
+            self._to_result(
+                rank,
+                replace(
+                    chunks[key],
+                    metadata={**(chunks[key].metadata or {}), "rrf_score": score},
+                ),
+            )
+            for rank, (key, score) in enumerate(fused, 1)
+        ]
+    
+    def search_hybrid_many(
+        self, queries: List[str], k: int = 5, filter_metadata: Dict[str, Any] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Búsquedas híbridas de varias consultas con una sola petición de
+        embeddings"""
+        query_vectors = self.embed_queries(queries)
+        return [
+            self.search_hybrid(query, k, filter_metadata, query_vector=query_vector)
+            for query, query_vector in zip(queries, query_vectors)
+        ]
+    
     def search_by_episode(self, query: str, episode_id: str, k: int = 5) -> List[Dict[str, Any]]:
         """Busca solo dentro de un episodio específico"""
         filter_metadata = {"episode_id": episode_id}
         return self.execute(query, k, filter_metadata)
     
-    def search_by_date_range(self, query: str, start_date: str, end_date: str, k: int = 5) -> List[Dict[str, Any]]:
+    def search_episodes(
+        self,
+        query: str,
+        k: int = 5,
+        aggregation: str = "max",
+        fetch_k: Optional[int] = None,
+        snippets: int = 3,
+        filter_metadata: Dict[str, Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca episodios en lugar de chunks
+        
+        Pide `fetch_k` chunks (por defecto 10*k), agrega sus scores por
+        episodio (`max`, `softmax-sum` o `top-n-mean`) y devuelve los k mejores
+        episodios con sus mejores fragmentos y timestamps.
+        """
+        query_vector = self.embed_query(query)
+        chunks = self.embedding_repository.search_similar(
+            query_vector, top_k=fetch_k or 10 * k, filter_metadata=filter_metadata
+        )
+        chunks = [
+            chunk for chunk in chunks
+            if (chunk.metadata or {}).get("similarity_score") is not None
+        ]
+        if not chunks:
+            return []
+        
+        episode_ids = [chunk.episode_id for chunk in chunks]
+        episodes, scores = aggregate_scores(
+            episode_ids,
+            np.asarray([chunk.metadata["similarity_score"] for chunk in chunks]),
+            method=aggregation,
+        )
+        
+        # Los chunks llegan ordenados por similitud: los primeros de cada
+        # episodio son sus mejores fragmentos
+        by_episode: Dict[str, List[Embedding]] = {}
+        for chunk in chunks:
+            by_episode.setdefault(chunk.episode_id, []).append(chunk)
+        
+        results = []
+        for rank, (episode_id, score) in enumerate(zip(episodes[:k], scores[:k]), 1):
+            episode_chunks = by_episode[str(episode_id)]
+            results.append({
+                "rank": rank,
+                "episode_id": str(episode_id),
+                "title": (episode_chunks[0].metadata or {}).get("title", "unknown"),
+                "score": float(score),
+                "matched_chunks": len(episode_chunks),
+                "snippets": [
+                    self._to_result(i, chunk)
+                    for i, chunk in enumerate(episode_chunks[:snippets], 1)
+                ],
+            })
+        
+        self.logger.info(
+            f"✅ {len(results)} episodios de {len(chunks)} chunks "
+            f"(agregación {aggregation})"
+        )
+        return results
+    
+    def search_by_date_range(self, query: str, start_date: str, end_date: str, k: int = 5, filter_metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Busca en un rango de fechas específico
         
+        El rango se aplica en el almacén antes de puntuar los vectores (índice
+        por fecha de publicación), no filtrando los resultados después.
+        
         Args:
             query: Consulta de búsqueda
-            start_date: Fecha inicio en formato YYYYMMDD
-            end_date: Fecha fin en formato YYYYMMDD
+            start_date: Fecha inicio en formato YYYYMMDD o YYYY-MM-DD
+            end_date: Fecha fin en formato YYYYMMDD o YYYY-MM-DD (incluida)
             k: Número de resultados
         """
-        # Nota: Esta funcionalidad requeriría lógica adicional en Supabase
-        # Por ahora, implementamos una búsqueda básica
-        self.logger.warning("Búsqueda por rango de fechas no implementada completamente, usando búsqueda general")
-        return self.execute(query, k)
-    
-    def get_episode_summary(self, episode_id: str) -> Dict[str, Any]:
-        """Obtiene un resumen de chunks disponibles para un episodio"""
         try:
-            # Búsqueda general para obtener todos los chunks del episodio
-            results = self.search_by_episode("", episode_id, k=100)  # Buscar muchos chunks
-            
-            if not results:
-                return {"episode_id": episode_id, "chunks_count": 0, "error": "No chunks found"}
-            
-            # Calcular estadísticas
-            chunk_types = {}
-            total_words = 0
-            timestamps = []
-            
-            for result in results:
-                chunk_type = result.get("chunk_type", "unknown")
-                chunk_types[chunk_type] = chunk_types.get(chunk_type, 0) + 1
-                
-                metadata = result.get("metadata", {})
-                word_count = metadata.get("word_count", 0)
-                total_words += word_count
-                
-                timestamp = metadata.get("estimated_timestamp_minutes", 0)
-                if timestamp:
-                    timestamps.append(timestamp)
-            
-            summary = {
-                "episode_id": episode_id,
-                "title": results[0].get("title", "unknown"),
-                "chunks_count": len(results),
-                "chunk_types": chunk_types,
-                "total_words": total_words,
-                "duration_minutes": max(timestamps) if timestamps else 0,
-                "avg_chunk_words": total_words / len(results) if results else 0
-            }
-            
-            self.logger.info(f"📊 Resumen del episodio {episode_id}: {summary['chunks_count']} chunks, {summary['total_words']} palabras")
-            return summary
-            
+            start, end = parse_date(start_date), parse_date(end_date)
+            self.logger.info(f"🔍 Buscando '{query}' entre {start} y {end} con k={k}")
+            query_vector = self.embed_query(query)
+            chunks = self.embedding_repository.search_similar_in_date_range(
+                query_vector, start, end, top_k=self._fetch_size(k), filter_metadata=filter_metadata
+            )
+            chunks = self._diversify(query_vector, chunks, k)
+            self.logger.info(f"✅ Búsqueda exitosa, encontrados {len(chunks)} documentos")
+            return [self._to_result(rank, chunk) for rank, chunk in enumerate(chunks, 1)]
         except Exception as e:
-            self.logger.error(f"Error obteniendo resumen del episodio {episode_id}: {str(e)}")
-            return {"episode_id": episode_id, "error": str(e)}
\ No newline at end of file
+            self.logger.error(f"❌ Error en búsqueda por fechas: {str(e)}")
+            return []
+    
+    def get_episode_summary(self, episode_id: str) -> Dict[str, Any]:
+        """Resumen de los chunks de un episodio, leído de las estadísticas
+        guardadas al ingerir"""
+        if self.stats_repository:
+            summary = GetEpisodeSummaryUseCase(self.stats_repository).execute(episode_id)
+            if summary:
+                return summary
+        self.logger.warning(
+            f"⚠️ Sin estadísticas guardadas para {episode_id} "
+            "(ejecuta --command backfill-stats)"
+        )
+        return GetEpisodeSummaryUseCase.missing_stats(episode_id)
+
+
+def _chunk_key(chunk: Embedding) -> Any:
+    metadata = chunk.metadata or {}
+    return metadata.get("chunk_id") or (chunk.episode_id, chunk.chunk_index)
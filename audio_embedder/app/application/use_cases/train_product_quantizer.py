@@ -0,0 +1,102 @@
+from typing import Any
+
+import numpy as np
+
+from ...domain.repositories.quantizable_embedding_repository import (
+    QuantizableEmbeddingRepository,
+)
+from ...shared.logger import get_logger
+from ...shared.product_quantizer import ProductQuantizer, top_k_indices
+
+
+class TrainProductQuantizerUseCase:
+    """Entrena codebooks PQ a partir de los vectores del almacén local y
+    mide el ratio de compresión frente al recall"""
+
+    def __init__(self, embedding_repository: QuantizableEmbeddingRepository):
+        self.embedding_repository = embedding_repository
+        self.logger = get_logger(self.__class__.__name__)
+
+    def execute(
+        self,
+        n_subvectors: int = 32,
+        n_iter: int = 20,
+        sample_size: int = 65536,
+        seed: int = 0,
+    ) -> ProductQuantizer:
+        total = self.embedding_repository.count()
+        if total == 0:
+            raise ValueError("No hay vectores en el almacén local para entrenar PQ")
+
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(total, min(sample_size, total), replace=False))
+        training_vectors = self.embedding_repository.get_normalized_vectors(sample)
+
+        self.logger.info(
+            f"Training PQ codebooks: {n_subvectors} sub-vectors on {len(sample)}/{total} vectors"
+        )
+        quantizer = ProductQuantizer.train(
+            training_vectors,
+            n_subvectors=n_subvectors,
+            n_iter=n_iter,
+            sample_size=None,
+            seed=seed,
+        )
+        self.embedding_repository.save_quantizer(quantizer)
+        return quantizer
+
+    def evaluate(
+        self,
+        n_queries: int = 100,
+        top_k: int = 10,
+        rerank_candidates: int = 100,
+        seed: int = 1,
+    ) -> dict[str, Any]:
+        """Compara PQ (con y sin re-ranking) contra la búsqueda exacta"""
+        quantizer = self.embedding_repository.get_quantizer()
+        if quantizer is None:
+            raise ValueError("No hay codebooks PQ entrenados")
+
+        total = self.embedding_repository.count()
+        rng = np.random.default_rng(seed)
+        query_rows = np.sort(rng.choice(total, min(n_queries, total), replace=False))
+        queries = self.embedding_repository.get_normalized_vectors(query_rows)
+        codes = self.embedding_repository.get_codes()
+
+        recall_pq = 0.0
+        recall_rerank = 0.0
+        for query in queries:
+            exact_indices, _ = self.embedding_repository.exact_search(query, top_k)
+            expected = set(exact_indices.tolist())
+
+            candidates, _ = quantizer.search(
+                query, codes, max(top_k, rerank_candidates)
+            )
+            recall_pq += len(expected & set(candidates[:top_k].tolist())) / len(
+                expected
+            )
+
+            order = np.sort(candidates)
+            exact = self.embedding_repository.get_normalized_vectors(order) @ query
+            reranked = order[top_k_indices(exact, top_k)]
+            recall_rerank += len(expected & set(reranked.tolist())) / len(expected)
+
+        report = {
+            "vectors": total,
+            "dimension": quantizer.dimension,
+            "code_size_bytes": quantizer.code_size,
+            "compression_ratio": quantizer.compression_ratio(),
+            "codes_memory_mb": total * quantizer.code_size / 1e6,
+            "float32_memory_mb": total * quantizer.dimension * 4 / 1e6,
+            "top_k": top_k,
+            "rerank_candidates": rerank_candidates,
+            f"recall@{top_k}": recall_pq / len(queries),
+            f"recall@{top_k}_rerank": recall_rerank / len(queries),
+        }
+
+        self.logger.info(
+            f"📦 PQ {quantizer.code_size} bytes/vector (x{report['compression_ratio']:.0f}) | "
+            f"recall@{top_k}: {report[f'recall@{top_k}']:.3f} | "
+            f"recall@{top_k} con re-ranking ({rerank_candidates}): {report[f'recall@{top_k}_rerank']:.3f}"
+        )
+        return report
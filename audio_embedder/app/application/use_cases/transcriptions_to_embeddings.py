@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from collections.abc import Iterable
 from typing import List, Dict, Any
 
 from ...domain.repositories.embedding_repository import EmbeddingRepository
@@ -61,55 +62,91 @@ class TranscriptionsToEmbeddingsUseCase:
             self.logger.error(f"Error processing transcription {transcription.episode_id}: {str(e)}")
             return []
 
-    def execute(self, dry_run: bool = False) -> None:
-        transcriptions = self.transcription_repository.get_all()
-        
-        if not transcriptions:
+    def process_batched(self, transcriptions: Iterable) -> None:
+        """Procesa todas las transcripciones juntas: el servicio empaqueta chunks
+        de varios episodios en cada petición de embeddings. Las transcripciones
+        se consumen a medida que el servicio las trocea"""
+        episode_ids = []
+
+        def track(transcriptions):
+            for transcription in transcriptions:
+                episode_ids.append(transcription.episode_id)
+                yield transcription
+
+        results = self.embedding_service.create_embeddings_batch(track(transcriptions))
+
+        total_transcriptions = len(episode_ids)
+        if not total_transcriptions:
             self.logger.warning("No transcriptions found to process")
-            return
+        for i, episode_id in enumerate(episode_ids, 1):
+            if results.get(episode_id):
+                self.logger.info(
+                    f"[{i}/{total_transcriptions}] {episode_id}: "
+                    f"{len(results[episode_id])} embeddings saved to Supabase"
+                )
+            else:
+                self.logger.warning(
+                    f"[{i}/{total_transcriptions}] {episode_id}: Failed to create embeddings"
+                )
+
+    def execute(self, dry_run: bool = False) -> None:
+        # Handles sin texto: cada transcripción se lee cuando le toca, así que
+        # sólo hay una en memoria y el primer episodio empieza sin esperar al resto
+        handles = self.transcription_repository.iter_handles()
 
         if dry_run:
             import random
+            handles = list(handles)
+            if not handles:
+                self.logger.warning("No transcriptions found to process")
+                return
             self.logger.info("🧪 DRY RUN MODE: Processing a random transcription")
-            transcriptions = [random.choice(transcriptions)]
+            handles = [random.choice(handles)]
 
-        total_transcriptions = len(transcriptions)
-        self.logger.info(
-            f"Processing embeddings for {total_transcriptions} transcription{'s' if total_transcriptions != 1 else ''}"
-        )
+        if self.use_supabase and not dry_run:
+            self.process_batched(handle.load() for handle in handles)
+            self.logger.info("✅ Transcriptions to embeddings processing completed")
+            return
 
-        for i, transcription in enumerate(transcriptions, 1):
-            self.logger.info(f"[{i}/{total_transcriptions}] Processing: {transcription.episode_id}")
+        processed = 0
+        for i, handle in enumerate(handles, 1):
+            processed = i
+            self.logger.info(
+                f"[{i}] Processing: {handle.episode_id} ({handle.size} chars)"
+            )
 
             # Skip if embeddings already exist (only for non-Supabase services)
             if not self.use_supabase:
                 existing_embeddings = self.embedding_repository.get_by_episode_id(
-                    transcription.episode_id
+                    handle.episode_id
                 )
 
                 if existing_embeddings:
                     self.logger.info(
-                        f"[{i}/{total_transcriptions}] Skipping - embeddings already exist"
+                        f"[{i}] Skipping - embeddings already exist"
                     )
                     continue
 
             # Process with semantic chunking
+            transcription = handle.load()
             embeddings = self.process_with_semantic_chunking(transcription, dry_run)
             
             if not embeddings and not dry_run:
                 self.logger.warning(
-                    f"[{i}/{total_transcriptions}] Failed to create embeddings"
+                    f"[{i}] Failed to create embeddings"
                 )
                 continue
 
             # Save to local repository only if not using Supabase
             if not self.use_supabase and embeddings and not dry_run:
                 self.embedding_repository.save_batch(embeddings)
-                self.logger.info(f"[{i}/{total_transcriptions}] Embeddings created and saved to local repository")
+                self.logger.info(f"[{i}] Embeddings created and saved to local repository")
             elif not dry_run:
-                self.logger.info(f"[{i}/{total_transcriptions}] Embeddings created and saved to Supabase")
+                self.logger.info(f"[{i}] Embeddings created and saved to Supabase")
 
-        if dry_run:
+        if not processed:
+            self.logger.warning("No transcriptions found to process")
+        elif dry_run:
             self.logger.info("🧪 DRY RUN completed - no embeddings were saved")
         else:
             self.logger.info("✅ Transcriptions to embeddings processing completed")
\ No newline at end of file
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from .episode import Episode
+
+
+@dataclass(frozen=True)
+class EpisodeEvent:
+    """Evento publicado por el crawler (p. ej. `episode_downloaded`)"""
+
+    seq: int
+    type: str
+    episode: Episode
+    attempts: int = 0
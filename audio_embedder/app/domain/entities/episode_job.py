@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .episode import Episode
+
+
+@dataclass(frozen=True)
+class EpisodeJob:
+    """Episodio reservado por un worker hasta `lease_expires_at` (epoch).
+    `previous_worker_id` es el worker que lo tenía si su lease caducó"""
+
+    episode: Episode
+    worker_id: str
+    lease_expires_at: float
+    attempts: int
+    previous_worker_id: Optional[str] = None
@@ -0,0 +1,41 @@
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class EpisodeStats:
+    episode_id: str
+    title: str
+    chunks_count: int
+    total_words: int
+    duration_minutes: float
+    chunk_types: dict[str, int] = field(default_factory=dict)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def avg_chunk_words(self) -> float:
+        return self.total_words / self.chunks_count if self.chunks_count else 0
+
+    @classmethod
+    def from_chunk_metadata(
+        cls, episode_id: str, chunks_metadata: Iterable[dict]
+    ) -> "EpisodeStats":
+        """Estadísticas de un episodio a partir de los metadatos de sus chunks"""
+        chunks_metadata = list(chunks_metadata)
+        return cls(
+            episode_id=episode_id,
+            title=next(
+                (m["title"] for m in chunks_metadata if m.get("title")), episode_id
+            ),
+            chunks_count=len(chunks_metadata),
+            total_words=sum(m.get("word_count", 0) for m in chunks_metadata),
+            duration_minutes=max(
+                (m.get("estimated_timestamp_minutes", 0) for m in chunks_metadata),
+                default=0,
+            ),
+            chunk_types=dict(
+                Counter(m.get("chunk_type", "unknown") for m in chunks_metadata)
+            ),
+        )
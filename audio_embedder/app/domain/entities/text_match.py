@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TextMatch:
+    episode_id: str
+    char_offset: int
+    estimated_timestamp_minutes: float
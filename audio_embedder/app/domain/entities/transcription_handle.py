@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from .transcription import Transcription
+
+
+@dataclass(frozen=True)
+class TranscriptionHandle:
+    """Transcripción sin su texto: `text` se lee del almacén en cada acceso,
+    así que recorrer todas las handles sólo mantiene en memoria el texto que
+    se está procesando. `size` es la longitud del texto en caracteres."""
+
+    episode_id: str
+    size: int
+    duration: int
+    language: str
+    created_at: datetime
+    file_path: Optional[str]
+    load_text: Callable[[], str] = field(repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        return self.load_text()
+
+    def load(self) -> Transcription:
+        return Transcription(
+            episode_id=self.episode_id,
+            text=self.text,
+            language=self.language,
+            created_at=self.created_at,
+            duration=self.duration,
+            file_path=self.file_path,
+        )
+
+    @classmethod
+    def from_transcription(cls, transcription: Transcription) -> "TranscriptionHandle":
+        return cls(
+            episode_id=transcription.episode_id,
+            size=len(transcription.text),
+            duration=transcription.duration,
+            language=transcription.language,
+            created_at=transcription.created_at,
+            file_path=transcription.file_path,
+            load_text=lambda: transcription.text,
+        )
@@ -0,0 +1,35 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+
+from ..entities.transcription import Transcription
+from .transcription_repository import TranscriptionRepository
+
+
+class CompressibleTranscriptionRepository(TranscriptionRepository):
+    """Repositorio de transcripciones que se guardan comprimidas en disco"""
+
+    @property
+    @abstractmethod
+    def compression(self) -> str:
+        """Formato con el que se escriben las transcripciones"""
+        pass
+
+    @abstractmethod
+    def has_dictionary(self) -> bool:
+        """Si ya hay un diccionario zstd entrenado"""
+        pass
+
+    @abstractmethod
+    def train_dictionary(self, transcriptions: Iterable[Transcription]) -> int:
+        """Entrena y guarda el diccionario zstd. Devuelve su tamaño en bytes"""
+        pass
+
+    @abstractmethod
+    def rewrite(self, transcription: Transcription) -> None:
+        """Vuelve a guardar la transcripción con la compresión actual"""
+        pass
+
+    @abstractmethod
+    def disk_usage(self) -> int:
+        """Bytes que ocupan las transcripciones en disco"""
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class EmbeddingCacheRepository(ABC):
+    @abstractmethod
+    def get_many(
+        self, model_name: str, text_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        pass
+
+    @abstractmethod
+    def save_many(self, model_name: str, vectors: dict[str, list[float]]) -> None:
+        pass
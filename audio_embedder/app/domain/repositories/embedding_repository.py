@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from ..entities.embedding import Embedding
 
@@ -18,6 +19,50 @@ class EmbeddingRepository(ABC):
 
     @abstractmethod
     def search_similar(
-        self, query_vector: list[float], top_k: int = 10
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
     ) -> list[Embedding]:
         pass
+
+    def search_similar_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[list[Embedding]]:
+        return [
+            self.search_similar(query_vector, top_k, filter_metadata)
+            for query_vector in query_vectors
+        ]
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        """Como `search_similar` pero sólo entre episodios publicados entre
+        `start_date` y `end_date` (enteros YYYYMMDD, ambos incluidos)"""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support date-range search"
+        )
+
+    def get_chunk_ids(self, episode_id: str) -> set[str]:
+        return {
+            (embedding.metadata or {}).get("chunk_id")
+            for embedding in self.get_by_episode_id(episode_id)
+        } - {None}
+
+    def get_vectors(self, chunk_ids: list[str]) -> dict[str, list[float]]:
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support fetching vectors by chunk id"
+        )
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support deleting chunks"
+        )
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from ..entities.episode import Episode
+from ..entities.episode_event import EpisodeEvent
+
+
+class EpisodeEventRepository(ABC):
+    @abstractmethod
+    def publish_downloaded(self, episode: Episode) -> None:
+        pass
+
+    @abstractmethod
+    def pending(self, limit: int = 10, after_seq: int = 0) -> list[EpisodeEvent]:
+        """Eventos sin consumir posteriores a `after_seq`, del más antiguo al
+        más reciente"""
+        pass
+
+    @abstractmethod
+    def ack(self, seq: int) -> None:
+        pass
+
+    @abstractmethod
+    def fail(self, seq: int, error: str) -> None:
+        pass
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Optional
+
+from ..entities.episode import Episode
+from ..entities.episode_job import EpisodeJob
+
+
+class EpisodeJobQueue(ABC):
+    @abstractmethod
+    def enqueue(self, episodes: Iterable[Episode]) -> int:
+        """Añade los episodios que aún no están en la cola. Devuelve cuántos"""
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[EpisodeJob]:
+        """Reserva el siguiente episodio pendiente o con el lease caducado"""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, episode_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Renueva el lease. False si el worker ya no lo tiene"""
+        pass
+
+    @abstractmethod
+    def complete(self, episode_id: str, worker_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def fail(self, episode_id: str, worker_id: str, error: str) -> None:
+        pass
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """Trabajos por estado (pending, leased, done, failed)"""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Optional
 
 from ..entities.episode import Episode
@@ -16,3 +17,33 @@ class EpisodeRepository(ABC):
     @abstractmethod
     def save(self, episode: Episode) -> Episode:
         pass
+
+    def save_many(self, episodes: Iterable[Episode]) -> int:
+        """Guarda varios episodios y devuelve cuántos eran nuevos o cambiaron"""
+        count = 0
+        for episode in episodes:
+            self.save(episode)
+            count += 1
+        return count
+
+    def get_by_url(self, url: str) -> Optional[Episode]:
+        for episode in self.get_all():
+            if episode.url == url:
+                return episode
+        return None
+
+    def get_published_between(self, start_date: int, end_date: int) -> list[Episode]:
+        """Episodios publicados entre dos fechas YYYYMMDD (ambas incluidas),
+        del más antiguo al más reciente"""
+        episodes = [
+            episode
+            for episode in self.get_all()
+            if start_date <= publish_date(episode) <= end_date
+        ]
+        return sorted(episodes, key=lambda episode: episode.published_date)
+
+
+def publish_date(episode: Episode) -> int:
+    """Fecha de publicación como entero YYYYMMDD, como en `episode_dates`"""
+    published = episode.published_date
+    return published.year * 10000 + published.month * 100 + published.day
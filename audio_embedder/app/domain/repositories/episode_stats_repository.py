@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.episode_stats import EpisodeStats
+
+
+class EpisodeStatsRepository(ABC):
+    @abstractmethod
+    def get(self, episode_id: str) -> Optional[EpisodeStats]:
+        pass
+
+    @abstractmethod
+    def save(self, stats: EpisodeStats) -> EpisodeStats:
+        pass
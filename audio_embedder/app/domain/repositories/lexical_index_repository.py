@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.embedding import Embedding
+
+
+class LexicalIndexRepository(ABC):
+    @abstractmethod
+    def rebuild(self, chunks: list[Embedding]) -> int:
+        """Reemplaza el índice por uno con estos chunks; devuelve cuántos hay"""
+        pass
+
+    @abstractmethod
+    def search(
+        self, query: str, top_k: int = 10, filter_metadata: Optional[dict] = None
+    ) -> list[Embedding]:
+        """Chunks que contienen los términos de la consulta, por score BM25
+        (en `metadata["bm25_score"]`)"""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from ..entities.text_match import TextMatch
+from ..entities.transcription import Transcription
+
+
+class PositionalIndexRepository(ABC):
+    @abstractmethod
+    def rebuild(self, transcriptions: Iterable[Transcription]) -> int:
+        """Reemplaza el índice por uno con estas transcripciones"""
+        pass
+
+    @abstractmethod
+    def find_phrase(self, phrase: str) -> list[TextMatch]:
+        pass
+
+    @abstractmethod
+    def find_near(self, first: str, second: str, distance: int) -> list[TextMatch]:
+        pass
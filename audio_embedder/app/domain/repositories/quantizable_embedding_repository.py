@@ -0,0 +1,43 @@
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from .embedding_repository import EmbeddingRepository
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ...shared.product_quantizer import ProductQuantizer
+
+
+class QuantizableEmbeddingRepository(EmbeddingRepository):
+    """Almacén de embeddings cuyos vectores se pueden comprimir con product
+    quantization. Las filas se identifican por su posición en el almacén."""
+
+    @abstractmethod
+    def count(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_normalized_vectors(self, indices: "np.ndarray") -> "np.ndarray":
+        """Vectores de esas filas con norma 1"""
+        pass
+
+    @abstractmethod
+    def get_quantizer(self) -> Optional["ProductQuantizer"]:
+        pass
+
+    @abstractmethod
+    def save_quantizer(self, quantizer: "ProductQuantizer") -> None:
+        """Guarda los codebooks y codifica con ellos todos los vectores"""
+        pass
+
+    @abstractmethod
+    def get_codes(self) -> "np.ndarray":
+        pass
+
+    @abstractmethod
+    def exact_search(
+        self, query: "np.ndarray", top_k: int
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        """(filas, scores) de los `top_k` vectores más similares, sin PQ"""
+        pass
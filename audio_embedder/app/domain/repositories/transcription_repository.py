@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Optional
 
 from ..entities.transcription import Transcription
+from ..entities.transcription_handle import TranscriptionHandle
 
 
 class TranscriptionRepository(ABC):
@@ -16,3 +18,16 @@ class TranscriptionRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[Transcription]:
         pass
+
+    def exists(self, episode_id: str) -> bool:
+        return self.get_by_episode_id(episode_id) is not None
+
+    def iter_all(self) -> Iterator[Transcription]:
+        """Recorre las transcripciones sin tenerlas todas en memoria a la vez"""
+        return iter(self.get_all())
+
+    def iter_handles(self) -> Iterator[TranscriptionHandle]:
+        """Recorre las transcripciones como handles que leen el texto sólo
+        cuando se accede a él"""
+        for transcription in self.iter_all():
+            yield TranscriptionHandle.from_transcription(transcription)
@@ -1,51 +1,80 @@
 import os
 import json
+import time
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import SupabaseVectorStore
-from supabase import create_client, Client
 
 from ...application.services.embedding_service import EmbeddingService
+from ...application.services.query_embedding_cache import QueryEmbeddingCache
 from ...domain.entities.embedding import Embedding
+from ...domain.entities.episode_stats import EpisodeStats
 from ...domain.entities.transcription import Transcription
+from ...domain.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...domain.repositories.episode_stats_repository import EpisodeStatsRepository
+from ..repositories.mirrored_embedding_repository import MirroredEmbeddingRepository
+from ..repositories.supabase_embedding_repository import (
+    SupabaseEmbeddingRepository,
+)
+from ...shared.embedding_batcher import EmbeddingBatcher
+from ...shared.embedding_pipeline import EmbeddingPipeline
+from ...shared.hashing import chunk_id, sha256_text
 from ...shared.semantic_chunker import SemanticChunker
 from ...shared.logger import get_logger
 
 
 class SupabaseEmbeddingService(EmbeddingService):
-    def __init__(self):
+    MODEL_NAME = "text-embedding-3-small"
+
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCacheRepository] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        batcher: Optional[EmbeddingBatcher] = None,
+        embedding_repository: Optional[EmbeddingRepository] = None,
+        local_mirror: Optional[EmbeddingRepository] = None,
+        embed_workers: int = 2,
+        queue_size: int = 4,
+        embeddings: Optional[Embeddings] = None,
+        stats_repository: Optional[EpisodeStatsRepository] = None,
+    ):
         self.logger = get_logger(self.__class__.__name__)
+        self.embedding_cache = embedding_cache
+        self.stats_repository = stats_repository
+        self.query_cache = query_cache
+        self.batcher = batcher or EmbeddingBatcher()
+        self.embed_workers = embed_workers
+        self.queue_size = queue_size
         
-        # Configurar OpenAI Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model="text-embedding-3-small",
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+        # Configurar OpenAI Embeddings (un lote del batcher = una petición)
+        self.embeddings = embeddings or OpenAIEmbeddings(
+            model=self.MODEL_NAME,
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            chunk_size=self.batcher.max_inputs,
         )
         
-        # Configurar Supabase
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
-        
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL y SUPABASE_KEY deben estar configurados")
-        
-        self.supabase_client: Client = create_client(supabase_url, supabase_key)
-        self.vector_store = SupabaseVectorStore(
-            client=self.supabase_client,
-            embedding=self.embeddings,
-            table_name="podcast_embeddings",
-            query_name="match_documents"
+        # Los vectores se calculan aquí y se insertan ya hechos por separado,
+        # por defecto en Supabase (requiere SUPABASE_URL y SUPABASE_KEY)
+        self.embedding_repository = (
+            embedding_repository or SupabaseEmbeddingRepository.from_env()
         )
+        if local_mirror:
+            # Copia local de cada vector que se paga, escrita tras el upsert remoto
+            self.embedding_repository = MirroredEmbeddingRepository(
+                self.embedding_repository, local_mirror
+            )
         self.chunker = SemanticChunker()
     
     def extract_episode_metadata(self, transcription: Transcription) -> Dict[str, Any]:
         """Extrae metadatos del episodio desde la transcripción"""
         return {
             "episode_id": transcription.episode_id,
-            "title": transcription.title or transcription.episode_id,
+            "title": getattr(transcription, "title", None) or transcription.episode_id,
             "duration": transcription.duration or 0,
             "language": transcription.language or "es",
             "file_path": transcription.file_path or "",
@@ -53,83 +82,232 @@ class SupabaseEmbeddingService(EmbeddingService):
     
     def create_embeddings(self, transcription: Transcription) -> list[Embedding]:
         """Crea embeddings usando chunking semántico y los guarda en Supabase"""
-        try:
-            episode_metadata = self.extract_episode_metadata(transcription)
-            chunks = self.chunker.chunk_transcript(transcription.text, episode_metadata)
-            
+        return self.create_embeddings_batch([transcription]).get(
+            transcription.episode_id, []
+        )
+
+    def create_embeddings_batch(
+        self, transcriptions: Iterable[Transcription]
+    ) -> Dict[str, List[Embedding]]:
+        """Crea embeddings de varias transcripciones empaquetando sus chunks en
+        peticiones limitadas por tokens, y los guarda en Supabase.
+
+        El cálculo de vectores y la inserción corren en etapas separadas, de
+        modo que mientras se escribe un lote ya se están pidiendo los siguientes.
+        Sólo se envían los chunks cuyo id determinista no está ya guardado.
+        """
+        started = time.perf_counter()
+        results: Dict[str, List[Embedding]] = {}
+        chunk_stream = self._iter_chunks(transcriptions, results)
+        pipeline = EmbeddingPipeline(
+            embed=self._embed_batch,
+            write=self._write_batch,
+            queue_size=self.queue_size,
+            embed_workers=self.embed_workers,
+        )
+
+        written_chunks = 0
+
+        def on_written(written: List[Embedding]) -> None:
+            nonlocal written_chunks
+            written_chunks += len(written)
+            for embedding in written:
+                # Vector vacío: está en Supabase (y en el espejo local si lo
+                # hay), así que no se guarda en memoria hasta el final
+                results[embedding.episode_id].append(replace(embedding, vector=[]))
+
+        pipeline.run(self.batcher.batches(chunk_stream), on_written=on_written)
+
+        for episode_id, embeddings in results.items():
+            embeddings.sort(key=lambda embedding: embedding.chunk_index)
+            self.logger.info(f"{episode_id}: {len(embeddings)} embeddings stored")
+
+        elapsed = time.perf_counter() - started
+        self.logger.info(
+            f"Embedded and stored {written_chunks} chunks in {elapsed:.1f}s "
+            f"({written_chunks / elapsed if elapsed else 0:.1f} chunks/s)"
+        )
+        return results
+
+    def _embed_batch(self, batch: List[Tuple[Tuple[str, Dict[str, Any]], str]]) -> List[List[float]]:
+        """Etapa de cálculo: sólo los textos no cacheados van a OpenAI"""
+        return self.embed_documents([text for _, text in batch])
+
+    def _write_batch(
+        self,
+        batch: List[Tuple[Tuple[str, Dict[str, Any]], str]],
+        vectors: List[List[float]],
+    ) -> List[Embedding]:
+        """Etapa de escritura: inserta los vectores ya calculados"""
+        created_at = datetime.now()
+        embeddings = [
+            self._chunk_to_embedding(episode_id, chunk, vector, created_at)
+            for ((episode_id, chunk), _), vector in zip(batch, vectors)
+        ]
+        return self.embedding_repository.save_batch(embeddings)
+
+    def _iter_chunks(
+        self, transcriptions: Iterable[Transcription], results: Dict[str, List[Embedding]]
+    ) -> Iterator[Tuple[Tuple[str, Dict[str, Any]], str]]:
+        """Genera ((episode_id, chunk), texto) para todas las transcripciones"""
+        for transcription in transcriptions:
+            try:
+                episode_metadata = self.extract_episode_metadata(transcription)
+                chunks = self.chunker.chunk_transcript(transcription.text, episode_metadata)
+            except Exception as e:
+                self.logger.error(f"Error creating embeddings for {transcription.episode_id}: {str(e)}")
+                continue
+
             if not chunks:
                 self.logger.warning(f"No chunks generated for {transcription.episode_id}")
-                return []
-            
+                continue
+
             self.logger.info(f"Generated {len(chunks)} chunks for {transcription.episode_id}")
-            
-            # Procesar en batches para Supabase
-            embeddings = []
-            batch_size = 50
-            
-            for i in range(0, len(chunks), batch_size):
-                batch_chunks = chunks[i:i + batch_size]
-                batch_texts = [chunk["content"] for chunk in batch_chunks]
-                batch_metadatas = [chunk["metadata"] for chunk in batch_chunks]
-                
-                try:
-                    # Enviar a Supabase
-                    self.vector_store.add_texts(
-                        texts=batch_texts,
-                        metadatas=batch_metadatas
-                    )
-                    
-                    # Crear objetos Embedding para el resultado
-                    for j, chunk in enumerate(batch_chunks):
-                        embedding = Embedding(
-                            episode_id=transcription.episode_id,
-                            transcription_id=transcription.episode_id,
-                            vector=[],  # Vector vacío ya que está en Supabase
-                            model_name="text-embedding-3-small",
-                            created_at=datetime.now(),
-                            chunk_index=chunk["metadata"]["chunk_index"],
-                            chunk_text=chunk["content"],
-                            metadata=chunk["metadata"],
-                        )
-                        embeddings.append(embedding)
-                    
-                    batch_num = (i // batch_size) + 1
-                    total_batches = (len(chunks) + batch_size - 1) // batch_size
-                    self.logger.info(f"Batch {batch_num}/{total_batches} processed successfully")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing batch {i//batch_size + 1}: {str(e)}")
-                    continue
-            
-            self.logger.info(f"Successfully created {len(embeddings)} embeddings for {transcription.episode_id}")
-            return embeddings
-            
+            self._save_stats(transcription.episode_id, chunks)
+            pending = self._diff_chunks(transcription.episode_id, chunks, results)
+            for chunk in pending:
+                yield (transcription.episode_id, chunk), chunk["content"]
+
+    def _save_stats(self, episode_id: str, chunks: List[Dict[str, Any]]) -> None:
+        """Guarda el resumen del episodio para consultarlo sin buscar"""
+        if not self.stats_repository:
+            return
+        try:
+            self.stats_repository.save(
+                EpisodeStats.from_chunk_metadata(
+                    episode_id, [chunk["metadata"] for chunk in chunks]
+                )
+            )
         except Exception as e:
-            self.logger.error(f"Error creating embeddings for {transcription.episode_id}: {str(e)}")
-            return []
+            self.logger.error(f"Error saving stats for {episode_id}: {str(e)}")
+
+    def _diff_chunks(
+        self,
+        episode_id: str,
+        chunks: List[Dict[str, Any]],
+        results: Dict[str, List[Embedding]],
+    ) -> List[Dict[str, Any]]:
+        """Asigna ids deterministas, borra los chunks que ya no existen y
+        devuelve sólo los que faltan por guardar"""
+        for chunk in chunks:
+            chunk["metadata"]["chunker_version"] = self.chunker.VERSION
+            chunk["metadata"]["chunk_id"] = chunk_id(
+                episode_id,
+                self.chunker.VERSION,
+                chunk["metadata"]["chunk_index"],
+                chunk["content"],
+            )
+
+        try:
+            existing = self.embedding_repository.get_chunk_ids(episode_id)
+        except Exception as e:
+            # Sin diff se reenvía todo; el upsert por id evita duplicados
+            self.logger.error(f"Error fetching stored chunk ids for {episode_id}: {str(e)}")
+            existing = set()
+
+        current = {chunk["metadata"]["chunk_id"] for chunk in chunks}
+        stale = sorted(existing - current)
+        if stale:
+            try:
+                self.embedding_repository.delete_chunks(stale)
+            except Exception as e:
+                self.logger.error(f"Error deleting stale chunks for {episode_id}: {str(e)}")
+
+        created_at = datetime.now()
+        results[episode_id] = [
+            self._chunk_to_embedding(episode_id, chunk, [], created_at)
+            for chunk in chunks
+            if chunk["metadata"]["chunk_id"] in existing
+        ]
+        pending = [chunk for chunk in chunks if chunk["metadata"]["chunk_id"] not in existing]
+        self.logger.info(
+            f"{episode_id}: {len(chunks) - len(pending)} chunks up to date, "
+            f"{len(pending)} to embed, {len(stale)} stale removed"
+        )
+        return pending
+
+    def _chunk_to_embedding(
+        self,
+        episode_id: str,
+        chunk: Dict[str, Any],
+        vector: List[float],
+        created_at: datetime,
+    ) -> Embedding:
+        return Embedding(
+            episode_id=episode_id,
+            transcription_id=episode_id,
+            vector=vector,
+            model_name=self.MODEL_NAME,
+            created_at=created_at,
+            chunk_index=chunk["metadata"]["chunk_index"],
+            chunk_text=chunk["content"],
+            metadata=chunk["metadata"],
+        )
     
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Calcula embeddings consultando primero la caché por hash del contenido"""
+        if not self.embedding_cache:
+            return self.embeddings.embed_documents(texts)
+
+        hashes = [sha256_text(text) for text in texts]
+        cached = self.embedding_cache.get_many(self.MODEL_NAME, hashes)
+
+        misses = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in cached and text_hash not in misses:
+                misses[text_hash] = text
+
+        if misses:
+            new_vectors = self.embeddings.embed_documents(list(misses.values()))
+            computed = dict(zip(misses.keys(), new_vectors))
+            self.embedding_cache.save_many(self.MODEL_NAME, computed)
+            cached.update(computed)
+
+        self.logger.info(
+            f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses"
+        )
+        return [cached[text_hash] for text_hash in hashes]
+
     def create_query_embedding(self, query_text: str) -> list[float]:
         """Crea embedding para una consulta"""
         try:
+            if self.query_cache:
+                return self.query_cache.get_or_compute(
+                    query_text, self.embeddings.embed_query
+                )
             embedding_vector = self.embeddings.embed_query(query_text)
             return embedding_vector
         except Exception as e:
             self.logger.error(f"Error creating query embedding: {str(e)}")
             return []
     
+    def create_query_embeddings(self, query_texts: List[str]) -> List[List[float]]:
+        """Embeddings de varias consultas en una sola petición a la API"""
+        try:
+            if self.query_cache:
+                return self.query_cache.get_or_compute_many(
+                    query_texts, self.embeddings.embed_documents
+                )
+            return self.embeddings.embed_documents(query_texts)
+        except Exception as e:
+            self.logger.error(f"Error creating query embeddings: {str(e)}")
+            return [[] for _ in query_texts]
+    
     def search_episodes(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
-        """Busca episodios similares usando Supabase"""
+        """Busca episodios similares en el almacén de vectores configurado"""
         try:
             self.logger.info(f"Searching for: '{query}' with k={k}")
             
-            docs = self.vector_store.similarity_search(query=query, k=k)
-            self.logger.info(f"Search successful, found {len(docs)} documents")
+            embeddings = self.embedding_repository.search_similar(
+                self.create_query_embedding(query), top_k=k
+            )
+            self.logger.info(f"Search successful, found {len(embeddings)} documents")
             
             results = []
-            for doc in docs:
+            for embedding in embeddings:
                 result = {
-                    "content": doc.page_content,
-                    "metadata": doc.metadata,
+                    "content": embedding.chunk_text,
+                    "metadata": embedding.metadata,
                 }
                 results.append(result)
             
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ...application.use_cases.search_supabase import SearchSupabaseUseCase
+from ...shared.logger import get_logger
+
+
+class SearchServer:
+    """Servidor HTTP/JSON de larga duración para búsquedas.
+
+    Mantiene vivos el caso de uso de búsqueda, sus clientes, las cachés de
+    consultas y cualquier índice local ya cargado, de modo que cada petición
+    sólo paga la búsqueda. Las llamadas bloqueantes (embeddings, red, SQLite)
+    se ejecutan en un pool de hilos para no bloquear el bucle de eventos.
+
+    Rutas:
+        GET /search?q=...&k=5[&episode_id=...]
+        GET /episodes/{episode_id}/summary
+        GET /health
+    """
+
+    MAX_HEADER_BYTES = 16384
+    MAX_BODY_BYTES = 65536
+    MAX_TOP_K = 100
+
+    def __init__(
+        self,
+        search_use_case: SearchSupabaseUseCase,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_workers: int = 4,
+    ):
+        self.search_use_case = search_use_case
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.logger = get_logger(self.__class__.__name__)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(
+            f"🚀 Search server listening on http://{self.host}:{self.port}"
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            self.logger.info("Search server stopped")
+        finally:
+            self.executor.shutdown(wait=False)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                if len(head) > self.MAX_HEADER_BYTES:
+                    break
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    await self._write(
+                        writer, HTTPStatus.BAD_REQUEST, {"error": "bad request"}, False
+                    )
+                    break
+
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                # Las rutas no aceptan cuerpo; se descarta si lo hay
+                length = _content_length(headers.get("content-length"))
+                if length is None:
+                    await self._write(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        {"error": "invalid Content-Length"},
+                        False,
+                    )
+                    break
+                if length > self.MAX_BODY_BYTES:
+                    await self._write(
+                        writer,
+                        HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                        {"error": "request body too large"},
+                        False,
+                    )
+                    break
+                if length:
+                    try:
+                        await reader.readexactly(length)
+                    except asyncio.IncompleteReadError:
+                        break
+
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+
+                started = time.perf_counter()
+                status, payload = await self._dispatch(method, target)
+                await self._write(writer, status, payload, keep_alive)
+                self.logger.info(
+                    f"{method} {target} -> {status.value} "
+                    f"({1000 * (time.perf_counter() - started):.1f} ms)"
+                )
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str) -> tuple[HTTPStatus, Any]:
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "only GET is supported"}
+
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+
+        try:
+            if parts == ["health"]:
+                return HTTPStatus.OK, {"status": "ok"}
+            if parts == ["search"]:
+                return await self._search(params)
+            if len(parts) == 3 and parts[0] == "episodes" and parts[2] == "summary":
+                summary = await self._run_blocking(
+                    self.search_use_case.get_episode_summary, parts[1]
+                )
+                if "error" in summary:
+                    return HTTPStatus.NOT_FOUND, summary
+                return HTTPStatus.OK, summary
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:
+            self.logger.error(f"Error handling {target}: {str(e)}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)}
+
+        return HTTPStatus.NOT_FOUND, {"error": f"no route for {url.path}"}
+
+    async def _search(self, params: dict[str, str]) -> tuple[HTTPStatus, Any]:
+        query = params.get("q", "").strip()
+        if not query:
+            raise ValueError("missing query parameter 'q'")
+        k = min(max(int(params.get("k", 5)), 1), self.MAX_TOP_K)
+
+        episode_id = params.get("episode_id")
+        if episode_id:
+            results = await self._run_blocking(
+                self.search_use_case.search_by_episode, query, episode_id, k
+            )
+        else:
+            results = await self._run_blocking(self.search_use_case.execute, query, k)
+        return HTTPStatus.OK, {"query": query, "k": k, "results": results}
+
+    async def _run_blocking(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Any,
+        keep_alive: bool,
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+def _content_length(value: Optional[str]) -> Optional[int]:
+    """Longitud del cuerpo, o None si la cabecera no es un entero >= 0"""
+    if not value:
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
@@ -1,36 +1,69 @@
 import json
 import os
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Optional
 
 from ...domain.entities.transcription import Transcription
-from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...domain.entities.transcription_handle import TranscriptionHandle
+from ...domain.repositories.compressible_transcription_repository import (
+    CompressibleTranscriptionRepository,
+)
 from ...shared.logger import get_logger
+from ...shared.transcript_compression import (
+    DICTIONARY_SIZE,
+    EXTENSIONS,
+    TranscriptCodec,
+    train_dictionary,
+)
 
 
-class FileTranscriptionRepository(TranscriptionRepository):
-    def __init__(self, base_path: str):
+class FileTranscriptionRepository(CompressibleTranscriptionRepository):
+    """Una transcripción por fichero JSON en `base_path`.
+
+    Con `compression` ("gzip" o "zstd") las transcripciones se guardan
+    comprimidas (`.json.gz`, `.json.zst`). Al leer, el formato se detecta por
+    los primeros bytes, así que en el directorio pueden convivir ficheros de
+    varios formatos. zstd usa el diccionario `transcripts.zdict` del
+    directorio si existe.
+
+    `iter_handles` no descomprime los ficheros: los metadatos de las handles
+    se guardan en `transcripts.meta.jsonl`.
+    """
+
+    DICTIONARY_FILE = "transcripts.zdict"
+    # Metadatos de `iter_handles`, validados con el mtime y tamaño de cada
+    # fichero. No termina en .json para no confundirlo con una transcripción
+    METADATA_FILE = "transcripts.meta.jsonl"
+
+    def __init__(self, base_path: str, compression: str = "none"):
         self.base_path = base_path
         self.logger = get_logger(self.__class__.__name__)
         os.makedirs(base_path, exist_ok=True)
+        self.codec = TranscriptCodec(compression, self._load_dictionary())
+
+    @property
+    def compression(self) -> str:
+        return self.codec.compression
+
+    def has_dictionary(self) -> bool:
+        return self.codec.dictionary is not None
 
     def get_by_episode_id(self, episode_id: str) -> Optional[Transcription]:
-        file_path = self._get_file_path(episode_id)
-        if not os.path.exists(file_path):
+        file_path = self._find_file(episode_id)
+        if file_path is None:
             return None
 
         try:
-            with open(file_path, encoding="utf-8") as file:
-                data = json.load(file)
-                return self._dict_to_transcription(data)
+            return self._dict_to_transcription(self._read(file_path))
         except (FileNotFoundError, json.JSONDecodeError):
             return None
 
     def save(self, transcription: Transcription) -> Transcription:
         file_path = self._get_file_path(transcription.episode_id)
 
-        # Check if file already exists
-        if os.path.exists(file_path):
+        # Check if file already exists (in any format)
+        if self.exists(transcription.episode_id):
             self.logger.info(
                 f"Transcription file already exists for episode {transcription.episode_id}, "
                 f"skipping save to preserve existing data"
@@ -48,30 +81,226 @@ class FileTranscriptionRepository(TranscriptionRepository):
                 return transcription
 
         # File doesn't exist, safe to create new one
-        data = self._transcription_to_dict(transcription)
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        with open(file_path, "wb") as file:
+            file.write(self._serialize(transcription))
 
         self.logger.info(f"Transcription saved for episode {transcription.episode_id}")
         return transcription
 
+    def rewrite(self, transcription: Transcription) -> None:
+        """Vuelve a guardar la transcripción con la compresión actual y borra
+        sus ficheros en otros formatos"""
+        file_path = self._get_file_path(transcription.episode_id)
+        with open(f"{file_path}.tmp", "wb") as file:
+            file.write(self._serialize(transcription))
+        os.replace(f"{file_path}.tmp", file_path)
+
+        for path in self._candidate_paths(transcription.episode_id):
+            if path != file_path and os.path.exists(path):
+                os.remove(path)
+
+    def train_dictionary(
+        self, transcriptions: Iterable[Transcription], size: int = DICTIONARY_SIZE
+    ) -> int:
+        """Entrena y guarda el diccionario zstd del directorio. Devuelve su
+        tamaño en bytes.
+
+        Los `.json.zst` escritos con un diccionario sólo se leen con ese
+        mismo diccionario, así que no se reemplaza uno que ya exista.
+        """
+        if self.has_dictionary():
+            raise ValueError(
+                f"Ya existe un diccionario en {self._dictionary_path()}; "
+                "no se puede reemplazar sin reescribir los ficheros .json.zst"
+            )
+
+        samples = [self._to_json(transcription) for transcription in transcriptions]
+        dictionary = train_dictionary(samples, size)
+        with open(self._dictionary_path(), "wb") as file:
+            file.write(dictionary)
+
+        self.codec = TranscriptCodec(self.compression, dictionary)
+        self.logger.info(
+            f"Trained zstd dictionary: {len(dictionary)} bytes from "
+            f"{len(samples)} transcriptions"
+        )
+        return len(dictionary)
+
+    def disk_usage(self) -> int:
+        """Bytes de las transcripciones en disco, con el diccionario incluido"""
+        paths = list(self._iter_files())
+        if self.has_dictionary():
+            paths.append(self._dictionary_path())
+        return sum(os.path.getsize(path) for path in paths)
+
     def get_all(self) -> list[Transcription]:
-        transcriptions = []
-        for filename in os.listdir(self.base_path):
-            if filename.endswith(".json"):
-                file_path = os.path.join(self.base_path, filename)
+        return list(self.iter_all())
+
+    def exists(self, episode_id: str) -> bool:
+        return self._find_file(episode_id) is not None
+
+    def iter_all(self) -> Iterator[Transcription]:
+        for _, transcription in self._iter_transcriptions():
+            yield transcription
+
+    def iter_handles(self) -> Iterator[TranscriptionHandle]:
+        # Las handles salen de `METADATA_FILE`: sólo se lee el fichero de una
+        # transcripción nueva o modificada (otro mtime o tamaño)
+        metadata = self._load_metadata()
+        seen = {}
+        completed = False
+        try:
+            for file_path in self._iter_files():
+                filename = os.path.basename(file_path)
                 try:
-                    with open(file_path, encoding="utf-8") as file:
-                        data = json.load(file)
-                        transcriptions.append(self._dict_to_transcription(data))
-                except (json.JSONDecodeError, KeyError):
+                    stat = os.stat(file_path)
+                except OSError:
                     continue
-        return transcriptions
+                key = [stat.st_mtime_ns, stat.st_size]
+
+                entry = metadata.get(filename)
+                if entry is None or entry["stat"] != key:
+                    transcription = self._read_transcription(file_path)
+                    if transcription is None:
+                        continue
+                    entry = {
+                        "file": filename,
+                        "stat": key,
+                        **self._handle_metadata(transcription),
+                    }
+                seen[filename] = entry
+                yield self._entry_to_handle(entry, file_path)
+            completed = True
+        finally:
+            # Sin recorrido completo no se sabe qué ficheros ya no existen
+            updated = seen if completed else {**metadata, **seen}
+            if updated != metadata:
+                self._save_metadata(updated)
+
+    def _iter_transcriptions(self) -> Iterator[tuple[str, Transcription]]:
+        for file_path in self._iter_files():
+            transcription = self._read_transcription(file_path)
+            if transcription is not None:
+                yield file_path, transcription
+
+    def _read_transcription(self, file_path: str) -> Optional[Transcription]:
+        try:
+            return self._dict_to_transcription(self._read(file_path))
+        except (OSError, ValueError, KeyError, ImportError) as e:
+            # ValueError incluye JSON inválido y gzip/zstd corruptos
+            self.logger.warning(f"Skipping unreadable transcription {file_path}: {e}")
+            return None
+
+    def _iter_files(self) -> Iterator[str]:
+        """Un fichero por episodio, aunque una conversión interrumpida lo haya
+        dejado en dos formatos"""
+        seen = set()
+        for filename in sorted(os.listdir(self.base_path)):
+            episode_id = self._episode_id_from_filename(filename)
+            if episode_id is None or episode_id in seen:
+                continue
+            seen.add(episode_id)
+            yield self._find_file(episode_id)
+
+    def _read(self, file_path: str) -> dict:
+        with open(file_path, "rb") as file:
+            return json.loads(self.codec.decode(file.read()))
+
+    def _read_text(self, file_path: str) -> str:
+        return self._read(file_path)["text"]
+
+    def _serialize(self, transcription: Transcription) -> bytes:
+        if self.compression == "none":
+            data = self._transcription_to_dict(transcription)
+            return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        return self.codec.encode(self._to_json(transcription))
+
+    def _to_json(self, transcription: Transcription) -> bytes:
+        """JSON compacto: el que se comprime y con el que se entrena"""
+        data = self._transcription_to_dict(transcription)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
 
     def _get_file_path(self, episode_id: str) -> str:
-        filename = f"{episode_id}.json"
+        filename = f"{episode_id}{self.codec.extension}"
         return os.path.join(self.base_path, filename)
 
+    def _candidate_paths(self, episode_id: str) -> list[str]:
+        # Primero el formato con el que se escribe
+        paths = [self._get_file_path(episode_id)]
+        for extension in EXTENSIONS.values():
+            path = os.path.join(self.base_path, f"{episode_id}{extension}")
+            if path not in paths:
+                paths.append(path)
+        return paths
+
+    def _find_file(self, episode_id: str) -> Optional[str]:
+        for path in self._candidate_paths(episode_id):
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _episode_id_from_filename(filename: str) -> Optional[str]:
+        for extension in EXTENSIONS.values():
+            if filename.endswith(extension):
+                return filename[: -len(extension)]
+        return None
+
+    def _handle_metadata(self, transcription: Transcription) -> dict:
+        return {
+            "episode_id": transcription.episode_id,
+            "size": len(transcription.text),
+            "duration": transcription.duration,
+            "language": transcription.language,
+            "created_at": transcription.created_at.isoformat(),
+            "file_path": transcription.file_path,
+        }
+
+    def _entry_to_handle(self, entry: dict, path: str) -> TranscriptionHandle:
+        return TranscriptionHandle(
+            episode_id=entry["episode_id"],
+            size=entry["size"],
+            duration=entry["duration"],
+            language=entry["language"],
+            created_at=datetime.fromisoformat(entry["created_at"]),
+            file_path=entry["file_path"],
+            load_text=lambda: self._read_text(path),
+        )
+
+    def _metadata_path(self) -> str:
+        return os.path.join(self.base_path, self.METADATA_FILE)
+
+    def _load_metadata(self) -> dict[str, dict]:
+        """Metadatos por nombre de fichero. Un índice ilegible se reconstruye"""
+        try:
+            with open(self._metadata_path(), encoding="utf-8") as file:
+                entries = [json.loads(line) for line in file if line.strip()]
+            return {entry["file"]: entry for entry in entries}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Rebuilding unreadable {self.METADATA_FILE}: {e}")
+            return {}
+
+    def _save_metadata(self, metadata: dict[str, dict]) -> None:
+        path = self._metadata_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for filename in sorted(metadata):
+                file.write(json.dumps(metadata[filename], ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+
+    def _dictionary_path(self) -> str:
+        return os.path.join(self.base_path, self.DICTIONARY_FILE)
+
+    def _load_dictionary(self) -> Optional[bytes]:
+        if not os.path.exists(self._dictionary_path()):
+            return None
+        with open(self._dictionary_path(), "rb") as file:
+            return file.read()
+
     def _dict_to_transcription(self, data: dict) -> Transcription:
         return Transcription(
             episode_id=data["episode_id"],
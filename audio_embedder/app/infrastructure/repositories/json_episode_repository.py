@@ -1,44 +1,105 @@
 import json
+import os
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict
 from datetime import datetime
 from typing import Optional
 
 from ...domain.entities.episode import Episode
-from ...domain.repositories.episode_repository import EpisodeRepository
+from ...domain.repositories.episode_repository import EpisodeRepository, publish_date
+from ...shared.logger import get_logger
+
+
+class _EpisodeIndex:
+    """Episodios de una versión del fichero con sus índices. Se construye
+    entero antes de publicarse, así que las consultas concurrentes nunca ven
+    uno a medias."""
+
+    def __init__(self, episodes: list[Episode], signature: Optional[tuple] = None):
+        self.signature = signature
+        self.episodes = episodes
+        self.by_id = {episode.id: episode for episode in episodes}
+        self.by_url = {episode.url: episode for episode in episodes}
+        self.by_date = sorted(episodes, key=lambda episode: episode.published_date)
+        self.dates = [publish_date(episode) for episode in self.by_date]
 
 
 class JSONEpisodeRepository(EpisodeRepository):
+    """Episodios de `episodes.json` (lo escribe podcast_crawler).
+
+    El fichero se parsea una sola vez y se indexa por id, URL y fecha de
+    publicación. Cada consulta sólo hace un `stat`: si el mtime o el tamaño
+    han cambiado, se vuelve a cargar.
+    """
+
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self.logger = get_logger(self.__class__.__name__)
+        self._index = _EpisodeIndex([])
 
     def get_all(self) -> list[Episode]:
-        try:
-            with open(self.file_path, encoding="utf-8") as file:
-                data = json.load(file)
-                return [self._dict_to_episode(item) for item in data]
-        except FileNotFoundError:
-            return []
+        return list(self._load().episodes)
 
     def get_by_id(self, episode_id: str) -> Optional[Episode]:
-        episodes = self.get_all()
-        for episode in episodes:
-            if episode.url == episode_id:
-                return episode
-        return None
+        return self._load().by_id.get(episode_id)
+
+    def get_by_url(self, url: str) -> Optional[Episode]:
+        return self._load().by_url.get(url)
+
+    def get_published_between(self, start_date: int, end_date: int) -> list[Episode]:
+        index = self._load()
+        start = bisect_left(index.dates, start_date)
+        end = bisect_right(index.dates, end_date)
+        return index.by_date[start:end]
 
     def save(self, episode: Episode) -> Episode:
         return episode
 
+    def _load(self) -> _EpisodeIndex:
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            self._index = _EpisodeIndex([])
+            return self._index
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        index = self._index
+        if index.signature == signature:
+            return index
+
+        try:
+            with open(self.file_path, encoding="utf-8") as file:
+                data = json.load(file)
+        except json.JSONDecodeError as e:
+            # El crawler reescribe el fichero sin renombrar: si se lee a medio
+            # escribir se siguen sirviendo los episodios anteriores
+            self.logger.warning(f"Could not parse {self.file_path}: {e}")
+            return index
+        index = _EpisodeIndex([self._dict_to_episode(item) for item in data], signature)
+        self._index = index
+        self.logger.info(f"Loaded {len(index.episodes)} episodes from {self.file_path}")
+        return index
+
     def _dict_to_episode(self, data: dict) -> Episode:
-        return Episode(
-            id=data["id"],
-            title=data["title"],
-            description=data["description"],
-            url=data["url"],
-            published_date=datetime.fromisoformat(
-                data["published_date"].replace("Z", "+00:00")
-            ),
-            duration=data["duration"],
-            file_size=data["file_size"],
-            local_file_path=data.get("local_file_path"),
-            podcast=data.get("podcast"),
-        )
+        return episode_from_dict(data)
+
+
+def episode_from_dict(data: dict) -> Episode:
+    """Episodio con el formato de episodes.json (el que escribe el crawler)"""
+    return Episode(
+        id=data["id"],
+        title=data["title"],
+        description=data["description"],
+        url=data["url"],
+        published_date=datetime.fromisoformat(
+            data["published_date"].replace("Z", "+00:00")
+        ),
+        duration=data["duration"],
+        file_size=data["file_size"],
+        local_file_path=data.get("local_file_path"),
+        podcast=data.get("podcast"),
+    )
+
+
+def episode_to_dict(episode: Episode) -> dict:
+    return {**asdict(episode), "published_date": episode.published_date.isoformat()}
@@ -0,0 +1,523 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.quantizable_embedding_repository import (
+    QuantizableEmbeddingRepository,
+)
+from ...shared.episode_dates import episode_date
+from ...shared.hashing import chunk_id
+from ...shared.logger import get_logger
+from ...shared.metadata_filter import metadata_contains
+from ...shared.metadata_index import MetadataIndex
+from ...shared.product_quantizer import ProductQuantizer, top_k_indices
+
+
+class LocalEmbeddingRepository(QuantizableEmbeddingRepository):
+    """Almacén local de embeddings en disco.
+
+    Los vectores se guardan como filas float32 en un fichero append-only y los
+    metadatos de cada fila en JSONL. Si hay codebooks PQ entrenados, la
+    búsqueda usa los códigos comprimidos y opcionalmente re-ordena los mejores
+    candidatos con el vector exacto leído del disco.
+
+    Un índice por fecha de publicación (filas ordenadas por la fecha que
+    codifica el id del episodio) convierte un rango de fechas en un corte
+    contiguo antes de puntuar ningún vector, y un índice invertido de los
+    metadatos escalares resuelve `filter_metadata` sin recorrer todas las filas.
+
+    Los chunks se identifican por su id determinista: guardar uno que ya
+    existe no hace nada, y borrar añade la fila a un fichero de tombstones
+    que la excluye de las búsquedas sin reescribir los vectores.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    RECORDS_FILE = "records.jsonl"
+    MANIFEST_FILE = "manifest.json"
+    CODEBOOKS_FILE = "pq_codebooks.npy"
+    CODES_FILE = "pq_codes.u8"
+    TOMBSTONES_FILE = "deleted_rows.txt"
+
+    BLOCK_SIZE = 65536
+
+    def __init__(
+        self, base_path: str, use_pq: bool = False, rerank_candidates: int = 100
+    ):
+        self.base_path = base_path
+        self.use_pq = use_pq
+        self.rerank_candidates = rerank_candidates
+        self.logger = get_logger(self.__class__.__name__)
+        os.makedirs(base_path, exist_ok=True)
+
+        self._records: Optional[list[dict]] = None
+        self._vectors: Optional[np.ndarray] = None
+        self._norms: Optional[np.ndarray] = None
+        self._quantizer: Optional[ProductQuantizer] = None
+        self._codes: Optional[np.ndarray] = None
+        self._deleted: Optional[np.ndarray] = None
+        self._date_index: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._metadata_index: Optional[MetadataIndex] = None
+        # Ids de las filas vivas, mantenidos al guardar y borrar. Se recalculan
+        # sólo si records.jsonl o deleted_rows.txt cambian desde fuera
+        self._chunk_ids: Optional[set[str]] = None
+        self._chunk_ids_key: Optional[tuple] = None
+
+    @property
+    def dimension(self) -> Optional[int]:
+        manifest = self._read_manifest()
+        return manifest.get("dimension") if manifest else None
+
+    def count(self) -> int:
+        return len(self._load_records())
+
+    def get_by_episode_id(self, episode_id: str) -> list[Embedding]:
+        return [
+            self._record_to_embedding(record, i)
+            for i, record in self._live_records()
+            if record["episode_id"] == episode_id
+        ]
+
+    def get_chunk_ids(self, episode_id: str) -> set[str]:
+        return {
+            _record_chunk_id(record)
+            for _, record in self._live_records()
+            if record["episode_id"] == episode_id
+        }
+
+    def get_chunk_keys(self) -> dict[str, tuple[str, int]]:
+        """Mapa id de chunk -> (episode_id, chunk_index) de las filas vivas"""
+        return {
+            _record_chunk_id(record): (record["episode_id"], record["chunk_index"])
+            for _, record in self._live_records()
+        }
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        to_delete = set(chunk_ids)
+        live_chunk_ids = self._get_chunk_ids()
+        rows = [
+            i
+            for i, record in self._live_records()
+            if _record_chunk_id(record) in to_delete
+        ]
+        if not rows:
+            return
+        with open(self._path(self.TOMBSTONES_FILE), "a", encoding="utf-8") as file:
+            file.writelines(f"{row}\n" for row in rows)
+        self._deleted = None
+        self._date_index = None
+        self._metadata_index = None
+        live_chunk_ids.difference_update(to_delete)
+        self._chunk_ids_key = self._files_key()
+
+    def save(self, embedding: Embedding) -> Embedding:
+        self.save_batch([embedding])
+        return embedding
+
+    def save_batch(self, embeddings: list[Embedding]) -> list[Embedding]:
+        with_vector = [embedding for embedding in embeddings if embedding.vector]
+        if len(with_vector) < len(embeddings):
+            self.logger.warning(
+                f"Skipping {len(embeddings) - len(with_vector)} embeddings without vector"
+            )
+
+        # Guardar un chunk que ya existe no hace nada
+        live_chunk_ids = self._get_chunk_ids()
+        to_store = {}
+        for embedding in with_vector:
+            embedding_id = _record_chunk_id(self._embedding_to_record(embedding))
+            if embedding_id not in live_chunk_ids:
+                to_store.setdefault(embedding_id, embedding)
+        if not to_store:
+            return embeddings
+
+        matrix = np.asarray([e.vector for e in to_store.values()], dtype=np.float32)
+        dimension = self.dimension
+        if dimension is None:
+            dimension = matrix.shape[1]
+            self._write_manifest({"dimension": dimension})
+        elif matrix.shape[1] != dimension:
+            raise ValueError(
+                f"Vector dimension {matrix.shape[1]} does not match store dimension {dimension}"
+            )
+
+        with open(self._path(self.RECORDS_FILE), "a", encoding="utf-8") as file:
+            for embedding in to_store.values():
+                record = self._embedding_to_record(embedding)
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        with open(self._path(self.VECTORS_FILE), "ab") as file:
+            file.write(matrix.tobytes())
+
+        quantizer = self.get_quantizer()
+        if quantizer is not None:
+            with open(self._path(self.CODES_FILE), "ab") as file:
+                file.write(quantizer.encode(_normalize_rows(matrix)).tobytes())
+
+        self._invalidate()
+        live_chunk_ids.update(to_store)
+        self._chunk_ids_key = self._files_key()
+        return embeddings
+
+    def search_similar(
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        indices, scores = self.search_indices(query_vector, top_k, filter_metadata)
+        records = self._load_records()
+        return [
+            self._record_to_embedding(records[i], i, score)
+            for i, score in zip(indices, scores)
+        ]
+
+    def search_indices(
+        self,
+        query_vector: list[float],
+        top_k: int,
+        filter_metadata: Optional[dict] = None,
+    ):
+        """Devuelve (índices de fila, similitud coseno) de los top_k vectores"""
+        if self.count() == 0 or not query_vector:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = _normalize_rows(np.asarray(query_vector, dtype=np.float32))[0]
+
+        if filter_metadata:
+            rows = self._filter_rows(filter_metadata)
+            scores = self.get_normalized_vectors(rows) @ query
+            best = top_k_indices(scores, top_k)
+            return rows[best], scores[best]
+
+        if self.use_pq and self.get_quantizer() is not None:
+            return self._search_pq(query, top_k)
+        return self.exact_search(query, top_k)
+
+    def search_similar_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[list[Embedding]]:
+        """Puntúa todas las consultas con un único producto matriz-matriz"""
+        results: list[list[Embedding]] = [[] for _ in query_vectors]
+        valid = [i for i, vector in enumerate(query_vectors) if vector]
+        if self.count() == 0 or not valid:
+            return results
+        if self.use_pq and self.get_quantizer() is not None and not filter_metadata:
+            # Las tablas de distancias PQ son propias de cada consulta
+            return super().search_similar_many(query_vectors, top_k, filter_metadata)
+
+        queries = _normalize_rows(
+            np.asarray([query_vectors[i] for i in valid], dtype=np.float32)
+        )
+        if filter_metadata:
+            rows = self._filter_rows(filter_metadata)
+            scores = self.get_normalized_vectors(rows) @ queries.T
+        else:
+            rows = None
+            scores = self._exclude_deleted(self._scores(queries))
+
+        records = self._load_records()
+        for column, i in enumerate(valid):
+            indices, best_scores = self._top_k(scores[:, column], top_k)
+            if rows is not None:
+                indices = rows[indices]
+            results[i] = [
+                self._record_to_embedding(records[row], row, score)
+                for row, score in zip(indices, best_scores)
+            ]
+        return results
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        if self.count() == 0 or not query_vector:
+            return []
+
+        rows = self._rows_in_date_range(start_date, end_date)
+        if filter_metadata:
+            rows = np.intersect1d(rows, self._filter_rows(filter_metadata))
+
+        query = _normalize_rows(np.asarray(query_vector, dtype=np.float32))[0]
+        scores = self.get_normalized_vectors(rows) @ query
+        best = top_k_indices(scores, top_k)
+        records = self._load_records()
+        return [
+            self._record_to_embedding(records[row], row, score)
+            for row, score in zip(rows[best], scores[best])
+        ]
+
+    def get_vectors(self) -> np.ndarray:
+        """Matriz (n, d) de vectores mapeada en memoria (sólo lectura)"""
+        if self._vectors is None:
+            path = self._path(self.VECTORS_FILE)
+            dimension = self.dimension
+            if dimension is None or not os.path.exists(path):
+                return np.empty((0, dimension or 0), dtype=np.float32)
+            self._vectors = np.memmap(path, dtype=np.float32, mode="r").reshape(
+                -1, dimension
+            )
+        return self._vectors
+
+    def get_normalized_vectors(self, indices: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(self.get_vectors()[indices], dtype=np.float32)
+        return _normalize_rows(vectors)
+
+    def get_quantizer(self) -> Optional[ProductQuantizer]:
+        if self._quantizer is None and os.path.exists(self._path(self.CODEBOOKS_FILE)):
+            self._quantizer = ProductQuantizer.load(self._path(self.CODEBOOKS_FILE))
+        return self._quantizer
+
+    def save_quantizer(self, quantizer: ProductQuantizer) -> None:
+        """Guarda los codebooks y re-codifica todos los vectores almacenados"""
+        vectors = self.get_vectors()
+        if quantizer.dimension != vectors.shape[1]:
+            raise ValueError(
+                f"Quantizer dimension {quantizer.dimension} does not match store dimension {vectors.shape[1]}"
+            )
+
+        quantizer.save(self._path(self.CODEBOOKS_FILE))
+        with open(self._path(self.CODES_FILE), "wb") as file:
+            for start in range(0, len(vectors), self.BLOCK_SIZE):
+                block = np.asarray(vectors[start : start + self.BLOCK_SIZE])
+                file.write(quantizer.encode(_normalize_rows(block)).tobytes())
+
+        self._invalidate()
+        self._quantizer = quantizer
+        self.logger.info(
+            f"Encoded {len(vectors)} vectors with {quantizer.code_size}-byte PQ codes"
+        )
+
+    def get_codes(self) -> np.ndarray:
+        if self._codes is None:
+            quantizer = self.get_quantizer()
+            self._codes = np.fromfile(
+                self._path(self.CODES_FILE), dtype=np.uint8
+            ).reshape(-1, quantizer.code_size)
+        return self._codes
+
+    def exact_search(self, query: np.ndarray, top_k: int):
+        scores = self._exclude_deleted(self._scores(query))
+        return self._top_k(scores, top_k)
+
+    def _search_pq(self, query: np.ndarray, top_k: int):
+        quantizer = self.get_quantizer()
+        candidates = max(top_k, self.rerank_candidates)
+        scores = quantizer.asymmetric_scores(query, self.get_codes())
+        indices, scores = self._top_k(self._exclude_deleted(scores), candidates)
+
+        if self.rerank_candidates <= 0:
+            return indices[:top_k], scores[:top_k]
+
+        # Re-ranking exacto de los candidatos leyendo sólo sus filas del disco
+        order = np.sort(indices)
+        exact = self.get_normalized_vectors(order) @ query
+        best = top_k_indices(exact, top_k)
+        return order[best], exact[best]
+
+    def _top_k(self, scores: np.ndarray, top_k: int):
+        indices = top_k_indices(scores, top_k)
+        indices = indices[np.isfinite(scores[indices])]
+        return indices, scores[indices]
+
+    def _exclude_deleted(self, scores: np.ndarray) -> np.ndarray:
+        deleted = self._get_deleted()
+        if len(deleted):
+            scores[deleted] = -np.inf
+        return scores
+
+    def _get_deleted(self) -> np.ndarray:
+        if self._deleted is None:
+            path = self._path(self.TOMBSTONES_FILE)
+            rows = []
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    rows = [int(line) for line in file if line.strip()]
+            self._deleted = np.unique(np.asarray(rows, dtype=np.int64))
+        return self._deleted
+
+    def _get_chunk_ids(self) -> set[str]:
+        key = self._files_key()
+        if self._chunk_ids is None or key != self._chunk_ids_key:
+            if self._chunk_ids is not None:
+                # Otro proceso ha escrito en el almacén: las cachés no valen
+                self._invalidate()
+            self._chunk_ids = {
+                _record_chunk_id(record) for _, record in self._live_records()
+            }
+            self._chunk_ids_key = key
+        return self._chunk_ids
+
+    def _files_key(self) -> tuple:
+        """(mtime, tamaño) de los ficheros de los que salen los ids vivos"""
+        key = []
+        for filename in (self.RECORDS_FILE, self.TOMBSTONES_FILE):
+            try:
+                stat = os.stat(self._path(filename))
+                key.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                key.append(None)
+        return tuple(key)
+
+    def _live_records(self):
+        deleted = set(self._get_deleted().tolist())
+        return (
+            (i, record)
+            for i, record in enumerate(self._load_records())
+            if i not in deleted
+        )
+
+    def _rows_in_date_range(self, start_date: int, end_date: int) -> np.ndarray:
+        """Filas vivas con fecha en [start_date, end_date], en orden de fila"""
+        dates, rows = self._get_date_index()
+        start = np.searchsorted(dates, start_date, side="left")
+        end = np.searchsorted(dates, end_date, side="right")
+        # Orden de fila para leer el fichero de vectores de forma secuencial
+        return np.sort(rows[start:end])
+
+    def _get_date_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """(fechas ordenadas, fila de cada fecha) de las filas vivas con fecha"""
+        if self._date_index is None:
+            pairs = [
+                (date, i)
+                for i, record in self._live_records()
+                if (date := episode_date(record["episode_id"])) is not None
+            ]
+            dates = np.asarray([date for date, _ in pairs], dtype=np.int64)
+            rows = np.asarray([i for _, i in pairs], dtype=np.int64)
+            order = np.argsort(dates, kind="stable")
+            self._date_index = (dates[order], rows[order])
+        return self._date_index
+
+    def _filter_rows(self, filter_metadata: dict) -> np.ndarray:
+        """Filas vivas cuyo metadata contiene `filter_metadata`, en orden"""
+        rows, residual = self._get_metadata_index().candidates(filter_metadata)
+        if residual:
+            records = self._load_records()
+            matches = np.fromiter(
+                (
+                    metadata_contains(records[row].get("metadata") or {}, residual)
+                    for row in rows
+                ),
+                dtype=bool,
+                count=len(rows),
+            )
+            rows = rows[matches]
+        return rows
+
+    def _get_metadata_index(self) -> MetadataIndex:
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex(
+                (i, record.get("metadata")) for i, record in self._live_records()
+            )
+        return self._metadata_index
+
+    def _scores(self, query: np.ndarray) -> np.ndarray:
+        """Similitud coseno de cada fila con `query` (d,) o con cada consulta
+        de una matriz (q, d), en cuyo caso el resultado es (n, q)"""
+        vectors = self.get_vectors()
+        norms = self._get_norms()
+        scores = np.empty((len(vectors), *query.shape[:-1]), dtype=np.float32)
+        for start in range(0, len(vectors), self.BLOCK_SIZE):
+            block = vectors[start : start + self.BLOCK_SIZE]
+            scores[start : start + len(block)] = block @ query.T
+        return scores / (norms[:, None] if query.ndim > 1 else norms)
+
+    def _get_norms(self) -> np.ndarray:
+        if self._norms is None:
+            vectors = self.get_vectors()
+            norms = np.empty(len(vectors), dtype=np.float32)
+            for start in range(0, len(vectors), self.BLOCK_SIZE):
+                block = vectors[start : start + self.BLOCK_SIZE]
+                norms[start : start + len(block)] = np.linalg.norm(block, axis=1)
+            norms[norms == 0] = 1.0
+            self._norms = norms
+        return self._norms
+
+    def _load_records(self) -> list[dict]:
+        if self._records is None:
+            records = []
+            path = self._path(self.RECORDS_FILE)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as file:
+                    records = [json.loads(line) for line in file if line.strip()]
+            self._records = records
+        return self._records
+
+    def _invalidate(self) -> None:
+        self._records = None
+        self._vectors = None
+        self._norms = None
+        self._codes = None
+        self._deleted = None
+        self._date_index = None
+        self._metadata_index = None
+
+    def _read_manifest(self) -> Optional[dict]:
+        path = self._path(self.MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_manifest(self, manifest: dict) -> None:
+        with open(self._path(self.MANIFEST_FILE), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.base_path, filename)
+
+    def _record_to_embedding(
+        self, record: dict, row: int, score: Optional[float] = None
+    ) -> Embedding:
+        metadata = dict(record.get("metadata") or {})
+        if score is not None:
+            metadata["similarity_score"] = float(score)
+        return Embedding(
+            episode_id=record["episode_id"],
+            transcription_id=record["transcription_id"],
+            vector=self.get_vectors()[row].tolist(),
+            model_name=record["model_name"],
+            created_at=datetime.fromisoformat(record["created_at"]),
+            chunk_index=record["chunk_index"],
+            chunk_text=record["chunk_text"],
+            metadata=metadata,
+        )
+
+    def _embedding_to_record(self, embedding: Embedding) -> dict:
+        return {
+            "episode_id": embedding.episode_id,
+            "transcription_id": embedding.transcription_id,
+            "model_name": embedding.model_name,
+            "created_at": embedding.created_at.isoformat(),
+            "chunk_index": embedding.chunk_index,
+            "chunk_text": embedding.chunk_text,
+            "metadata": embedding.metadata,
+        }
+
+
+def _record_chunk_id(record: dict) -> str:
+    metadata = record.get("metadata") or {}
+    return metadata.get("chunk_id") or chunk_id(
+        record["episode_id"],
+        metadata.get("chunker_version", ""),
+        record["chunk_index"],
+        record["chunk_text"],
+    )
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.atleast_2d(matrix)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
@@ -0,0 +1,137 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.lexical_index_repository import LexicalIndexRepository
+from ...shared.bm25_index import BM25Index
+from ...shared.logger import get_logger
+from ...shared.metadata_filter import metadata_contains
+from ...shared.metadata_index import MetadataIndex
+from ...shared.text_tokenizer import tokenize
+
+
+class LocalLexicalIndexRepository(LexicalIndexRepository):
+    """Índice BM25 de los chunks en disco.
+
+    El índice invertido (postings delta-codificadas, ver `BM25Index`) va en un
+    `.npz` y el texto y metadatos de cada chunk en JSONL, en el mismo orden
+    que los ids de documento. Ambos se cargan una vez y se mantienen en
+    memoria, así que una consulta no toca la red ni el disco.
+    """
+
+    INDEX_FILE = "bm25.npz"
+    RECORDS_FILE = "records.jsonl"
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+        self.logger = get_logger(self.__class__.__name__)
+        os.makedirs(base_path, exist_ok=True)
+
+        self._index: Optional[BM25Index] = None
+        self._records: Optional[list[dict]] = None
+        self._metadata_index: Optional[MetadataIndex] = None
+
+    def count(self) -> int:
+        return len(self._load_records())
+
+    def rebuild(self, chunks: list[Embedding]) -> int:
+        records = [
+            {
+                "episode_id": chunk.episode_id,
+                "transcription_id": chunk.transcription_id,
+                "chunk_index": chunk.chunk_index,
+                "chunk_text": chunk.chunk_text,
+                "created_at": chunk.created_at.isoformat(),
+                "metadata": chunk.metadata or {},
+            }
+            for chunk in chunks
+        ]
+        index = BM25Index.build(tokenize(record["chunk_text"]) for record in records)
+
+        # Se escribe a ficheros temporales y se renombran: una búsqueda
+        # concurrente ve el índice anterior o el nuevo, nunca uno a medias
+        records_path = self._path(self.RECORDS_FILE)
+        with open(f"{records_path}.tmp", "w", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in records
+            )
+        index_path = self._path(self.INDEX_FILE)
+        index.save(f"{index_path}.tmp")
+        os.replace(f"{records_path}.tmp", records_path)
+        os.replace(f"{index_path}.tmp", index_path)
+
+        self._index, self._records, self._metadata_index = index, records, None
+        self.logger.info(
+            f"Lexical index rebuilt: {len(records)} chunks, {len(index.terms)} terms"
+        )
+        return len(records)
+
+    def search(
+        self, query: str, top_k: int = 10, filter_metadata: Optional[dict] = None
+    ) -> list[Embedding]:
+        if self.count() == 0:
+            return []
+
+        docs = self._filter_docs(filter_metadata) if filter_metadata else None
+        best, scores = self._load_index().search(tokenize(query), top_k, docs)
+        records = self._load_records()
+        return [
+            self._record_to_embedding(records[doc], score)
+            for doc, score in zip(best, scores)
+        ]
+
+    def _filter_docs(self, filter_metadata: dict) -> np.ndarray:
+        docs, residual = self._get_metadata_index().candidates(filter_metadata)
+        if residual:
+            records = self._load_records()
+            docs = np.asarray(
+                [
+                    doc
+                    for doc in docs
+                    if metadata_contains(records[doc]["metadata"], residual)
+                ],
+                dtype=np.int64,
+            )
+        return docs
+
+    def _get_metadata_index(self) -> MetadataIndex:
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex(
+                enumerate(record["metadata"] for record in self._load_records())
+            )
+        return self._metadata_index
+
+    def _load_index(self) -> BM25Index:
+        if self._index is None:
+            self._index = BM25Index.load(self._path(self.INDEX_FILE))
+        return self._index
+
+    def _load_records(self) -> list[dict]:
+        if self._records is None:
+            path = self._path(self.RECORDS_FILE)
+            if not os.path.exists(path):
+                return []
+            with open(path, encoding="utf-8") as file:
+                self._records = [json.loads(line) for line in file if line.strip()]
+        return self._records
+
+    def _record_to_embedding(self, record: dict, score: float) -> Embedding:
+        metadata = dict(record["metadata"])
+        metadata["bm25_score"] = float(score)
+        return Embedding(
+            episode_id=record["episode_id"],
+            transcription_id=record["transcription_id"],
+            vector=[],
+            model_name="bm25",
+            created_at=datetime.fromisoformat(record["created_at"]),
+            chunk_index=record["chunk_index"],
+            chunk_text=record["chunk_text"],
+            metadata=metadata,
+        )
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.base_path, name)
@@ -0,0 +1,112 @@
+import json
+import os
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy as np
+
+from ...domain.entities.text_match import TextMatch
+from ...domain.entities.transcription import Transcription
+from ...domain.repositories.positional_index_repository import (
+    PositionalIndexRepository,
+)
+from ...shared.logger import get_logger
+from ...shared.positional_index import PositionalIndex
+from ...shared.semantic_chunker import estimate_timestamp_minutes
+
+
+class LocalPositionalIndexRepository(PositionalIndexRepository):
+    """Índice posicional de las transcripciones en disco.
+
+    Junto al índice (`PositionalIndex` en un `.npz`) se guarda, por
+    documento, el id del episodio y lo necesario para estimar el timestamp de
+    un offset igual que `SemanticChunker`: longitud del texto y palabras.
+    """
+
+    INDEX_FILE = "positions.npz"
+    DOCUMENTS_FILE = "documents.jsonl"
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+        self.logger = get_logger(self.__class__.__name__)
+        os.makedirs(base_path, exist_ok=True)
+
+        self._index: Optional[PositionalIndex] = None
+        self._documents: Optional[list[dict]] = None
+
+    def rebuild(self, transcriptions: Iterable[Transcription]) -> int:
+        documents = []
+
+        def texts():
+            # Una sola pasada: el texto de cada transcripción se suelta al
+            # terminar de indexarla
+            for transcription in transcriptions:
+                text = transcription.text
+                documents.append(
+                    {
+                        "episode_id": transcription.episode_id,
+                        "text_length": len(text),
+                        "total_words": len(text.split()),
+                    }
+                )
+                yield text
+
+        index = PositionalIndex.build(texts())
+
+        documents_path = self._path(self.DOCUMENTS_FILE)
+        with open(f"{documents_path}.tmp", "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(document) + "\n" for document in documents)
+        index_path = self._path(self.INDEX_FILE)
+        index.save(f"{index_path}.tmp")
+        os.replace(f"{documents_path}.tmp", documents_path)
+        os.replace(f"{index_path}.tmp", index_path)
+
+        self._index, self._documents = index, documents
+        self.logger.info(
+            f"Positional index rebuilt: {len(documents)} transcriptions, "
+            f"{len(index.position_gaps)} positions"
+        )
+        return len(documents)
+
+    def find_phrase(self, phrase: str) -> list[TextMatch]:
+        if not self._load_documents():
+            return []
+        return self._to_matches(*self._load_index().phrase(phrase))
+
+    def find_near(self, first: str, second: str, distance: int) -> list[TextMatch]:
+        if not self._load_documents():
+            return []
+        return self._to_matches(*self._load_index().near(first, second, distance))
+
+    def _to_matches(self, docs: np.ndarray, chars: np.ndarray) -> list[TextMatch]:
+        documents = self._load_documents()
+        matches = []
+        for doc, char_offset in zip(docs.tolist(), chars.tolist()):
+            document = documents[doc]
+            matches.append(
+                TextMatch(
+                    episode_id=document["episode_id"],
+                    char_offset=char_offset,
+                    estimated_timestamp_minutes=estimate_timestamp_minutes(
+                        char_offset, document["text_length"], document["total_words"]
+                    ),
+                )
+            )
+        return matches
+
+    def _load_index(self) -> PositionalIndex:
+        if self._index is None:
+            self._index = PositionalIndex.load(self._path(self.INDEX_FILE))
+        return self._index
+
+    def _load_documents(self) -> list[dict]:
+        if self._documents is None:
+            path = self._path(self.DOCUMENTS_FILE)
+            if not os.path.exists(path):
+                return []
+            with open(path, encoding="utf-8") as file:
+                self._documents = [json.loads(line) for line in file if line.strip()]
+        return self._documents
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.base_path, name)
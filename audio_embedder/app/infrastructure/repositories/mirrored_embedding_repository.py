@@ -0,0 +1,75 @@
+from typing import Optional
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...shared.logger import get_logger
+
+
+class MirroredEmbeddingRepository(EmbeddingRepository):
+    """Escribe en el repositorio principal y, sólo si la escritura tiene
+    éxito, copia los mismos vectores al espejo. Las lecturas van siempre al
+    principal."""
+
+    def __init__(self, primary: EmbeddingRepository, mirror: EmbeddingRepository):
+        self.primary = primary
+        self.mirror = mirror
+        self.logger = get_logger(self.__class__.__name__)
+
+    def get_by_episode_id(self, episode_id: str) -> list[Embedding]:
+        return self.primary.get_by_episode_id(episode_id)
+
+    def save(self, embedding: Embedding) -> Embedding:
+        self.save_batch([embedding])
+        return embedding
+
+    def save_batch(self, embeddings: list[Embedding]) -> list[Embedding]:
+        saved = self.primary.save_batch(embeddings)
+        try:
+            self.mirror.save_batch(embeddings)
+        except Exception as e:
+            # La fila ya está en el principal; `reconcile` detecta el hueco
+            self.logger.error(f"Error mirroring {len(embeddings)} embeddings: {str(e)}")
+        return saved
+
+    def get_chunk_ids(self, episode_id: str) -> set[str]:
+        return self.primary.get_chunk_ids(episode_id)
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        self.primary.delete_chunks(chunk_ids)
+        try:
+            self.mirror.delete_chunks(chunk_ids)
+        except Exception as e:
+            self.logger.error(
+                f"Error deleting {len(chunk_ids)} mirrored chunks: {str(e)}"
+            )
+
+    def search_similar(
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        return self.primary.search_similar(query_vector, top_k, filter_metadata)
+
+    def search_similar_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[list[Embedding]]:
+        return self.primary.search_similar_many(query_vectors, top_k, filter_metadata)
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        return self.primary.search_similar_in_date_range(
+            query_vector, start_date, end_date, top_k, filter_metadata
+        )
+
+    def get_vectors(self, chunk_ids: list[str]) -> dict[str, list[float]]:
+        return self.primary.get_vectors(chunk_ids)
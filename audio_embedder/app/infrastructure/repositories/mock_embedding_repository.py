@@ -1,7 +1,10 @@
 import os
+from typing import Optional
 
 from ...domain.entities.embedding import Embedding
 from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...shared.episode_dates import episode_date
+from ...shared.metadata_filter import metadata_contains
 
 
 class MockEmbeddingRepository(EmbeddingRepository):
@@ -22,6 +25,30 @@ class MockEmbeddingRepository(EmbeddingRepository):
         return embeddings
 
     def search_similar(
-        self, query_vector: list[float], top_k: int = 10
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
     ) -> list[Embedding]:
-        return self.embeddings[:top_k]
+        embeddings = [
+            emb
+            for emb in self.embeddings
+            if metadata_contains(emb.metadata or {}, filter_metadata or {})
+        ]
+        return embeddings[:top_k]
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        embeddings = [
+            emb
+            for emb in self.embeddings
+            if start_date <= (episode_date(emb.episode_id) or 0) <= end_date
+            and metadata_contains(emb.metadata or {}, filter_metadata or {})
+        ]
+        return embeddings[:top_k]
@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from ...domain.repositories.embedding_cache_repository import (
+    EmbeddingCacheRepository,
+)
+from ...shared.logger import get_logger
+
+
+class SQLiteEmbeddingCacheRepository(EmbeddingCacheRepository):
+    """Caché persistente de vectores indexada por (modelo, hash del texto)"""
+
+    # Límite de variables por sentencia en versiones antiguas de SQLite
+    MAX_VARIABLES = 900
+
+    def __init__(self, file_path: str, table_name: str = "embedding_cache"):
+        self.file_path = file_path
+        self.table_name = table_name
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # La conexión se comparte entre las etapas del pipeline de embeddings
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                model_name TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (model_name, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.commit()
+
+    def get_many(
+        self, model_name: str, text_hashes: list[str]
+    ) -> dict[str, list[float]]:
+        found = {}
+        unique_hashes = list(dict.fromkeys(text_hashes))
+
+        for start in range(0, len(unique_hashes), self.MAX_VARIABLES):
+            batch = unique_hashes[start : start + self.MAX_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT text_hash, vector FROM {self.table_name} "
+                    f"WHERE model_name = ? AND text_hash IN ({placeholders})",
+                    [model_name, *batch],
+                ).fetchall()
+            for text_hash, blob in rows:
+                found[text_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+        return found
+
+    def save_many(self, model_name: str, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
+
+        created_at = datetime.now().isoformat()
+        rows = [
+            (
+                model_name,
+                text_hash,
+                np.asarray(vector, dtype=np.float32).tobytes(),
+                created_at,
+            )
+            for text_hash, vector in vectors.items()
+        ]
+        with self._lock:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} "
+                "(model_name, text_hash, vector, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self.connection.commit()
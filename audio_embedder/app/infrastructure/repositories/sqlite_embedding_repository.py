@@ -0,0 +1,373 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...shared.episode_dates import episode_date
+from ...shared.hashing import chunk_id
+from ...shared.logger import get_logger
+from ...shared.metadata_filter import metadata_contains
+from ...shared.metadata_index import MetadataIndex
+from ...shared.product_quantizer import top_k_indices
+
+
+class SQLiteEmbeddingRepository(EmbeddingRepository):
+    """Sustituto local de la tabla `podcast_embeddings` de Supabase.
+
+    Guarda el vector de cada chunk como BLOB float32 y los metadatos como
+    JSON, con el id determinista del chunk como clave para tener la misma
+    semántica de upsert. Los filtros de metadatos siguen la contención
+    `metadata @> filter` de `match_documents`: los valores escalares se
+    resuelven con un índice invertido en memoria y el resto (objetos, arrays)
+    se comprueba en Python sólo sobre las filas candidatas.
+    Los vectores se cargan una vez en una matriz normalizada y las búsquedas
+    son un producto matriz-vector sobre las filas que pasan el filtro. La
+    fecha de publicación (del id del episodio) es una columna indexada, así
+    que un rango de fechas selecciona las filas antes de puntuarlas.
+    """
+
+    # Límite de variables por sentencia en versiones antiguas de SQLite
+    MAX_VARIABLES = 900
+
+    def __init__(self, file_path: str, table_name: str = "podcast_embeddings"):
+        self.file_path = file_path
+        self.table_name = table_name
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                id TEXT PRIMARY KEY,
+                episode_id TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                model_name TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                publish_date INTEGER
+            )
+            """
+        )
+        self._add_publish_date_column()
+        self.connection.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_episode "
+            f"ON {self.table_name} (episode_id, chunk_index)"
+        )
+        self.connection.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_publish_date "
+            f"ON {self.table_name} (publish_date)"
+        )
+        self.connection.commit()
+
+        self._rowids: Optional[np.ndarray] = None
+        self._matrix: Optional[np.ndarray] = None
+        self._metadata_index: Optional[MetadataIndex] = None
+
+    def get_by_episode_id(self, episode_id: str) -> list[Embedding]:
+        rows = self._fetch(
+            f"SELECT id, episode_id, chunk_index, content, metadata, embedding, "
+            f"model_name, created_at FROM {self.table_name} "
+            "WHERE episode_id = ? ORDER BY chunk_index",
+            [episode_id],
+        )
+        return [self._row_to_embedding(row) for row in rows]
+
+    def get_chunk_ids(self, episode_id: str) -> set[str]:
+        rows = self._fetch(
+            f"SELECT id FROM {self.table_name} WHERE episode_id = ?", [episode_id]
+        )
+        return {row[0] for row in rows}
+
+    def get_chunk_keys(self) -> dict[str, tuple[str, int]]:
+        rows = self._fetch(f"SELECT id, episode_id, chunk_index FROM {self.table_name}")
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def count(self) -> int:
+        return self._fetch(f"SELECT COUNT(*) FROM {self.table_name}")[0][0]
+
+    def save(self, embedding: Embedding) -> Embedding:
+        self.save_batch([embedding])
+        return embedding
+
+    def save_batch(self, embeddings: list[Embedding]) -> list[Embedding]:
+        rows = [self._embedding_to_row(embedding) for embedding in embeddings]
+        with self._lock:
+            self.connection.executemany(
+                f"INSERT INTO {self.table_name} "
+                "(id, episode_id, chunk_index, content, metadata, embedding, "
+                "model_name, created_at, publish_date) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET content = excluded.content, "
+                "metadata = excluded.metadata, embedding = excluded.embedding, "
+                "model_name = excluded.model_name, created_at = excluded.created_at",
+                rows,
+            )
+            self.connection.commit()
+            self._invalidate()
+        return embeddings
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        with self._lock:
+            for start in range(0, len(chunk_ids), self.MAX_VARIABLES):
+                batch = chunk_ids[start : start + self.MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                self.connection.execute(
+                    f"DELETE FROM {self.table_name} WHERE id IN ({placeholders})",
+                    batch,
+                )
+            self.connection.commit()
+            self._invalidate()
+
+    def search_similar(
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        if not query_vector:
+            return []
+
+        rowids, matrix = self._load_matrix()
+        if len(rowids) == 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        if filter_metadata:
+            positions = np.searchsorted(rowids, self._filter_rowids(filter_metadata))
+            scores = matrix[positions] @ query
+        else:
+            positions = None
+            scores = matrix @ query
+
+        best = top_k_indices(scores, top_k)
+        best_rowids = rowids[positions[best] if positions is not None else best]
+        return self._load_by_rowids(best_rowids.tolist(), scores[best].tolist())
+
+    def search_similar_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[list[Embedding]]:
+        """Puntúa todas las consultas con un único producto matriz-matriz"""
+        results: list[list[Embedding]] = [[] for _ in query_vectors]
+        valid = [i for i, vector in enumerate(query_vectors) if vector]
+        rowids, matrix = self._load_matrix()
+        if len(rowids) == 0 or not valid:
+            return results
+
+        queries = np.asarray([query_vectors[i] for i in valid], dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries = queries / norms
+
+        if filter_metadata:
+            positions = np.searchsorted(rowids, self._filter_rowids(filter_metadata))
+            candidate_rowids = rowids[positions]
+            scores = matrix[positions] @ queries.T
+        else:
+            candidate_rowids = rowids
+            scores = matrix @ queries.T
+
+        for column, i in enumerate(valid):
+            best = top_k_indices(scores[:, column], top_k)
+            results[i] = self._load_by_rowids(
+                candidate_rowids[best].tolist(), scores[best, column].tolist()
+            )
+        return results
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        if not query_vector:
+            return []
+
+        rowids, matrix = self._load_matrix()
+        selected = np.asarray(
+            [
+                row[0]
+                for row in self._fetch(
+                    f"SELECT rowid FROM {self.table_name} "
+                    "WHERE publish_date BETWEEN ? AND ? ORDER BY rowid",
+                    [start_date, end_date],
+                )
+            ],
+            dtype=np.int64,
+        )
+        if filter_metadata:
+            selected = np.intersect1d(selected, self._filter_rowids(filter_metadata))
+        if len(selected) == 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        positions = np.searchsorted(rowids, selected)
+        scores = matrix[positions] @ query
+        best = top_k_indices(scores, top_k)
+        return self._load_by_rowids(selected[best].tolist(), scores[best].tolist())
+
+    def _add_publish_date_column(self) -> None:
+        """Migra tablas creadas antes de la columna publish_date"""
+        columns = {
+            row[1]
+            for row in self.connection.execute(f"PRAGMA table_info({self.table_name})")
+        }
+        if "publish_date" in columns:
+            return
+        self.connection.execute(
+            f"ALTER TABLE {self.table_name} ADD COLUMN publish_date INTEGER"
+        )
+        episode_ids = [
+            row[0]
+            for row in self.connection.execute(
+                f"SELECT DISTINCT episode_id FROM {self.table_name}"
+            )
+        ]
+        self.connection.executemany(
+            f"UPDATE {self.table_name} SET publish_date = ? WHERE episode_id = ?",
+            [(episode_date(episode_id), episode_id) for episode_id in episode_ids],
+        )
+
+    def _filter_rowids(self, filter_metadata: dict) -> np.ndarray:
+        """Rowids (ordenados) cuyo metadata contiene `filter_metadata`"""
+        self._load_matrix()
+        rowids, residual = self._metadata_index.candidates(filter_metadata)
+        if not residual or len(rowids) == 0:
+            return rowids
+
+        # Objetos y arrays del filtro: sólo se comprueban en los candidatos
+        matches = []
+        for start in range(0, len(rowids), self.MAX_VARIABLES):
+            batch = rowids[start : start + self.MAX_VARIABLES].tolist()
+            placeholders = ",".join("?" * len(batch))
+            rows = self._fetch(
+                f"SELECT rowid, metadata FROM {self.table_name} "
+                f"WHERE rowid IN ({placeholders})",
+                batch,
+            )
+            matches.extend(
+                rowid
+                for rowid, metadata in rows
+                if metadata_contains(json.loads(metadata), residual)
+            )
+        return np.sort(np.asarray(matches, dtype=np.int64))
+
+    def _load_matrix(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._matrix is None:
+            rows = self._fetch(
+                f"SELECT rowid, embedding, metadata FROM {self.table_name} "
+                "ORDER BY rowid"
+            )
+            rowids = np.asarray([row[0] for row in rows], dtype=np.int64)
+            if rows:
+                matrix = np.stack(
+                    [np.frombuffer(row[1], dtype=np.float32) for row in rows]
+                )
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix = matrix / norms
+            else:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            self._metadata_index = MetadataIndex(
+                (row[0], json.loads(row[2])) for row in rows
+            )
+            self._rowids, self._matrix = rowids, matrix
+        return self._rowids, self._matrix
+
+    def _load_by_rowids(
+        self, rowids: list[int], scores: list[float]
+    ) -> list[Embedding]:
+        if not rowids:
+            return []
+        placeholders = ",".join("?" * len(rowids))
+        rows = self._fetch(
+            f"SELECT rowid, id, episode_id, chunk_index, content, metadata, embedding, "
+            f"model_name, created_at FROM {self.table_name} "
+            f"WHERE rowid IN ({placeholders})",
+            rowids,
+        )
+        by_rowid = {row[0]: row[1:] for row in rows}
+        return [
+            self._row_to_embedding(by_rowid[rowid], score)
+            for rowid, score in zip(rowids, scores)
+        ]
+
+    def _fetch(self, sql: str, params: Optional[list] = None) -> list[tuple]:
+        with self._lock:
+            return self.connection.execute(sql, params or []).fetchall()
+
+    def _invalidate(self) -> None:
+        self._rowids = None
+        self._matrix = None
+        self._metadata_index = None
+
+    def _embedding_to_row(self, embedding: Embedding) -> tuple:
+        if not embedding.vector:
+            raise ValueError(
+                f"Embedding {embedding.episode_id}#{embedding.chunk_index} has no vector"
+            )
+        metadata = embedding.metadata or {}
+        return (
+            metadata.get("chunk_id")
+            or chunk_id(
+                embedding.episode_id,
+                metadata.get("chunker_version", ""),
+                embedding.chunk_index,
+                embedding.chunk_text,
+            ),
+            embedding.episode_id,
+            embedding.chunk_index,
+            embedding.chunk_text,
+            json.dumps(metadata, ensure_ascii=False),
+            np.asarray(embedding.vector, dtype=np.float32).tobytes(),
+            embedding.model_name,
+            embedding.created_at.isoformat(),
+            episode_date(embedding.episode_id),
+        )
+
+    def _row_to_embedding(self, row: tuple, score: Optional[float] = None) -> Embedding:
+        (
+            row_id,
+            episode_id,
+            chunk_index,
+            content,
+            metadata_json,
+            blob,
+            model_name,
+            created_at,
+        ) = row
+        metadata = json.loads(metadata_json)
+        metadata["chunk_id"] = row_id
+        if score is not None:
+            metadata["similarity_score"] = float(score)
+        return Embedding(
+            episode_id=episode_id,
+            transcription_id=episode_id,
+            vector=np.frombuffer(blob, dtype=np.float32).tolist(),
+            model_name=model_name,
+            created_at=datetime.fromisoformat(created_at),
+            chunk_index=chunk_index,
+            chunk_text=content,
+            metadata=metadata,
+        )
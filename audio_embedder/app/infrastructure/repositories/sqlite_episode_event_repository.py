@@ -0,0 +1,106 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from ...domain.entities.episode import Episode
+from ...domain.entities.episode_event import EpisodeEvent
+from ...domain.repositories.episode_event_repository import EpisodeEventRepository
+from ...shared.logger import get_logger
+from .json_episode_repository import episode_from_dict, episode_to_dict
+
+EPISODE_DOWNLOADED = "episode_downloaded"
+
+# El crawler (podcast_crawler/infrastructure/repositories/
+# sqlite_episode_event_repository.py) crea la misma tabla y publica los
+# eventos: si cambia el esquema hay que cambiarlo en los dos
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episode_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    episode_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    consumed_at TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_episode_events_pending
+    ON episode_events (seq) WHERE consumed_at IS NULL;
+"""
+
+
+class SQLiteEpisodeEventRepository(EpisodeEventRepository):
+    """Cola de eventos del crawler en SQLite.
+
+    Un evento se marca como consumido sólo cuando el episodio se ha
+    procesado, así que si el worker se cae se vuelve a entregar (al menos una
+    vez). Tras `MAX_ATTEMPTS` fallos deja de entregarse y queda en la tabla
+    con su último error.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            file_path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.commit()
+
+    def publish_downloaded(self, episode: Episode) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO episode_events (type, episode_id, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    EPISODE_DOWNLOADED,
+                    episode.id,
+                    json.dumps(episode_to_dict(episode), ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ],
+            )
+
+    def pending(self, limit: int = 10, after_seq: int = 0) -> list[EpisodeEvent]:
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT seq, type, payload, attempts FROM episode_events "
+                "WHERE consumed_at IS NULL AND seq > ? AND attempts < ? "
+                "ORDER BY seq LIMIT ?",
+                [after_seq, self.MAX_ATTEMPTS, limit],
+            ).fetchall()
+        return [
+            EpisodeEvent(
+                seq=seq,
+                type=event_type,
+                episode=episode_from_dict(json.loads(payload)),
+                attempts=attempts,
+            )
+            for seq, event_type, payload, attempts in rows
+        ]
+
+    def ack(self, seq: int) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "UPDATE episode_events SET consumed_at = ? WHERE seq = ?",
+                [datetime.now().isoformat(), seq],
+            )
+
+    def fail(self, seq: int, error: str) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "UPDATE episode_events SET attempts = attempts + 1, last_error = ? "
+                "WHERE seq = ?",
+                [error, seq],
+            )
+        self.logger.warning(f"Event {seq} failed: {error}")
@@ -0,0 +1,182 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import Optional
+
+from ...domain.entities.episode import Episode
+from ...domain.entities.episode_job import EpisodeJob
+from ...domain.repositories.episode_job_queue import EpisodeJobQueue
+from ...shared.logger import get_logger
+from .json_episode_repository import episode_from_dict, episode_to_dict
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class SQLiteEpisodeJobQueue(EpisodeJobQueue):
+    """Cola de episodios por transcribir con leases, compartida por varios
+    workers a través de un fichero SQLite.
+
+    `claim` reserva un episodio dentro de una transacción `BEGIN IMMEDIATE`,
+    así que dos workers nunca reciben el mismo. El lease caduca si su worker
+    deja de renovarlo (`heartbeat`) y el episodio vuelve a estar disponible.
+    Tras `MAX_ATTEMPTS` reservas sin éxito queda como `failed`.
+
+    Los leases usan el reloj de cada worker: en varias máquinas tienen que
+    estar sincronizados, y el fichero debe estar en un sistema de ficheros
+    con bloqueos fiables.
+    """
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Transacciones explícitas: `claim` necesita BEGIN IMMEDIATE
+        self.connection = sqlite3.connect(
+            file_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS episode_jobs (
+                episode_id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL,
+                worker_id TEXT,
+                lease_expires_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_episode_jobs_status
+                ON episode_jobs (status, lease_expires_at);
+            """
+        )
+
+    def enqueue(self, episodes: Iterable[Episode]) -> int:
+        now = time.time()
+        rows = [
+            (
+                episode.id,
+                json.dumps(episode_to_dict(episode), ensure_ascii=False),
+                PENDING,
+                now,
+            )
+            for episode in episodes
+        ]
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                added = self.connection.executemany(
+                    "INSERT OR IGNORE INTO episode_jobs "
+                    "(episode_id, payload, status, updated_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                ).rowcount
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return added
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[EpisodeJob]:
+        now = time.time()
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Un lease que caduca en el último intento ya no se reparte
+                self.connection.execute(
+                    "UPDATE episode_jobs SET status = ?, worker_id = NULL, "
+                    "lease_expires_at = NULL, last_error = ?, updated_at = ? "
+                    "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                    [FAILED, "lease expired", now, LEASED, now, self.MAX_ATTEMPTS],
+                )
+                row = self.connection.execute(
+                    "SELECT episode_id, payload, worker_id, attempts FROM episode_jobs "
+                    "WHERE (status = ? OR (status = ? AND lease_expires_at < ?)) "
+                    "AND attempts < ? ORDER BY rowid LIMIT 1",
+                    [PENDING, LEASED, now, self.MAX_ATTEMPTS],
+                ).fetchone()
+                if row is not None:
+                    self.connection.execute(
+                        "UPDATE episode_jobs SET status = ?, worker_id = ?, "
+                        "lease_expires_at = ?, attempts = attempts + 1, "
+                        "updated_at = ? WHERE episode_id = ?",
+                        [LEASED, worker_id, now + lease_seconds, now, row[0]],
+                    )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+
+        episode_id, payload, previous_worker_id, attempts = row
+        if previous_worker_id:
+            self.logger.warning(
+                f"Re-queued {episode_id}: lease of {previous_worker_id} expired"
+            )
+        return EpisodeJob(
+            episode=episode_from_dict(json.loads(payload)),
+            worker_id=worker_id,
+            lease_expires_at=now + lease_seconds,
+            attempts=attempts + 1,
+            previous_worker_id=previous_worker_id,
+        )
+
+    def heartbeat(self, episode_id: str, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        return self._update_own_job(
+            "lease_expires_at = ?, updated_at = ?",
+            [now + lease_seconds, now],
+            episode_id,
+            worker_id,
+        )
+
+    def complete(self, episode_id: str, worker_id: str) -> bool:
+        return self._update_own_job(
+            "status = ?, lease_expires_at = NULL, updated_at = ?",
+            [DONE, time.time()],
+            episode_id,
+            worker_id,
+        )
+
+    def fail(self, episode_id: str, worker_id: str, error: str) -> None:
+        self._update_own_job(
+            "status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "worker_id = NULL, lease_expires_at = NULL, last_error = ?, updated_at = ?",
+            [self.MAX_ATTEMPTS, FAILED, PENDING, error, time.time()],
+            episode_id,
+            worker_id,
+        )
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) FROM episode_jobs GROUP BY status"
+            ).fetchall()
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def _update_own_job(
+        self, assignments: str, params: list, episode_id: str, worker_id: str
+    ) -> bool:
+        """Sólo modifica el trabajo si este worker aún tiene su lease"""
+        with self._lock:
+            cursor = self.connection.execute(
+                f"UPDATE episode_jobs SET {assignments} "
+                "WHERE episode_id = ? AND worker_id = ? AND status = ?",
+                [*params, episode_id, worker_id, LEASED],
+            )
+        return cursor.rowcount == 1
@@ -0,0 +1,149 @@
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Optional
+
+from ...domain.entities.episode import Episode
+from ...domain.repositories.episode_repository import EpisodeRepository, publish_date
+from ...shared.logger import get_logger
+
+_COLUMNS = (
+    "id, title, description, url, published_date, publish_date, "
+    "duration, file_size, local_file_path, podcast"
+)
+
+# El crawler (podcast_crawler/infrastructure/repositories/
+# sqlite_episode_repository.py) crea la misma tabla: si cambia el esquema hay
+# que cambiarlo en los dos
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_date TEXT NOT NULL,
+    publish_date INTEGER NOT NULL,
+    duration INTEGER,
+    file_size INTEGER,
+    local_file_path TEXT,
+    podcast TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_url ON episodes (url);
+CREATE INDEX IF NOT EXISTS idx_episodes_publish_date ON episodes (publish_date);
+"""
+
+# Sólo se reescribe una fila si algo ha cambiado, así que repetir el crawl
+# no toca las filas que ya estaban
+_UPSERT = f"""
+INSERT INTO episodes ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    url = excluded.url,
+    published_date = excluded.published_date,
+    publish_date = excluded.publish_date,
+    duration = excluded.duration,
+    file_size = excluded.file_size,
+    local_file_path = excluded.local_file_path,
+    podcast = excluded.podcast
+WHERE (title, description, url, published_date, duration, file_size,
+       local_file_path, podcast)
+   IS NOT (excluded.title, excluded.description, excluded.url,
+           excluded.published_date, excluded.duration, excluded.file_size,
+           excluded.local_file_path, excluded.podcast)
+"""
+
+
+class SQLiteEpisodeRepository(EpisodeRepository):
+    """Catálogo de episodios compartido con podcast_crawler.
+
+    El crawler escribe los episodios en esta base y el embedder los lee de
+    la misma, sin pasar por `episodes.json`. Id, URL y fecha de publicación
+    están indexados, y cada consulta ve lo último que ha escrito el crawler
+    sin releer el catálogo entero.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            file_path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.commit()
+
+    def get_all(self) -> list[Episode]:
+        # Del más reciente al más antiguo, como en episodes.json
+        return self._select("ORDER BY published_date DESC")
+
+    def get_by_id(self, episode_id: str) -> Optional[Episode]:
+        episodes = self._select("WHERE id = ?", [episode_id])
+        return episodes[0] if episodes else None
+
+    def get_by_url(self, url: str) -> Optional[Episode]:
+        episodes = self._select("WHERE url = ? LIMIT 1", [url])
+        return episodes[0] if episodes else None
+
+    def get_published_between(self, start_date: int, end_date: int) -> list[Episode]:
+        return self._select(
+            "WHERE publish_date BETWEEN ? AND ? ORDER BY published_date",
+            [start_date, end_date],
+        )
+
+    def save(self, episode: Episode) -> Episode:
+        self.save_many([episode])
+        return episode
+
+    def save_many(self, episodes: Iterable[Episode]) -> int:
+        # Un mismo audio puede aparecer en dos feeds con el mismo id: se queda
+        # la última aparición, como en el índice de JSONEpisodeRepository
+        rows = {episode.id: self._episode_to_row(episode) for episode in episodes}
+        with self._lock:
+            with self.connection:
+                changed = self.connection.executemany(_UPSERT, rows.values()).rowcount
+        self.logger.info(f"Saved {changed} new or changed episodes to {self.file_path}")
+        return changed
+
+    def _select(self, where: str, params: Optional[list] = None) -> list[Episode]:
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT {_COLUMNS} FROM episodes {where}", params or []
+            ).fetchall()
+        return [self._row_to_episode(row) for row in rows]
+
+    def _episode_to_row(self, episode: Episode) -> list:
+        return [
+            episode.id,
+            episode.title,
+            episode.description,
+            episode.url,
+            episode.published_date.isoformat(),
+            publish_date(episode),
+            episode.duration,
+            episode.file_size,
+            episode.local_file_path,
+            json.dumps(episode.podcast) if episode.podcast is not None else None,
+        ]
+
+    def _row_to_episode(self, row: tuple) -> Episode:
+        return Episode(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            url=row[3],
+            published_date=datetime.fromisoformat(row[4].replace("Z", "+00:00")),
+            duration=row[6],
+            file_size=row[7],
+            local_file_path=row[8],
+            podcast=json.loads(row[9]) if row[9] is not None else None,
+        )
@@ -0,0 +1,81 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+from ...domain.entities.episode_stats import EpisodeStats
+from ...domain.repositories.episode_stats_repository import EpisodeStatsRepository
+from ...shared.logger import get_logger
+
+
+class SQLiteEpisodeStatsRepository(EpisodeStatsRepository):
+    """Estadísticas por episodio calculadas al ingerir, con el id del episodio
+    como clave primaria: leer el resumen de un episodio es una sola fila"""
+
+    def __init__(self, file_path: str, table_name: str = "episode_stats"):
+        self.file_path = file_path
+        self.table_name = table_name
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                episode_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                chunks_count INTEGER NOT NULL,
+                total_words INTEGER NOT NULL,
+                duration_minutes REAL NOT NULL,
+                chunk_types TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.commit()
+
+    def get(self, episode_id: str) -> Optional[EpisodeStats]:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT episode_id, title, chunks_count, total_words, "
+                f"duration_minutes, chunk_types, updated_at FROM {self.table_name} "
+                "WHERE episode_id = ?",
+                [episode_id],
+            ).fetchone()
+        if row is None:
+            return None
+        return EpisodeStats(
+            episode_id=row[0],
+            title=row[1],
+            chunks_count=row[2],
+            total_words=row[3],
+            duration_minutes=row[4],
+            chunk_types=json.loads(row[5]),
+            updated_at=datetime.fromisoformat(row[6]),
+        )
+
+    def save(self, stats: EpisodeStats) -> EpisodeStats:
+        with self._lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} "
+                "(episode_id, title, chunks_count, total_words, duration_minutes, "
+                "chunk_types, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    stats.episode_id,
+                    stats.title,
+                    stats.chunks_count,
+                    stats.total_words,
+                    stats.duration_minutes,
+                    json.dumps(stats.chunk_types, ensure_ascii=False),
+                    stats.updated_at.isoformat(),
+                ],
+            )
+            self.connection.commit()
+        return stats
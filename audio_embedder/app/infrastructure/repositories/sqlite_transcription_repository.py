@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Optional
+
+from ...domain.entities.transcription import Transcription
+from ...domain.entities.transcription_handle import TranscriptionHandle
+from ...domain.repositories.transcription_repository import TranscriptionRepository
+from ...shared.logger import get_logger
+
+_COLUMNS = "episode_id, text, language, created_at, duration, file_path"
+
+
+class SQLiteTranscriptionRepository(TranscriptionRepository):
+    """Todas las transcripciones en una sola base SQLite.
+
+    El id del episodio es la clave primaria: leer una transcripción o
+    comprobar si existe es una búsqueda en el índice, sin listar ningún
+    directorio. `iter_all` pagina por clave, así que sólo hay un lote de
+    textos en memoria y no se bloquea la base mientras se procesan;
+    `iter_handles` ni siquiera lee los textos hasta que se piden.
+
+    Como `FileTranscriptionRepository`, guardar una transcripción que ya
+    existe no la sobrescribe.
+    """
+
+    ITER_BATCH_SIZE = 16
+
+    def __init__(self, file_path: str, table_name: str = "transcriptions"):
+        self.file_path = file_path
+        self.table_name = table_name
+        self.logger = get_logger(self.__class__.__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(file_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Tabla con rowid: los textos largos no caben bien en una WITHOUT ROWID
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                episode_id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                language TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                duration INTEGER NOT NULL,
+                file_path TEXT
+            )
+            """
+        )
+        self.connection.commit()
+
+    def get_by_episode_id(self, episode_id: str) -> Optional[Transcription]:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {_COLUMNS} FROM {self.table_name} WHERE episode_id = ?",
+                [episode_id],
+            ).fetchone()
+        return self._row_to_transcription(row) if row else None
+
+    def exists(self, episode_id: str) -> bool:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT 1 FROM {self.table_name} WHERE episode_id = ?", [episode_id]
+            ).fetchone()
+        return row is not None
+
+    def save(self, transcription: Transcription) -> Transcription:
+        with self._lock:
+            cursor = self.connection.execute(
+                f"INSERT OR IGNORE INTO {self.table_name} ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    transcription.episode_id,
+                    transcription.text,
+                    transcription.language,
+                    transcription.created_at.isoformat(),
+                    transcription.duration,
+                    transcription.file_path,
+                ],
+            )
+            self.connection.commit()
+
+        if cursor.rowcount == 0:
+            self.logger.info(
+                f"Transcription already exists for episode {transcription.episode_id}, "
+                f"skipping save to preserve existing data"
+            )
+            return self.get_by_episode_id(transcription.episode_id) or transcription
+
+        self.logger.info(f"Transcription saved for episode {transcription.episode_id}")
+        return transcription
+
+    def get_all(self) -> list[Transcription]:
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[Transcription]:
+        last_episode_id = ""
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT {_COLUMNS} FROM {self.table_name} "
+                    "WHERE episode_id > ? ORDER BY episode_id LIMIT ?",
+                    [last_episode_id, self.ITER_BATCH_SIZE],
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._row_to_transcription(row)
+            last_episode_id = rows[-1][0]
+
+    def iter_handles(self) -> Iterator[TranscriptionHandle]:
+        last_episode_id = ""
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    "SELECT episode_id, length(text), duration, language, "
+                    f"created_at, file_path FROM {self.table_name} "
+                    "WHERE episode_id > ? ORDER BY episode_id LIMIT ?",
+                    [last_episode_id, self.ITER_BATCH_SIZE],
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield TranscriptionHandle(
+                    episode_id=row[0],
+                    size=row[1],
+                    duration=row[2],
+                    language=row[3],
+                    created_at=datetime.fromisoformat(row[4]),
+                    file_path=row[5],
+                    load_text=lambda episode_id=row[0]: self._get_text(episode_id),
+                )
+            last_episode_id = rows[-1][0]
+
+    def _get_text(self, episode_id: str) -> str:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT text FROM {self.table_name} WHERE episode_id = ?",
+                [episode_id],
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"Transcription {episode_id} no longer exists")
+        return row[0]
+
+    def _row_to_transcription(self, row: tuple) -> Transcription:
+        return Transcription(
+            episode_id=row[0],
+            text=row[1],
+            language=row[2],
+            created_at=datetime.fromisoformat(row[3]),
+            duration=row[4],
+            file_path=row[5],
+        )
@@ -0,0 +1,200 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from postgrest import ReturnMethod
+from supabase import Client, create_client
+
+from ...domain.entities.embedding import Embedding
+from ...domain.repositories.embedding_repository import EmbeddingRepository
+from ...shared.hashing import chunk_id
+from ...shared.logger import get_logger
+
+
+class SupabaseEmbeddingRepository(EmbeddingRepository):
+    """Escribe y lee vectores ya calculados en la tabla pgvector de Supabase.
+
+    Las inserciones van directamente por PostgREST en lotes, sin pasar por el
+    modelo de embeddings, y no piden que la base de datos devuelva las filas
+    insertadas. Cualquier servidor compatible con PostgREST (un Supabase local
+    o un stand-in) sirve como destino.
+
+    El id de cada fila es el id determinista del chunk, así que volver a
+    escribir un chunk actualiza su fila en lugar de duplicarla.
+    """
+
+    # Máximo de filas por página de PostgREST y de ids por filtro `in`
+    PAGE_SIZE = 1000
+    IN_FILTER_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        client: Client,
+        table_name: str = "podcast_embeddings",
+        query_name: str = "match_documents",
+        date_range_query_name: str = "match_documents_by_date",
+        write_batch_size: int = 500,
+    ):
+        self.client = client
+        self.table_name = table_name
+        self.query_name = query_name
+        self.date_range_query_name = date_range_query_name
+        self.write_batch_size = write_batch_size
+        self.logger = get_logger(self.__class__.__name__)
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "SupabaseEmbeddingRepository":
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_KEY")
+        if not supabase_url or not supabase_key:
+            raise ValueError("SUPABASE_URL y SUPABASE_KEY deben estar configurados")
+        return cls(create_client(supabase_url, supabase_key), **kwargs)
+
+    def get_by_episode_id(self, episode_id: str) -> list[Embedding]:
+        rows = self._select_all(
+            "id, content, metadata",
+            lambda query: query.eq("metadata->>episode_id", episode_id),
+        )
+        embeddings = [self._row_to_embedding(row) for row in rows]
+        return sorted(embeddings, key=lambda embedding: embedding.chunk_index)
+
+    def save(self, embedding: Embedding) -> Embedding:
+        self.save_batch([embedding])
+        return embedding
+
+    def save_batch(self, embeddings: list[Embedding]) -> list[Embedding]:
+        rows = [self._embedding_to_row(embedding) for embedding in embeddings]
+        for start in range(0, len(rows), self.write_batch_size):
+            self.client.table(self.table_name).upsert(
+                rows[start : start + self.write_batch_size],
+                returning=ReturnMethod.minimal,
+            ).execute()
+        return embeddings
+
+    def search_similar(
+        self,
+        query_vector: list[float],
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        params: dict[str, Any] = {"query_embedding": query_vector}
+        if filter_metadata:
+            # match_documents filtra con `metadata @> filter`
+            params["filter"] = filter_metadata
+        query_builder = self.client.rpc(self.query_name, params)
+        query_builder.params = query_builder.params.set("limit", top_k)
+        response = query_builder.execute()
+        return [self._row_to_embedding(row) for row in response.data]
+
+    def search_similar_in_date_range(
+        self,
+        query_vector: list[float],
+        start_date: int,
+        end_date: int,
+        top_k: int = 10,
+        filter_metadata: Optional[dict] = None,
+    ) -> list[Embedding]:
+        # El rango se resuelve en la base de datos con el índice sobre
+        # publish_date (ver sql/match_documents_by_date.sql)
+        params: dict[str, Any] = {
+            "query_embedding": query_vector,
+            "start_date": start_date,
+            "end_date": end_date,
+            "match_count": top_k,
+        }
+        if filter_metadata:
+            params["filter"] = filter_metadata
+        response = self.client.rpc(self.date_range_query_name, params).execute()
+        return [self._row_to_embedding(row) for row in response.data]
+
+    def get_chunk_ids(self, episode_id: str) -> set[str]:
+        rows = self._select_all(
+            "id", lambda query: query.eq("metadata->>episode_id", episode_id)
+        )
+        return {row["id"] for row in rows}
+
+    def get_vectors(self, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Vectores de los chunks indicados; `match_documents` no los devuelve"""
+        vectors = {}
+        for start in range(0, len(chunk_ids), self.IN_FILTER_BATCH_SIZE):
+            response = (
+                self.client.table(self.table_name)
+                .select("id, embedding")
+                .in_("id", chunk_ids[start : start + self.IN_FILTER_BATCH_SIZE])
+                .execute()
+            )
+            for row in response.data:
+                embedding = row["embedding"]
+                # PostgREST serializa las columnas pgvector como texto "[...]"
+                if isinstance(embedding, str):
+                    embedding = json.loads(embedding)
+                vectors[row["id"]] = embedding
+        return vectors
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        for start in range(0, len(chunk_ids), self.IN_FILTER_BATCH_SIZE):
+            self.client.table(self.table_name).delete(
+                returning=ReturnMethod.minimal
+            ).in_("id", chunk_ids[start : start + self.IN_FILTER_BATCH_SIZE]).execute()
+
+    def get_chunk_keys(self) -> dict[str, tuple[str, int]]:
+        """Mapa id de chunk -> (episode_id, chunk_index) de todas las filas remotas"""
+        rows = self._select_all(
+            "id, episode_id:metadata->>episode_id, chunk_index:metadata->chunk_index"
+        )
+        return {row["id"]: (row["episode_id"], int(row["chunk_index"])) for row in rows}
+
+    def _select_all(
+        self, columns: str, apply_filter: Optional[Callable] = None
+    ) -> list[dict[str, Any]]:
+        rows = []
+        start = 0
+        while True:
+            query = self.client.table(self.table_name).select(columns)
+            if apply_filter:
+                query = apply_filter(query)
+            response = (
+                query.order("id").range(start, start + self.PAGE_SIZE - 1).execute()
+            )
+            rows.extend(response.data)
+            if len(response.data) < self.PAGE_SIZE:
+                return rows
+            start += self.PAGE_SIZE
+
+    def _embedding_to_row(self, embedding: Embedding) -> dict[str, Any]:
+        if not embedding.vector:
+            raise ValueError(
+                f"Embedding {embedding.episode_id}#{embedding.chunk_index} has no vector"
+            )
+        metadata = embedding.metadata or {}
+        return {
+            "id": metadata.get("chunk_id")
+            or chunk_id(
+                embedding.episode_id,
+                metadata.get("chunker_version", ""),
+                embedding.chunk_index,
+                embedding.chunk_text,
+            ),
+            "content": embedding.chunk_text,
+            "embedding": embedding.vector,
+            "metadata": metadata,
+        }
+
+    def _row_to_embedding(self, row: dict[str, Any]) -> Embedding:
+        metadata = dict(row.get("metadata") or {})
+        if "id" in row:
+            metadata["chunk_id"] = row["id"]
+        if "similarity" in row:
+            metadata["similarity_score"] = row["similarity"]
+        episode_id = metadata.get("episode_id", "")
+        return Embedding(
+            episode_id=episode_id,
+            transcription_id=episode_id,
+            vector=[],
+            model_name=metadata.get("model_name", ""),
+            created_at=datetime.now(),
+            chunk_index=metadata.get("chunk_index", 0),
+            chunk_text=row.get("content", ""),
+            metadata=metadata,
+        )
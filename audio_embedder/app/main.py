@@ -1,25 +1,11 @@
 import argparse
+import json
 import os
+import socket
+import sys
+
 from dotenv import load_dotenv
 
-from .application.use_cases.process_episodes import ProcessEpisodesUseCase
-from .application.use_cases.search_episodes import SearchEpisodesUseCase
-from .application.use_cases.transcriptions_to_embeddings import TranscriptionsToEmbeddingsUseCase
-from .application.use_cases.search_supabase import SearchSupabaseUseCase
-from .infrastructure.embedder.mock_embedding_service import MockEmbeddingService
-from .infrastructure.embedder.supabase_embedding_service import SupabaseEmbeddingService
-from .infrastructure.repositories.file_transcription_repository import (
-    FileTranscriptionRepository,
-)
-from .infrastructure.repositories.json_episode_repository import JSONEpisodeRepository
-from .infrastructure.repositories.mock_embedding_repository import (
-    MockEmbeddingRepository,
-)
-from .infrastructure.repositories.file_cost_repository import FileCostRepository
-from .infrastructure.transcriptor.mock_audio_transcriptor import MockAudioTranscriptor
-from .infrastructure.transcriptor.openai_audio_transcriptor import (
-    OpenAIAudioTranscriptor,
-)
 from .shared.logger import get_logger
 
 data_dir = "../data"
@@ -27,17 +13,794 @@ data_dir = "../data"
 
 load_dotenv(override=True)
 
-if not os.environ.get("OPENAI_API_KEY"):
-    os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY")
+# Cada comando importa y construye sólo lo que usa: LangChain, Supabase,
+# OpenAI y numpy tardan en importarse y no todos los comandos los necesitan.
 
 
-def main():
+def build_embedding_repository(args):
+    if args.embedding_store == "local" or args.command == "train-pq":
+        from .infrastructure.repositories.local_embedding_repository import (
+            LocalEmbeddingRepository,
+        )
+
+        return LocalEmbeddingRepository(
+            args.embeddings_dir, use_pq=args.use_pq, rerank_candidates=args.pq_rerank
+        )
+
+    from .infrastructure.repositories.mock_embedding_repository import (
+        MockEmbeddingRepository,
+    )
+
+    return MockEmbeddingRepository(args.embeddings_dir)
+
+
+def build_audio_transcriptor(args, logger):
+    if args.transcriptor == "openai":
+        from .infrastructure.repositories.file_cost_repository import FileCostRepository
+        from .infrastructure.transcriptor.openai_audio_transcriptor import (
+            OpenAIAudioTranscriptor,
+        )
+
+        cost_repository = FileCostRepository(args.costs_dir)
+        logger.info("Using OpenAI transcriptor with cost tracking")
+        return OpenAIAudioTranscriptor(cost_repository=cost_repository), cost_repository
+
+    from .infrastructure.transcriptor.mock_audio_transcriptor import (
+        MockAudioTranscriptor,
+    )
+
+    logger.info("Using mock transcriptor")
+    return MockAudioTranscriptor(), None
+
+
+def build_transcription_repository(args):
+    if args.transcription_store == "sqlite":
+        from .infrastructure.repositories.sqlite_transcription_repository import (
+            SQLiteTranscriptionRepository,
+        )
+
+        return SQLiteTranscriptionRepository(args.transcriptions_db_file)
+
+    from .infrastructure.repositories.file_transcription_repository import (
+        FileTranscriptionRepository,
+    )
+
+    return FileTranscriptionRepository(
+        args.transcriptions_dir, compression=args.transcript_compression
+    )
+
+
+def build_episode_repository(args):
+    if args.episode_store == "sqlite":
+        from .infrastructure.repositories.sqlite_episode_repository import (
+            SQLiteEpisodeRepository,
+        )
+
+        return SQLiteEpisodeRepository(args.episodes_db_file)
+
+    from .infrastructure.repositories.json_episode_repository import (
+        JSONEpisodeRepository,
+    )
+
+    return JSONEpisodeRepository(args.episodes_file)
+
+
+def build_query_cache(args, model_name: str):
+    from .application.services.query_embedding_cache import QueryEmbeddingCache
+
+    disk_cache = None
+    if not args.no_embedding_cache:
+        from .infrastructure.repositories.sqlite_embedding_cache_repository import (
+            SQLiteEmbeddingCacheRepository,
+        )
+
+        disk_cache = SQLiteEmbeddingCacheRepository(
+            args.embedding_cache_file, table_name="query_embedding_cache"
+        )
+    return QueryEmbeddingCache(model_name, disk_cache)
+
+
+def build_vector_repository(args):
+    """Almacén de vectores del flujo Supabase; None usa la tabla de Supabase"""
+    if args.vector_backend == "sqlite":
+        from .infrastructure.repositories.sqlite_embedding_repository import (
+            SQLiteEmbeddingRepository,
+        )
+
+        return SQLiteEmbeddingRepository(args.vector_db_file)
+    return None
+
+
+def build_embeddings(args):
+    """Embeddings falsos deterministas para medir sin llamar a OpenAI"""
+    if args.mock_embeddings:
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+
+        return DeterministicFakeEmbedding(size=1536)
+    return None
+
+
+def build_stats_repository(args):
+    from .infrastructure.repositories.sqlite_episode_stats_repository import (
+        SQLiteEpisodeStatsRepository,
+    )
+
+    return SQLiteEpisodeStatsRepository(args.stats_db_file)
+
+
+def build_embedding_service(args, logger, save_stats: bool = False):
+    """`save_stats` sólo lo activan los comandos que ingieren episodios: las
+    búsquedas no abren la base de datos de estadísticas"""
+    from .infrastructure.embedder.mock_embedding_service import MockEmbeddingService
+
+    if not args.use_supabase:
+        logger.info("Using mock embedding service")
+        return MockEmbeddingService()
+
+    from .infrastructure.embedder.supabase_embedding_service import (
+        SupabaseEmbeddingService,
+    )
+    from .infrastructure.repositories.local_embedding_repository import (
+        LocalEmbeddingRepository,
+    )
+    from .infrastructure.repositories.sqlite_embedding_cache_repository import (
+        SQLiteEmbeddingCacheRepository,
+    )
+
+    try:
+        embedding_cache = (
+            None
+            if args.no_embedding_cache
+            else SQLiteEmbeddingCacheRepository(args.embedding_cache_file)
+        )
+        embedding_service = SupabaseEmbeddingService(
+            embedding_cache=embedding_cache,
+            query_cache=build_query_cache(args, SupabaseEmbeddingService.MODEL_NAME),
+            embedding_repository=build_vector_repository(args),
+            local_mirror=(
+                None
+                if args.no_local_mirror or args.vector_backend != "supabase"
+                else LocalEmbeddingRepository(args.embeddings_dir)
+            ),
+            embed_workers=args.embedding_workers,
+            embeddings=build_embeddings(args),
+            stats_repository=build_stats_repository(args) if save_stats else None,
+        )
+        logger.info(f"Using Supabase embedding service ({args.vector_backend} backend)")
+        return embedding_service
+    except ValueError as e:
+        logger.error(f"Failed to initialize Supabase: {e}")
+        logger.info("Falling back to mock embedding service")
+        return MockEmbeddingService()
+
+
+def build_lexical_index(args):
+    from .infrastructure.repositories.local_lexical_index_repository import (
+        LocalLexicalIndexRepository,
+    )
+
+    return LocalLexicalIndexRepository(args.lexical_index_dir)
+
+
+def build_positional_index(args):
+    from .infrastructure.repositories.local_positional_index_repository import (
+        LocalPositionalIndexRepository,
+    )
+
+    return LocalPositionalIndexRepository(args.lexical_index_dir)
+
+
+def build_search_lexical_use_case(args):
+    from .application.use_cases.search_lexical import SearchLexicalUseCase
+
+    return SearchLexicalUseCase(build_lexical_index(args))
+
+
+def build_search_supabase_use_case(args, stats_repository=None):
+    from .application.use_cases.search_supabase import SearchSupabaseUseCase
+
+    return SearchSupabaseUseCase(
+        query_cache=build_query_cache(args, SearchSupabaseUseCase.MODEL_NAME),
+        embedding_repository=build_vector_repository(args),
+        embeddings=build_embeddings(args),
+        mmr_lambda=args.mmr_lambda,
+        mmr_fetch_k=args.mmr_fetch_k,
+        stats_repository=stats_repository,
+        lexical_index=(
+            build_lexical_index(args) if args.search_mode == "hybrid" else None
+        ),
+    )
+
+
+def read_queries(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def write_search_results(args, queries: list[str], results: list[list[dict]]) -> None:
+    """Una línea JSON por consulta en --output-file (o en stdout)"""
+    output = (
+        open(args.output_file, "w", encoding="utf-8")
+        if args.output_file
+        else sys.stdout
+    )
+    try:
+        for query, query_results in zip(queries, results):
+            record = {"query": query, "results": query_results}
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def build_process_episodes_use_case(args, logger):
+    from .application.use_cases.process_episodes import ProcessEpisodesUseCase
+
+    audio_transcriptor, cost_repository = build_audio_transcriptor(args, logger)
+    return ProcessEpisodesUseCase(
+        build_episode_repository(args),
+        build_transcription_repository(args),
+        build_embedding_repository(args),
+        audio_transcriptor,
+        build_embedding_service(args, logger, save_stats=True),
+        cost_repository,
+    )
+
+
+def run_process(args, logger) -> None:
+    use_case = build_process_episodes_use_case(args, logger)
+
+    if args.job_queue and not args.dry_run:
+        run_process_job_queue(args, logger, use_case)
+        return
+
+    if args.dry_run:
+        logger.info("🧪 Starting episode processing in DRY RUN mode...")
+    else:
+        logger.info("Starting episode processing...")
+
+    use_case.execute(dry_run=args.dry_run)
+
+    if args.dry_run:
+        logger.info("🧪 DRY RUN episode processing completed.")
+    else:
+        logger.info("Episode processing completed.")
+
+
+def run_process_job_queue(args, logger, process_episodes) -> None:
+    from .application.use_cases.process_episode_jobs import (
+        ProcessEpisodeJobsUseCase,
+    )
+    from .infrastructure.repositories.sqlite_episode_job_queue import (
+        SQLiteEpisodeJobQueue,
+    )
+
+    logger.info(
+        f"Starting episode processing as worker {args.worker_id} "
+        f"(job queue: {args.jobs_db_file})..."
+    )
+    ProcessEpisodeJobsUseCase(
+        SQLiteEpisodeJobQueue(args.jobs_db_file),
+        process_episodes,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+    ).execute()
+    logger.info("Episode processing completed.")
+
+
+def run_search(args, logger) -> None:
+    from .application.use_cases.search_episodes import SearchEpisodesUseCase
+
+    if not args.query and not args.queries_file:
+        logger.error("Query is required for search command")
+        return
+
+    use_case = SearchEpisodesUseCase(
+        build_embedding_repository(args), build_embedding_service(args, logger)
+    )
+
+    if args.queries_file:
+        queries = read_queries(args.queries_file)
+        logger.info(f"Searching for {len(queries)} queries from {args.queries_file}")
+        results = [
+            [
+                {
+                    "rank": rank,
+                    "episode_id": embedding.episode_id,
+                    "chunk_index": embedding.chunk_index,
+                    "content": embedding.chunk_text,
+                    "similarity_score": (embedding.metadata or {}).get(
+                        "similarity_score"
+                    ),
+                }
+                for rank, embedding in enumerate(embeddings, 1)
+            ]
+            for embeddings in use_case.search_many(queries, args.top_k)
+        ]
+        write_search_results(args, queries, results)
+        return
+
+    logger.info(f"Searching for: {args.query}")
+    results = use_case.execute(args.query, args.top_k)
+
+    for i, result in enumerate(results, 1):
+        logger.info(f"Result {i}: {result.chunk_text[:100]}...")
+
+
+def run_transcriptions_to_embeddings(args, logger) -> None:
+    from .application.use_cases.transcriptions_to_embeddings import (
+        TranscriptionsToEmbeddingsUseCase,
+    )
+
+    if args.dry_run:
+        logger.info("🧪 Starting transcriptions to embeddings processing in DRY RUN mode...")
+    else:
+        logger.info("Starting transcriptions to embeddings processing...")
+
+    use_case = TranscriptionsToEmbeddingsUseCase(
+        build_transcription_repository(args),
+        build_embedding_repository(args),
+        build_embedding_service(args, logger, save_stats=True),
+        use_supabase=args.use_supabase,
+    )
+    use_case.execute(dry_run=args.dry_run)
+
+    if args.dry_run:
+        logger.info("🧪 DRY RUN transcriptions to embeddings processing completed.")
+    else:
+        logger.info("Transcriptions to embeddings processing completed.")
+
+
+def get_episode_summary(args) -> dict:
+    """Lee el resumen materializado, sin embeddings ni búsquedas"""
+    from .application.use_cases.get_episode_summary import GetEpisodeSummaryUseCase
+
+    summary = GetEpisodeSummaryUseCase(build_stats_repository(args)).execute(
+        args.episode_id
+    )
+    return summary or GetEpisodeSummaryUseCase.missing_stats(args.episode_id)
+
+
+def run_search_phrase(args, logger) -> None:
+    from .application.use_cases.search_phrase import SearchPhraseUseCase
+
+    if not args.query and not args.queries_file:
+        logger.error("❌ Query es requerido para el comando search-supabase")
+        return
+
+    use_case = SearchPhraseUseCase(
+        build_positional_index(args),
+        build_transcription_repository(args),
+    )
+    if args.queries_file:
+        queries = read_queries(args.queries_file)
+        logger.info(f"🔤 Buscando {len(queries)} frases de {args.queries_file}")
+        write_search_results(
+            args, queries, use_case.search_many(queries, limit=args.top_k)
+        )
+        return
+
+    matches = use_case.execute(args.query, limit=args.top_k)
+    if not matches:
+        logger.warning("❌ No se encontraron resultados")
+        return
+
+    logger.info("=" * 80)
+    logger.info(f"🔤 APARICIONES DE: '{args.query}'")
+    logger.info("=" * 80)
+    for match in matches:
+        logger.info(
+            f"#{match['rank']} {match['episode_id']} | "
+            f"~{match['estimated_timestamp_minutes']:.1f} min | "
+            f"{match['snippet']}"
+        )
+
+
+def run_search_supabase(args, logger) -> None:
+    try:
+        # Mostrar resumen del episodio si se solicita
+        if args.show_summary and args.episode_id:
+            logger.info(f"📊 Obteniendo resumen del episodio: {args.episode_id}")
+            summary = get_episode_summary(args)
+            if "error" in summary:
+                logger.error(f"❌ {summary['error']}")
+                return
+
+            logger.info("=" * 60)
+            logger.info(f"📋 RESUMEN DEL EPISODIO: {summary['episode_id']}")
+            logger.info("=" * 60)
+            logger.info(f"🎙️  Título: {summary.get('title', 'N/A')}")
+            logger.info(f"📄 Total chunks: {summary.get('chunks_count', 0)}")
+            logger.info(f"📝 Total palabras: {summary.get('total_words', 0)}")
+            logger.info(f"⏱️  Duración estimada: {summary.get('duration_minutes', 0)} minutos")
+            logger.info(f"📊 Promedio palabras/chunk: {summary.get('avg_chunk_words', 0):.1f}")
+
+            chunk_types = summary.get('chunk_types', {})
+            if chunk_types:
+                logger.info("🏷️  Tipos de chunks:")
+                for chunk_type, count in chunk_types.items():
+                    logger.info(f"   - {chunk_type}: {count}")
+            logger.info("=" * 60)
+            return
+
+        if args.search_mode == "phrase":
+            run_search_phrase(args, logger)
+            return
+
+        # La búsqueda léxica no necesita OpenAI ni Supabase
+        search_use_case = (
+            build_search_lexical_use_case(args)
+            if args.search_mode == "lexical"
+            else build_search_supabase_use_case(args)
+        )
+        if args.queries_file:
+            queries = read_queries(args.queries_file)
+            logger.info(f"🔍 Buscando {len(queries)} consultas de {args.queries_file}")
+            filter_metadata = (
+                {"episode_id": args.episode_id} if args.episode_id else None
+            )
+            search_many = (
+                search_use_case.search_hybrid_many
+                if args.search_mode == "hybrid"
+                else search_use_case.search_many
+            )
+            results = search_many(queries, args.top_k, filter_metadata)
+            write_search_results(args, queries, results)
+
+        elif args.group_by_episode:
+            if not args.query:
+                logger.error("❌ Query es requerido para el comando search-supabase")
+                return
+
+            logger.info(f"🔍 Buscando episodios: '{args.query}'")
+            episodes = search_use_case.search_episodes(
+                args.query, args.top_k, aggregation=args.aggregation
+            )
+            if not episodes:
+                logger.warning("❌ No se encontraron resultados")
+                return
+
+            logger.info("=" * 80)
+            logger.info(f"🎙️  EPISODIOS PARA: '{args.query}' ({args.aggregation})")
+            logger.info("=" * 80)
+            for episode in episodes:
+                logger.info(
+                    f"\n🏆 #{episode['rank']} {episode['episode_id']} - "
+                    f"{episode['title']} | score {episode['score']:.3f} | "
+                    f"{episode['matched_chunks']} chunks"
+                )
+                for snippet in episode["snippets"]:
+                    content = snippet["content"][:200].replace("\n", " ")
+                    logger.info(
+                        f"   ⏱️  ~{snippet['estimated_timestamp_minutes']:.1f} min "
+                        f"({snippet['similarity_score']:.3f}): {content}..."
+                    )
+            logger.info("-" * 80)
+
+        else:
+            # Realizar búsqueda normal
+            if not args.query:
+                logger.error("❌ Query es requerido para el comando search-supabase")
+                return
+
+            logger.info(f"🔍 Buscando en Supabase: '{args.query}'")
+
+            if args.search_mode == "hybrid":
+                filter_metadata = (
+                    {"episode_id": args.episode_id} if args.episode_id else None
+                )
+                results = search_use_case.search_hybrid(
+                    args.query, args.top_k, filter_metadata
+                )
+            elif args.start_date or args.end_date:
+                start_date = args.start_date or "00000101"
+                end_date = args.end_date or "99991231"
+                logger.info(f"📅 Filtrando por fechas: {start_date} - {end_date}")
+                filter_metadata = (
+                    {"episode_id": args.episode_id} if args.episode_id else None
+                )
+                results = search_use_case.search_by_date_range(
+                    args.query, start_date, end_date, args.top_k, filter_metadata
+                )
+            elif args.episode_id:
+                logger.info(f"🎯 Filtrando por episodio: {args.episode_id}")
+                results = search_use_case.search_by_episode(args.query, args.episode_id, args.top_k)
+            else:
+                results = search_use_case.execute(args.query, args.top_k)
+
+            if not results:
+                logger.warning("❌ No se encontraron resultados")
+                return
+
+            logger.info("=" * 80)
+            logger.info(f"🔍 RESULTADOS DE BÚSQUEDA PARA: '{args.query}'")
+            logger.info("=" * 80)
+
+            for result in results:
+                logger.info(f"\n🏆 RESULTADO #{result['rank']}")
+                logger.info(f"🎙️  Episodio: {result['episode_id']} - {result['title']}")
+                logger.info(f"🏷️  Tipo: {result['chunk_type']}")
+                logger.info(f"⏱️  Timestamp: ~{result['estimated_timestamp_minutes']:.1f} min")
+                logger.info(f"📝 Contenido:")
+
+                # Formatear contenido con mejor legibilidad
+                content = result['content']
+                if len(content) > 500:
+                    content = content[:500] + "..."
+
+                # Dividir en líneas de máximo 80 caracteres
+                words = content.split()
+                lines = []
+                current_line = ""
+
+                for word in words:
+                    if len(current_line + " " + word) <= 76:  # 80 - 4 espacios de indentación
+                        current_line += " " + word if current_line else word
+                    else:
+                        if current_line:
+                            lines.append("    " + current_line)
+                            current_line = word
+                        else:
+                            lines.append("    " + word)
+
+                if current_line:
+                    lines.append("    " + current_line)
+
+                logger.info("\n".join(lines))
+                logger.info("-" * 80)
+
+            logger.info(f"\n✅ Búsqueda completada. {len(results)} resultados encontrados.")
+
+    except ValueError as e:
+        logger.error(f"❌ Error de configuración: {e}")
+        logger.error("💡 Asegúrate de que SUPABASE_URL y SUPABASE_KEY estén configurados")
+    except Exception as e:
+        logger.error(f"❌ Error en búsqueda Supabase: {str(e)}")
+
+
+def run_backfill_stats(args, logger) -> None:
+    from .application.use_cases.backfill_episode_stats import (
+        BackfillEpisodeStatsUseCase,
+    )
+
+    use_case = BackfillEpisodeStatsUseCase(
+        build_transcription_repository(args),
+        build_stats_repository(args),
+    )
+    saved = use_case.execute()
+    logger.info(f"📊 Estadísticas guardadas para {saved} episodios")
+
+
+def run_build_lexical_index(args, logger) -> None:
+    from .application.use_cases.build_lexical_index import BuildLexicalIndexUseCase
+
+    use_case = BuildLexicalIndexUseCase(
+        build_transcription_repository(args),
+        build_lexical_index(args),
+        build_positional_index(args),
+    )
+    indexed = use_case.execute()
+    logger.info(f"🔤 Índice léxico con {indexed} chunks en {args.lexical_index_dir}")
+
+
+def run_migrate_transcriptions(args, logger) -> None:
+    from .application.use_cases.migrate_transcriptions import (
+        MigrateTranscriptionsUseCase,
+    )
+    from .infrastructure.repositories.file_transcription_repository import (
+        FileTranscriptionRepository,
+    )
+    from .infrastructure.repositories.sqlite_transcription_repository import (
+        SQLiteTranscriptionRepository,
+    )
+
+    imported, skipped = MigrateTranscriptionsUseCase(
+        FileTranscriptionRepository(args.transcriptions_dir),
+        SQLiteTranscriptionRepository(args.transcriptions_db_file),
+    ).execute()
+    logger.info(
+        f"📦 {imported} transcripciones importadas a {args.transcriptions_db_file} "
+        f"({skipped} ya existían). Usa --transcription-store sqlite para leerlas"
+    )
+
+
+def run_worker(args, logger) -> None:
+    from .application.use_cases.consume_episode_events import (
+        ConsumeEpisodeEventsUseCase,
+    )
+    from .infrastructure.repositories.sqlite_episode_event_repository import (
+        SQLiteEpisodeEventRepository,
+    )
+
+    use_case = ConsumeEpisodeEventsUseCase(
+        SQLiteEpisodeEventRepository(args.events_db_file),
+        build_process_episodes_use_case(args, logger),
+    )
+    try:
+        use_case.run(poll_interval=args.poll_interval, once=args.once)
+    except KeyboardInterrupt:
+        logger.info("👋 Worker detenido")
+
+
+def run_migrate_episodes(args, logger) -> None:
+    from .application.use_cases.migrate_episodes import MigrateEpisodesUseCase
+    from .infrastructure.repositories.json_episode_repository import (
+        JSONEpisodeRepository,
+    )
+    from .infrastructure.repositories.sqlite_episode_repository import (
+        SQLiteEpisodeRepository,
+    )
+
+    total, changed = MigrateEpisodesUseCase(
+        JSONEpisodeRepository(args.episodes_file),
+        SQLiteEpisodeRepository(args.episodes_db_file),
+    ).execute()
+    logger.info(
+        f"📦 {total} episodios en el catálogo {args.episodes_db_file} "
+        f"({changed} nuevos o cambiados). Usa --episode-store sqlite para leerlos"
+    )
+
+
+def run_compress_transcriptions(args, logger) -> None:
+    from .application.use_cases.compress_transcriptions import (
+        CompressTranscriptionsUseCase,
+    )
+
+    if args.transcription_store != "files":
+        logger.error(
+            "❌ compress-transcriptions sólo aplica a --transcription-store files"
+        )
+        return
+
+    try:
+        CompressTranscriptionsUseCase(build_transcription_repository(args)).execute()
+    except (ImportError, ValueError) as e:
+        logger.error(f"❌ {e}")
+
+
+def run_train_pq(args, logger) -> None:
+    from .application.use_cases.train_product_quantizer import (
+        TrainProductQuantizerUseCase,
+    )
+
+    use_case = TrainProductQuantizerUseCase(build_embedding_repository(args))
+    try:
+        use_case.execute(n_subvectors=args.pq_subvectors)
+        use_case.evaluate(top_k=args.top_k, rerank_candidates=args.pq_rerank)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+
+
+def run_reconcile(args, logger) -> None:
+    from .application.use_cases.reconcile_embeddings import ReconcileEmbeddingsUseCase
+    from .infrastructure.repositories.local_embedding_repository import (
+        LocalEmbeddingRepository,
+    )
+    from .infrastructure.repositories.supabase_embedding_repository import (
+        SupabaseEmbeddingRepository,
+    )
+
+    try:
+        use_case = ReconcileEmbeddingsUseCase(
+            LocalEmbeddingRepository(args.embeddings_dir),
+            SupabaseEmbeddingRepository.from_env(),
+        )
+        use_case.execute()
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+
+
+def run_serve(args, logger) -> None:
+    from .infrastructure.http.search_server import SearchServer
+
+    try:
+        # /episodes/{id}/summary lee las estadísticas
+        search_use_case = build_search_supabase_use_case(
+            args, stats_repository=build_stats_repository(args)
+        )
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        return
+
+    SearchServer(search_use_case, host=args.host, port=args.port).run()
+
+
+COMMANDS = {
+    "process": run_process,
+    "search": run_search,
+    "transcriptions-to-embeddings": run_transcriptions_to_embeddings,
+    "search-supabase": run_search_supabase,
+    "train-pq": run_train_pq,
+    "reconcile": run_reconcile,
+    "serve": run_serve,
+    "backfill-stats": run_backfill_stats,
+    "build-lexical-index": run_build_lexical_index,
+    "migrate-transcriptions": run_migrate_transcriptions,
+    "compress-transcriptions": run_compress_transcriptions,
+    "migrate-episodes": run_migrate_episodes,
+    "worker": run_worker,
+}
+
+
+def validate_args(parser: argparse.ArgumentParser, args) -> None:
+    """Rechaza combinaciones de opciones que el comando ignoraría"""
+    if args.command == "search-supabase" and args.search_mode != "vector":
+        # El agrupado por episodio y el filtro de fechas sólo existen en la
+        # búsqueda vectorial
+        unsupported = [
+            flag
+            for flag, value in [
+                ("--group-by-episode", args.group_by_episode),
+                ("--start-date", args.start_date),
+                ("--end-date", args.end_date),
+            ]
+            if value
+        ]
+        if unsupported:
+            parser.error(
+                f"{', '.join(unsupported)} not supported with "
+                f"--search-mode {args.search_mode} (use --search-mode vector)"
+            )
+
+
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="Audio Embedder CLI")
     parser.add_argument(
         "--episodes-file",
         default=os.path.join(data_dir, "episodes.json"),
         help="Path to episodes.json file",
     )
+    parser.add_argument(
+        "--episode-store",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Read episodes from episodes.json or from the SQLite catalog "
+        "shared with podcast_crawler",
+    )
+    parser.add_argument(
+        "--episodes-db-file",
+        default=os.path.join(data_dir, "episodes.sqlite3"),
+        help="SQLite episode catalog used by --episode-store sqlite",
+    )
+    parser.add_argument(
+        "--events-db-file",
+        default=os.path.join(data_dir, "episode_events.sqlite3"),
+        help="SQLite queue where podcast_crawler --publish-events writes "
+        "downloaded episodes (for the worker command)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between queue polls in the worker command",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Worker: process the pending events and exit",
+    )
+    parser.add_argument(
+        "--job-queue",
+        action="store_true",
+        help="Process: claim episodes from a shared lease-based job queue so "
+        "several workers can run in parallel without duplicate transcriptions",
+    )
+    parser.add_argument(
+        "--jobs-db-file",
+        default=os.path.join(data_dir, "episode_jobs.sqlite3"),
+        help="SQLite job queue shared by the workers of --job-queue",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Worker name recorded in the job leases (default: host-pid)",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=600.0,
+        help="Seconds a claimed episode stays reserved without a heartbeat",
+    )
     parser.add_argument(
         "--transcriptions-dir",
         default=os.path.join(data_dir, "transcriptions"),
@@ -55,11 +818,62 @@ def main():
     )
     parser.add_argument(
         "--command",
-        choices=["process", "search", "transcriptions-to-embeddings", "search-supabase"],
+        choices=list(COMMANDS),
         default="process",
         help="Command to execute",
     )
     parser.add_argument("--query", help="Search query (required for search command)")
+    parser.add_argument(
+        "--queries-file",
+        help="File with one query per line, searched in one batch (search commands)",
+    )
+    parser.add_argument(
+        "--output-file",
+        help="JSONL file for --queries-file results (default: stdout)",
+    )
+    parser.add_argument(
+        "--start-date",
+        help="Only search episodes published on or after this date (YYYYMMDD)",
+    )
+    parser.add_argument(
+        "--end-date",
+        help="Only search episodes published on or before this date (YYYYMMDD)",
+    )
+    parser.add_argument(
+        "--group-by-episode",
+        action="store_true",
+        help="Rank episodes instead of chunks (for search-supabase command)",
+    )
+    parser.add_argument(
+        "--aggregation",
+        choices=["max", "softmax-sum", "top-n-mean"],
+        default="max",
+        help="How chunk scores are combined per episode with --group-by-episode",
+    )
+    parser.add_argument(
+        "--search-mode",
+        choices=["vector", "lexical", "hybrid", "phrase"],
+        default="vector",
+        help=(
+            "search-supabase ranking: embeddings, local BM25, both fused by RRF, "
+            'or exact phrase / "a NEAR/k b" matches'
+        ),
+    )
+    parser.add_argument(
+        "--lexical-index-dir",
+        default=os.path.join(data_dir, "lexical_index"),
+        help="Directory of the BM25 index built by --command build-lexical-index",
+    )
+    parser.add_argument(
+        "--mmr-lambda",
+        type=float,
+        help="Diversify search-supabase results with MMR (1 = relevance only)",
+    )
+    parser.add_argument(
+        "--mmr-fetch-k",
+        type=int,
+        help="Candidates fetched before MMR re-ranking (default: 4 * top-k)",
+    )
     parser.add_argument(
         "--top-k", type=int, default=10, help="Number of results to return for search"
     )
@@ -79,6 +893,24 @@ def main():
         action="store_true",
         help="Use Supabase for embeddings storage (requires SUPABASE_URL and SUPABASE_KEY)",
     )
+    parser.add_argument(
+        "--transcription-store",
+        choices=["files", "sqlite"],
+        default="files",
+        help="Read and write transcriptions as JSON files or in one SQLite database",
+    )
+    parser.add_argument(
+        "--transcript-compression",
+        choices=["none", "gzip", "zstd"],
+        default="none",
+        help="Compression for transcription files written by --transcription-store "
+        "files (any format is read back); zstd needs the 'zstandard' package",
+    )
+    parser.add_argument(
+        "--transcriptions-db-file",
+        default=os.path.join(data_dir, "transcriptions.sqlite3"),
+        help="SQLite file used by --transcription-store sqlite",
+    )
     parser.add_argument(
         "--episode-id",
         help="Filter search by specific episode ID (for search-supabase command)",
@@ -88,175 +920,91 @@ def main():
         action="store_true",
         help="Show episode summary instead of search (for search-supabase command)",
     )
+    parser.add_argument(
+        "--stats-db-file",
+        default=os.path.join(data_dir, "episode_stats.sqlite3"),
+        help="SQLite file with per-episode statistics (for --show-summary)",
+    )
+    parser.add_argument(
+        "--embedding-cache-file",
+        default=os.path.join(data_dir, "cache", "embeddings.sqlite3"),
+        help="SQLite file caching embeddings by model and chunk text hash",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Disable the chunk and query embedding caches on disk",
+    )
+    parser.add_argument(
+        "--embedding-store",
+        choices=["mock", "local"],
+        default="mock",
+        help="Embedding repository to use (in-memory mock or local on-disk store)",
+    )
+    parser.add_argument(
+        "--use-pq",
+        action="store_true",
+        help="Search the local store with product-quantized codes",
+    )
+    parser.add_argument(
+        "--pq-subvectors",
+        type=int,
+        default=32,
+        help="Number of PQ sub-vectors, i.e. bytes per code (for train-pq command)",
+    )
+    parser.add_argument(
+        "--pq-rerank",
+        type=int,
+        default=100,
+        help="Candidates re-ranked with exact vectors after a PQ search (0 disables)",
+    )
+    parser.add_argument(
+        "--no-local-mirror",
+        action="store_true",
+        help="Do not mirror vectors sent to Supabase into the local embedding store",
+    )
+    parser.add_argument(
+        "--vector-backend",
+        choices=["supabase", "sqlite"],
+        default="supabase",
+        help="Vector store for --use-supabase and search-supabase (sqlite runs locally)",
+    )
+    parser.add_argument(
+        "--vector-db-file",
+        default=os.path.join(data_dir, "vectors.sqlite3"),
+        help="SQLite file used by --vector-backend sqlite",
+    )
+    parser.add_argument(
+        "--mock-embeddings",
+        action="store_true",
+        help="Use deterministic fake embeddings instead of OpenAI (benchmarking)",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Host to bind (for serve command)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8080, help="Port to listen on (for serve command)"
+    )
+    parser.add_argument(
+        "--embedding-workers",
+        type=int,
+        default=2,
+        help="Concurrent embedding requests while vectors are written to Supabase",
+    )
 
-    args = parser.parse_args()
-
-    logger = get_logger(__name__)
-
-    episode_repository = JSONEpisodeRepository(args.episodes_file)
-    transcription_repository = FileTranscriptionRepository(args.transcriptions_dir)
-    embedding_repository = MockEmbeddingRepository(args.embeddings_dir)
-    cost_repository = FileCostRepository(args.costs_dir)
-
-    if args.transcriptor == "openai":
-        audio_transcriptor = OpenAIAudioTranscriptor(cost_repository=cost_repository)
-        logger.info("Using OpenAI transcriptor with cost tracking")
-    else:
-        audio_transcriptor = MockAudioTranscriptor()
-        logger.info("Using mock transcriptor")
-
-    # Configure embedding service
-    if args.use_supabase:
-        try:
-            embedding_service = SupabaseEmbeddingService()
-            logger.info("Using Supabase embedding service")
-        except ValueError as e:
-            logger.error(f"Failed to initialize Supabase: {e}")
-            logger.info("Falling back to mock embedding service")
-            embedding_service = MockEmbeddingService()
-    else:
-        embedding_service = MockEmbeddingService()
-        logger.info("Using mock embedding service")
-
-    if args.command == "process":
-        if args.dry_run:
-            logger.info("🧪 Starting episode processing in DRY RUN mode...")
-        else:
-            logger.info("Starting episode processing...")
-
-        use_case = ProcessEpisodesUseCase(
-            episode_repository,
-            transcription_repository,
-            embedding_repository,
-            audio_transcriptor,
-            embedding_service,
-            cost_repository if args.transcriptor == "openai" else None,
-        )
-        use_case.execute(dry_run=args.dry_run)
-
-        if args.dry_run:
-            logger.info("🧪 DRY RUN episode processing completed.")
-        else:
-            logger.info("Episode processing completed.")
-
-    elif args.command == "search":
-        if not args.query:
-            logger.error("Query is required for search command")
-            return
-
-        logger.info(f"Searching for: {args.query}")
-        use_case = SearchEpisodesUseCase(embedding_repository, embedding_service)
-        results = use_case.execute(args.query, args.top_k)
-
-        for i, result in enumerate(results, 1):
-            logger.info(f"Result {i}: {result.chunk_text[:100]}...")
+    args = parser.parse_args(argv)
+    validate_args(parser, args)
+    if args.mock_embeddings:
+        # No mezclar vectores falsos con los reales en las cachés de disco
+        args.no_embedding_cache = True
+    return args
 
-    elif args.command == "transcriptions-to-embeddings":
-        if args.dry_run:
-            logger.info("🧪 Starting transcriptions to embeddings processing in DRY RUN mode...")
-        else:
-            logger.info("Starting transcriptions to embeddings processing...")
 
-        use_case = TranscriptionsToEmbeddingsUseCase(
-            transcription_repository,
-            embedding_repository,
-            embedding_service,
-            use_supabase=args.use_supabase,
-        )
-        use_case.execute(dry_run=args.dry_run)
+def main():
+    args = parse_args()
+    logger = get_logger(__name__)
+    COMMANDS[args.command](args, logger)
 
-        if args.dry_run:
-            logger.info("🧪 DRY RUN transcriptions to embeddings processing completed.")
-        else:
-            logger.info("Transcriptions to embeddings processing completed.")
-
-    elif args.command == "search-supabase":
-        try:
-            search_use_case = SearchSupabaseUseCase()
-            
-            # Mostrar resumen del episodio si se solicita
-            if args.show_summary and args.episode_id:
-                logger.info(f"📊 Obteniendo resumen del episodio: {args.episode_id}")
-                summary = search_use_case.get_episode_summary(args.episode_id)
-                
-                logger.info("=" * 60)
-                logger.info(f"📋 RESUMEN DEL EPISODIO: {summary['episode_id']}")
-                logger.info("=" * 60)
-                logger.info(f"🎙️  Título: {summary.get('title', 'N/A')}")
-                logger.info(f"📄 Total chunks: {summary.get('chunks_count', 0)}")
-                logger.info(f"📝 Total palabras: {summary.get('total_words', 0)}")
-                logger.info(f"⏱️  Duración estimada: {summary.get('duration_minutes', 0)} minutos")
-                logger.info(f"📊 Promedio palabras/chunk: {summary.get('avg_chunk_words', 0):.1f}")
-                
-                chunk_types = summary.get('chunk_types', {})
-                if chunk_types:
-                    logger.info("🏷️  Tipos de chunks:")
-                    for chunk_type, count in chunk_types.items():
-                        logger.info(f"   - {chunk_type}: {count}")
-                logger.info("=" * 60)
-                
-            else:
-                # Realizar búsqueda normal
-                if not args.query:
-                    logger.error("❌ Query es requerido para el comando search-supabase")
-                    return
-                
-                logger.info(f"🔍 Buscando en Supabase: '{args.query}'")
-                
-                if args.episode_id:
-                    logger.info(f"🎯 Filtrando por episodio: {args.episode_id}")
-                    results = search_use_case.search_by_episode(args.query, args.episode_id, args.top_k)
-                else:
-                    results = search_use_case.execute(args.query, args.top_k)
-                
-                if not results:
-                    logger.warning("❌ No se encontraron resultados")
-                    return
-                
-                logger.info("=" * 80)
-                logger.info(f"🔍 RESULTADOS DE BÚSQUEDA PARA: '{args.query}'")
-                logger.info("=" * 80)
-                
-                for result in results:
-                    logger.info(f"\n🏆 RESULTADO #{result['rank']}")
-                    logger.info(f"🎙️  Episodio: {result['episode_id']} - {result['title']}")
-                    logger.info(f"🏷️  Tipo: {result['chunk_type']}")
-                    logger.info(f"⏱️  Timestamp: ~{result['estimated_timestamp_minutes']:.1f} min")
-                    logger.info(f"📝 Contenido:")
-                    
-                    # Formatear contenido con mejor legibilidad
-                    content = result['content']
-                    if len(content) > 500:
-                        content = content[:500] + "..."
-                    
-                    # Dividir en líneas de máximo 80 caracteres
-                    words = content.split()
-                    lines = []
-                    current_line = ""
-                    
-                    for word in words:
-                        if len(current_line + " " + word) <= 76:  # 80 - 4 espacios de indentación
-                            current_line += " " + word if current_line else word
-                        else:
-                            if current_line:
-                                lines.append("    " + current_line)
-                                current_line = word
-                            else:
-                                lines.append("    " + word)
-                    
-                    if current_line:
-                        lines.append("    " + current_line)
-                    
-                    logger.info("\n".join(lines))
-                    logger.info("-" * 80)
-                
-                logger.info(f"\n✅ Búsqueda completada. {len(results)} resultados encontrados.")
-                
-        except ValueError as e:
-            logger.error(f"❌ Error de configuración: {e}")
-            logger.error("💡 Asegúrate de que SUPABASE_URL y SUPABASE_KEY estén configurados")
-        except Exception as e:
-            logger.error(f"❌ Error en búsqueda Supabase: {str(e)}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,158 @@
+from collections import Counter
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy as np
+
+from .product_quantizer import top_k_indices
+
+
+class BM25Index:
+    """Índice invertido con puntuación BM25.
+
+    Cada término guarda su lista de documentos como diferencias entre ids
+    consecutivos (la lista está ordenada, así que los huecos son pequeños y
+    caben en el entero más estrecho posible) junto a la frecuencia del término
+    en cada documento. Todas las listas van concatenadas en dos arrays y un
+    array de offsets marca dónde empieza cada término.
+
+    Buscar decodifica sólo las listas de los términos de la consulta
+    (`cumsum` de los huecos) y acumula sus scores en un vector denso.
+    """
+
+    def __init__(
+        self,
+        terms: np.ndarray,
+        offsets: np.ndarray,
+        doc_gaps: np.ndarray,
+        term_freqs: np.ndarray,
+        doc_lengths: np.ndarray,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.terms = terms
+        self.offsets = offsets
+        self.doc_gaps = doc_gaps
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+
+        self._term_ids = {str(term): i for i, term in enumerate(terms)}
+        average_length = doc_lengths.mean() if len(doc_lengths) else 0.0
+        # Parte de la normalización por longitud que sólo depende del documento
+        self._length_norm = (
+            k1 * (1.0 - b + b * doc_lengths / max(average_length, 1.0))
+        ).astype(np.float32)
+
+    @classmethod
+    def build(cls, documents: Iterable[list[str]], **kwargs) -> "BM25Index":
+        """Construye el índice a partir de los tokens de cada documento; el
+        id de un documento es su posición"""
+        postings: dict[str, list[tuple[int, int]]] = {}
+        doc_lengths = []
+        for doc, tokens in enumerate(documents):
+            doc_lengths.append(len(tokens))
+            for term, freq in Counter(tokens).items():
+                postings.setdefault(term, []).append((doc, freq))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        docs, freqs = [], []
+        for i, term in enumerate(terms):
+            term_docs, term_freqs = zip(*postings[term])
+            docs.append(np.diff(term_docs, prepend=0))
+            freqs.append(term_freqs)
+            offsets[i + 1] = offsets[i] + len(term_docs)
+
+        doc_gaps = np.concatenate(docs) if docs else np.empty(0, dtype=np.int64)
+        term_freqs = np.concatenate(freqs) if freqs else np.empty(0, dtype=np.int64)
+        return cls(
+            np.asarray(terms, dtype=str),
+            offsets,
+            narrowest_uint(doc_gaps),
+            narrowest_uint(term_freqs),
+            np.asarray(doc_lengths, dtype=np.float32),
+            **kwargs,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with np.load(path) as data:
+            return cls(
+                data["terms"],
+                data["offsets"],
+                data["doc_gaps"],
+                data["term_freqs"],
+                data["doc_lengths"],
+                k1=float(data["k1"]),
+                b=float(data["b"]),
+            )
+
+    def save(self, path: str) -> None:
+        # savez_compressed escribe en un fichero abierto para no añadir `.npz`
+        with open(path, "wb") as file:
+            np.savez_compressed(
+                file,
+                terms=self.terms,
+                offsets=self.offsets,
+                doc_gaps=self.doc_gaps,
+                term_freqs=self.term_freqs,
+                doc_lengths=self.doc_lengths,
+                k1=self.k1,
+                b=self.b,
+            )
+
+    @property
+    def document_count(self) -> int:
+        return len(self.doc_lengths)
+
+    def postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        """(documentos, frecuencias) del término; vacíos si no aparece"""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        docs = np.cumsum(self.doc_gaps[start:end], dtype=np.int64)
+        return docs, self.term_freqs[start:end].astype(np.float32)
+
+    def scores(self, query_tokens: list[str]) -> np.ndarray:
+        """Score BM25 de la consulta para cada documento"""
+        scores = np.zeros(self.document_count, dtype=np.float32)
+        for term, query_freq in Counter(query_tokens).items():
+            docs, freqs = self.postings(term)
+            if len(docs) == 0:
+                continue
+            idf = np.log1p((self.document_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            # Cada documento aparece una vez por lista: `+=` indexado es seguro
+            scores[docs] += (
+                query_freq
+                * idf
+                * freqs
+                * (self.k1 + 1.0)
+                / (freqs + self._length_norm[docs])
+            )
+        return scores
+
+    def search(
+        self,
+        query_tokens: list[str],
+        top_k: int = 10,
+        docs: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(documentos, scores) de los top_k con score > 0, opcionalmente
+        restringidos a `docs`"""
+        scores = self.scores(query_tokens)
+        candidates = np.flatnonzero(scores > 0)
+        if docs is not None:
+            candidates = np.intersect1d(candidates, docs, assume_unique=True)
+        best = candidates[top_k_indices(scores[candidates], top_k)]
+        return best, scores[best]
+
+
+def narrowest_uint(values: np.ndarray) -> np.ndarray:
+    """El entero sin signo más pequeño que representa todos los valores"""
+    if len(values) == 0:
+        return values.astype(np.uint8)
+    return values.astype(np.min_scalar_type(int(values.max())))
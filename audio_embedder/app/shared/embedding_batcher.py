@@ -0,0 +1,62 @@
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional
+
+
+class EmbeddingBatcher:
+    """Agrupa textos de muchas transcripciones en peticiones de embeddings
+    limitadas por un presupuesto de tokens estimado y por el máximo de inputs
+    por petición de la API"""
+
+    # Límites de la API de embeddings de OpenAI por petición
+    MAX_INPUTS_PER_REQUEST = 2048
+    MAX_TOKENS_PER_REQUEST = 300_000
+    # Límite de contexto por input de text-embedding-3-*
+    MAX_TOKENS_PER_INPUT = 8191
+
+    def __init__(
+        self,
+        max_tokens: int = 250_000,
+        max_inputs: int = MAX_INPUTS_PER_REQUEST,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ):
+        self.max_tokens = min(max_tokens, self.MAX_TOKENS_PER_REQUEST)
+        self.max_inputs = min(max_inputs, self.MAX_INPUTS_PER_REQUEST)
+        self.token_counter = token_counter
+
+    def batches(
+        self, items: Iterable[tuple[Any, str]]
+    ) -> Iterator[list[tuple[Any, str]]]:
+        """Consume pares (referencia, texto) y produce lotes que respetan los
+        límites; cada referencia viaja con su texto para mapear los vectores"""
+        if self.token_counter is None:
+            self.token_counter = default_token_counter()
+
+        batch: list[tuple[Any, str]] = []
+        batch_tokens = 0
+
+        for ref, text in items:
+            tokens = min(self.token_counter(text), self.MAX_TOKENS_PER_INPUT)
+
+            if batch and (
+                batch_tokens + tokens > self.max_tokens or len(batch) >= self.max_inputs
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+
+            batch.append((ref, text))
+            batch_tokens += tokens
+
+        if batch:
+            yield batch
+
+
+def default_token_counter() -> Callable[[str], int]:
+    """Cuenta tokens con tiktoken si está disponible; si no, estima ~3
+    caracteres por token (conservador para texto en español)"""
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:
+        return lambda text: len(text) // 3 + 1
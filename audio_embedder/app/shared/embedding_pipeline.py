@@ -0,0 +1,108 @@
+import queue
+import threading
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+from .logger import get_logger
+
+_DONE = object()
+
+
+class EmbeddingPipeline:
+    """Pipeline de dos etapas con colas acotadas entre ellas.
+
+    La etapa `embed` calcula los vectores de cada lote y la etapa `write` los
+    inserta, de modo que la API de embeddings y la base de datos trabajan a la
+    vez. Las colas acotadas limitan los lotes en memoria y frenan a la etapa
+    rápida cuando la lenta se retrasa. Un lote que falla se registra y se
+    descarta sin detener el resto.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[list], list],
+        write: Callable[[list, list], Any],
+        queue_size: int = 4,
+        embed_workers: int = 2,
+        write_workers: int = 1,
+    ):
+        self.embed = embed
+        self.write = write
+        self.queue_size = queue_size
+        self.embed_workers = embed_workers
+        self.write_workers = write_workers
+        self.logger = get_logger(self.__class__.__name__)
+
+    def run(
+        self,
+        batches: Iterable[list],
+        on_written: Optional[Callable[[Any], None]] = None,
+    ) -> list:
+        """Procesa todos los lotes y devuelve los resultados de `write`.
+
+        Con `on_written` cada resultado se entrega en cuanto su lote se
+        escribe y no se acumula: la lista devuelta queda vacía. Así los
+        vectores escritos no se quedan en memoria hasta el final.
+        """
+        batch_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: list = []
+        results_lock = threading.Lock()
+
+        def feed() -> None:
+            try:
+                for batch_num, batch in enumerate(batches, 1):
+                    batch_queue.put((batch_num, batch))
+            except Exception as e:
+                self.logger.error(f"Error generating batches: {str(e)}")
+            finally:
+                for _ in range(self.embed_workers):
+                    batch_queue.put(_DONE)
+
+        def embed_worker() -> None:
+            while (item := batch_queue.get()) is not _DONE:
+                batch_num, batch = item
+                try:
+                    vectors = self.embed(batch)
+                except Exception as e:
+                    self.logger.error(f"Error embedding batch {batch_num}: {str(e)}")
+                    continue
+                write_queue.put((batch_num, batch, vectors))
+
+        def write_worker() -> None:
+            while (item := write_queue.get()) is not _DONE:
+                batch_num, batch, vectors = item
+                try:
+                    result = self.write(batch, vectors)
+                except Exception as e:
+                    self.logger.error(f"Error writing batch {batch_num}: {str(e)}")
+                    continue
+                with results_lock:
+                    if on_written is None:
+                        results.append(result)
+                    else:
+                        on_written(result)
+                self.logger.info(f"Batch {batch_num}: {len(batch)} chunks written")
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        embedders = [
+            threading.Thread(target=embed_worker, daemon=True)
+            for _ in range(self.embed_workers)
+        ]
+        writers = [
+            threading.Thread(target=write_worker, daemon=True)
+            for _ in range(self.write_workers)
+        ]
+
+        for thread in [feeder, *embedders, *writers]:
+            thread.start()
+
+        feeder.join()
+        for thread in embedders:
+            thread.join()
+        for _ in writers:
+            write_queue.put(_DONE)
+        for thread in writers:
+            thread.join()
+
+        return results
@@ -0,0 +1,58 @@
+import numpy as np
+
+AGGREGATIONS = ("max", "softmax-sum", "top-n-mean")
+
+
+def aggregate_scores(
+    episode_ids: list[str],
+    scores: np.ndarray,
+    method: str = "max",
+    top_n: int = 3,
+    temperature: float = 0.05,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Agrega scores de chunks por episodio.
+
+    Los episodios se convierten en códigos enteros con `np.unique` y cada
+    agregación es un group-by vectorizado sobre esos códigos:
+
+    - `max`: score del mejor chunk.
+    - `softmax-sum`: `temperature * log(sum(exp(score / temperature)))`, un
+      máximo suave que premia a los episodios con varios chunks relevantes.
+    - `top-n-mean`: media de los `top_n` mejores chunks del episodio.
+
+    Devuelve (episodios, score agregado) ordenados de mayor a menor score.
+    """
+    if method not in AGGREGATIONS:
+        raise ValueError(
+            f"Unknown aggregation '{method}', expected one of {AGGREGATIONS}"
+        )
+    if len(episode_ids) == 0:
+        return np.empty(0, dtype=str), np.empty(0, dtype=np.float64)
+
+    episodes, codes = np.unique(np.asarray(episode_ids, dtype=str), return_inverse=True)
+    scores = np.asarray(scores, dtype=np.float64)
+    n_groups = len(episodes)
+
+    group_max = np.full(n_groups, -np.inf)
+    np.maximum.at(group_max, codes, scores)
+
+    if method == "max":
+        aggregated = group_max
+    elif method == "softmax-sum":
+        # log-sum-exp estable restando el máximo de cada grupo
+        shifted = np.exp((scores - group_max[codes]) / temperature)
+        aggregated = group_max + temperature * np.log(
+            np.bincount(codes, weights=shifted, minlength=n_groups)
+        )
+    else:
+        order = np.lexsort((-scores, codes))
+        sorted_codes = codes[order]
+        group_start = np.searchsorted(sorted_codes, np.arange(n_groups))
+        rank_in_group = np.arange(len(order)) - group_start[sorted_codes]
+        keep = order[rank_in_group < top_n]
+        sums = np.bincount(codes[keep], weights=scores[keep], minlength=n_groups)
+        counts = np.bincount(codes[keep], minlength=n_groups)
+        aggregated = sums / counts
+
+    ranking = np.argsort(-aggregated, kind="stable")
+    return episodes[ranking], aggregated[ranking]
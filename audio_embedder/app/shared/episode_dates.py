@@ -0,0 +1,20 @@
+import re
+from typing import Optional
+
+_EPISODE_DATE = re.compile(r"^(\d{8})")
+_DATE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})$")
+
+
+def episode_date(episode_id: str) -> Optional[int]:
+    """Fecha de publicación YYYYMMDD codificada al principio del id del
+    episodio (p. ej. `20240520_190000`), o None si no la tiene"""
+    match = _EPISODE_DATE.match(episode_id or "")
+    return int(match.group(1)) if match else None
+
+
+def parse_date(date: str) -> int:
+    """Convierte `YYYYMMDD` o `YYYY-MM-DD` al entero YYYYMMDD"""
+    match = _DATE.match(date.strip())
+    if not match:
+        raise ValueError(f"Invalid date '{date}', expected YYYYMMDD or YYYY-MM-DD")
+    return int("".join(match.groups()))
@@ -0,0 +1,17 @@
+import hashlib
+import uuid
+
+# Espacio de nombres fijo: cambiarlo cambiaría todos los ids de chunk
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-4f5a-9e7c-2b1d0a9f8e36")
+
+
+def sha256_text(text: str) -> str:
+    """Hash SHA-256 (hex) del texto en UTF-8"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chunk_id(episode_id: str, chunker_version: str, chunk_index: int, text: str) -> str:
+    """UUID determinista de un chunk: el mismo episodio, versión del chunker,
+    posición y texto producen siempre el mismo id"""
+    name = f"{episode_id}:{chunker_version}:{chunk_index}:{sha256_text(text)}"
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, name))
@@ -0,0 +1,21 @@
+from typing import Any
+
+
+def metadata_contains(metadata: Any, filter_metadata: Any) -> bool:
+    """Réplica de la contención `metadata @> filter` de jsonb que usa
+    `match_documents`: los objetos se comparan clave a clave de forma
+    recursiva, los arrays contienen a otro si incluyen todos sus elementos y
+    los escalares deben ser iguales (sin mezclar booleanos y números)"""
+    if isinstance(filter_metadata, dict):
+        return isinstance(metadata, dict) and all(
+            key in metadata and metadata_contains(metadata[key], value)
+            for key, value in filter_metadata.items()
+        )
+    if isinstance(filter_metadata, list):
+        return isinstance(metadata, list) and all(
+            any(metadata_contains(item, wanted) for item in metadata)
+            for wanted in filter_metadata
+        )
+    if isinstance(filter_metadata, bool) or isinstance(metadata, bool):
+        return metadata is filter_metadata
+    return metadata == filter_metadata
@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _value_key(value: Any) -> tuple:
+    # True == 1 en Python pero no en jsonb: el tipo forma parte de la clave
+    return (isinstance(value, bool), value)
+
+
+class MetadataIndex:
+    """Índice invertido de metadatos por (clave, valor escalar).
+
+    Guarda, para cada valor escalar de primer nivel, la lista ordenada de
+    filas que lo tienen. Un filtro se resuelve intersecando las listas de sus
+    claves escalares, así que el coste depende del número de filas que
+    coinciden y no del tamaño del corpus. Las partes del filtro que no son
+    escalares (objetos, arrays) se devuelven aparte para comprobarlas sólo
+    sobre esas filas.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, dict]]):
+        postings: dict[str, dict[tuple, list[int]]] = {}
+        rows = []
+        for row, metadata in entries:
+            rows.append(row)
+            for key, value in (metadata or {}).items():
+                if isinstance(value, _SCALARS):
+                    values = postings.setdefault(key, {})
+                    values.setdefault(_value_key(value), []).append(row)
+
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self._postings = {
+            key: {
+                value: np.asarray(value_rows, dtype=np.int64)
+                for value, value_rows in values.items()
+            }
+            for key, values in postings.items()
+        }
+
+    def candidates(self, filter_metadata: dict) -> tuple[np.ndarray, dict]:
+        """(filas que cumplen las claves escalares del filtro, resto del filtro)"""
+        residual = {}
+        lists = []
+        for key, value in filter_metadata.items():
+            if not isinstance(value, _SCALARS):
+                residual[key] = value
+                continue
+            rows = self._postings.get(key, {}).get(_value_key(value))
+            if rows is None:
+                return np.empty(0, dtype=np.int64), {}
+            lists.append(rows)
+
+        if not lists:
+            return self.rows, residual
+
+        lists.sort(key=len)
+        rows = lists[0]
+        for other in lists[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows, residual
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def mmr_indices(
+    query: np.ndarray, candidates: np.ndarray, top_k: int, lambda_mult: float = 0.5
+) -> np.ndarray:
+    """Orden de maximal marginal relevance sobre los candidatos.
+
+    Cada paso elige el candidato que maximiza
+    `lambda * sim(query, c) - (1 - lambda) * max(sim(c, elegidos))`, así que
+    lambda=1 reproduce el orden por relevancia y valores menores penalizan los
+    chunks casi idénticos a uno ya elegido. Las similitudes entre candidatos se
+    calculan una sola vez y la máxima con los elegidos se actualiza en cada
+    paso, de modo que el coste es un producto (n, n) más top_k pasos O(n).
+    """
+    n = len(candidates)
+    top_k = min(top_k, n)
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    candidates = _normalize_rows(np.asarray(candidates, dtype=np.float32))
+    query = _normalize_rows(np.asarray(query, dtype=np.float32))[0]
+
+    relevance = candidates @ query
+    similarity = candidates @ candidates.T
+    max_similarity = np.full(n, -np.inf, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    selected = np.empty(top_k, dtype=np.int64)
+
+    for step in range(top_k):
+        if step == 0:
+            scores = relevance.copy()
+        else:
+            scores = lambda_mult * relevance - (1 - lambda_mult) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected[step] = best
+        available[best] = False
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+
+    return selected
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.atleast_2d(matrix)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
@@ -0,0 +1,177 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from .bm25_index import narrowest_uint
+from .text_tokenizer import iter_tokens
+
+# Hueco de posiciones entre documentos consecutivos: una frase o un NEAR/k
+# más cortos que esto nunca pueden cruzar de un documento al siguiente
+DOC_GAP = 64
+
+
+class PositionalIndex:
+    """Índice posicional: para cada término, todas sus apariciones.
+
+    Los documentos se colocan uno detrás de otro en un espacio de posiciones
+    global (separados por `DOC_GAP`), así que cada aparición es un único
+    entero. Las posiciones de un término están ordenadas y se guardan
+    delta-codificadas como en `BM25Index`, junto al offset en caracteres de
+    cada aparición dentro de su documento.
+
+    Una frase se resuelve intersecando las listas de sus términos desplazadas
+    por su posición en la frase; NEAR/k buscando, para cada aparición de un
+    término, la más cercana del otro con `searchsorted`. Ninguna consulta
+    vuelve a leer el texto.
+    """
+
+    def __init__(
+        self,
+        terms: np.ndarray,
+        offsets: np.ndarray,
+        position_gaps: np.ndarray,
+        char_offsets: np.ndarray,
+        doc_starts: np.ndarray,
+    ):
+        self.terms = terms
+        self.offsets = offsets
+        self.position_gaps = position_gaps
+        self.char_offsets = char_offsets
+        self.doc_starts = doc_starts
+        self._term_ids = {str(term): i for i, term in enumerate(terms)}
+
+    @classmethod
+    def build(cls, documents: Iterable[str]) -> "PositionalIndex":
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        doc_starts = []
+        start = 0
+        for text in documents:
+            doc_starts.append(start)
+            length = 0
+            for term, position, char_offset in iter_tokens(text):
+                positions, chars = postings.setdefault(term, ([], []))
+                positions.append(start + position)
+                chars.append(char_offset)
+                length = position + 1
+            start += length + DOC_GAP
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        gaps, chars = [], []
+        for i, term in enumerate(terms):
+            positions, term_chars = postings[term]
+            gaps.append(np.diff(positions, prepend=0))
+            chars.append(term_chars)
+            offsets[i + 1] = offsets[i] + len(positions)
+
+        empty = np.empty(0, dtype=np.int64)
+        return cls(
+            np.asarray(terms, dtype=str),
+            offsets,
+            narrowest_uint(np.concatenate(gaps) if gaps else empty),
+            narrowest_uint(np.concatenate(chars) if chars else empty),
+            np.asarray(doc_starts, dtype=np.int64),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "PositionalIndex":
+        with np.load(path) as data:
+            return cls(
+                data["terms"],
+                data["offsets"],
+                data["position_gaps"],
+                data["char_offsets"],
+                data["doc_starts"],
+            )
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            np.savez_compressed(
+                file,
+                terms=self.terms,
+                offsets=self.offsets,
+                position_gaps=self.position_gaps,
+                char_offsets=self.char_offsets,
+                doc_starts=self.doc_starts,
+            )
+
+    def occurrences(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        """(posiciones globales, offsets en caracteres) del término"""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        positions = np.cumsum(self.position_gaps[start:end], dtype=np.int64)
+        return positions, self.char_offsets[start:end].astype(np.int64)
+
+    def phrase(self, phrase: str) -> tuple[np.ndarray, np.ndarray]:
+        """(documentos, offsets en caracteres) donde aparece la frase.
+
+        Las stopwords de la frase no se comparan pero conservan su hueco:
+        "rey de Francia" exige "francia" dos posiciones después de "rey".
+        """
+        tokens = list(iter_tokens(phrase))
+        if not tokens:
+            return _no_matches()
+        first = tokens[0][1]
+        if tokens[-1][1] - first >= DOC_GAP:
+            raise ValueError(f"Phrases are limited to {DOC_GAP} words")
+
+        # Cada lista se desplaza a la posición de la primera palabra y se
+        # empieza por la más corta: las intersecciones sólo encogen
+        lists = sorted(
+            (
+                self.occurrences(term)[0] - (position - first)
+                for term, position, _ in tokens
+            ),
+            key=len,
+        )
+        starts = lists[0]
+        for shifted in lists[1:]:
+            starts = np.intersect1d(starts, shifted, assume_unique=True)
+
+        positions, chars = self.occurrences(tokens[0][0])
+        return self._locate(starts, chars[np.searchsorted(positions, starts)])
+
+    def near(
+        self, first: str, second: str, distance: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(documentos, offsets) de las apariciones de `first` que tienen
+        `second` a `distance` palabras o menos, en cualquier orden"""
+        if distance >= DOC_GAP:
+            raise ValueError(f"NEAR distance must be below {DOC_GAP}")
+        first_terms = [term for term, _, _ in iter_tokens(first)]
+        second_terms = [term for term, _, _ in iter_tokens(second)]
+        if len(first_terms) != 1 or len(second_terms) != 1:
+            return _no_matches()
+
+        positions, chars = self.occurrences(first_terms[0])
+        if first_terms[0] == second_terms[0]:
+            # Mismo término: basta con mirar la aparición anterior y la siguiente
+            close = np.diff(positions) <= distance
+            found = np.zeros(len(positions), dtype=bool)
+            found[1:] |= close
+            found[:-1] |= close
+            return self._locate(positions[found], chars[found])
+
+        others, _ = self.occurrences(second_terms[0])
+        if len(positions) == 0 or len(others) == 0:
+            return _no_matches()
+
+        # Primera aparición del otro término dentro de la ventana por la izquierda
+        nearest = np.searchsorted(others, positions - distance)
+        candidates = others[np.minimum(nearest, len(others) - 1)]
+        found = (nearest < len(others)) & (candidates <= positions + distance)
+        return self._locate(positions[found], chars[found])
+
+    def _locate(
+        self, positions: np.ndarray, chars: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        docs = np.searchsorted(self.doc_starts, positions, side="right") - 1
+        return docs, chars
+
+
+def _no_matches() -> tuple[np.ndarray, np.ndarray]:
+    empty = np.empty(0, dtype=np.int64)
+    return empty, empty
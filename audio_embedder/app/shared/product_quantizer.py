@@ -0,0 +1,170 @@
+from typing import Optional
+
+import numpy as np
+
+
+class ProductQuantizer:
+    """Codificador de cuantización por producto (PQ) para vectores de embeddings.
+
+    Divide cada vector en `n_subvectors` sub-vectores y sustituye cada uno por
+    el índice (1 byte) de su centroide más cercano, de modo que un vector de
+    1536 floats ocupa `n_subvectors` bytes. Las búsquedas usan distancia
+    asimétrica: la consulta se mantiene en float y se compara contra los
+    códigos mediante tablas de búsqueda.
+    """
+
+    def __init__(self, codebooks: np.ndarray):
+        if codebooks.ndim != 3:
+            raise ValueError(
+                "codebooks debe tener forma (n_subvectors, n_centroids, dsub)"
+            )
+        if codebooks.shape[1] > 256:
+            raise ValueError(
+                "Como máximo 256 centroides por sub-espacio (códigos uint8)"
+            )
+
+        self.codebooks = codebooks.astype(np.float32)
+        self.n_subvectors, self.n_centroids, self.dsub = self.codebooks.shape
+        self.dimension = self.n_subvectors * self.dsub
+
+    @property
+    def code_size(self) -> int:
+        """Bytes por vector codificado"""
+        return self.n_subvectors
+
+    def compression_ratio(self) -> float:
+        """Ratio entre el tamaño float32 original y el tamaño del código"""
+        return (self.dimension * 4) / self.code_size
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        n_subvectors: int = 32,
+        n_centroids: int = 256,
+        n_iter: int = 20,
+        sample_size: Optional[int] = 65536,
+        seed: int = 0,
+    ) -> "ProductQuantizer":
+        """Entrena los codebooks con k-means independiente por sub-espacio"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        n_vectors, dimension = vectors.shape
+
+        if dimension % n_subvectors != 0:
+            raise ValueError(
+                f"La dimensión {dimension} no es divisible entre {n_subvectors} sub-vectores"
+            )
+
+        rng = np.random.default_rng(seed)
+        if sample_size and n_vectors > sample_size:
+            vectors = vectors[
+                np.sort(rng.choice(n_vectors, sample_size, replace=False))
+            ]
+            n_vectors = sample_size
+
+        n_centroids = min(n_centroids, n_vectors)
+        dsub = dimension // n_subvectors
+        codebooks = np.empty((n_subvectors, n_centroids, dsub), dtype=np.float32)
+
+        for m in range(n_subvectors):
+            sub_vectors = np.ascontiguousarray(vectors[:, m * dsub : (m + 1) * dsub])
+            codebooks[m] = _kmeans(sub_vectors, n_centroids, n_iter, rng)
+
+        return cls(codebooks)
+
+    def encode(self, vectors: np.ndarray, batch_size: int = 16384) -> np.ndarray:
+        """Codifica vectores (n, d) en códigos uint8 (n, n_subvectors)"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors[np.newaxis, :]
+
+        codes = np.empty((len(vectors), self.n_subvectors), dtype=np.uint8)
+        for start in range(0, len(vectors), batch_size):
+            batch = vectors[start : start + batch_size]
+            for m in range(self.n_subvectors):
+                sub_vectors = batch[:, m * self.dsub : (m + 1) * self.dsub]
+                codes[start : start + batch_size, m] = _nearest_centroid(
+                    sub_vectors, self.codebooks[m]
+                )
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Reconstruye vectores aproximados a partir de sus códigos"""
+        codes = np.asarray(codes)
+        parts = [self.codebooks[m][codes[:, m]] for m in range(self.n_subvectors)]
+        return np.concatenate(parts, axis=1)
+
+    def inner_product_table(self, query: np.ndarray) -> np.ndarray:
+        """Tabla (n_subvectors, n_centroids) de productos escalares consulta-centroide"""
+        query_subs = np.asarray(query, dtype=np.float32).reshape(
+            self.n_subvectors, 1, self.dsub
+        )
+        return (self.codebooks * query_subs).sum(axis=2)
+
+    def asymmetric_scores(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Producto escalar aproximado entre la consulta y cada vector codificado"""
+        table = self.inner_product_table(query)
+        scores = np.zeros(len(codes), dtype=np.float32)
+        for m in range(self.n_subvectors):
+            scores += table[m, codes[:, m]]
+        return scores
+
+    def search(
+        self, query: np.ndarray, codes: np.ndarray, top_k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Devuelve (índices, scores) de los top_k códigos más similares"""
+        scores = self.asymmetric_scores(query, codes)
+        indices = top_k_indices(scores, top_k)
+        return indices, scores[indices]
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            np.save(file, self.codebooks)
+
+    @classmethod
+    def load(cls, path: str) -> "ProductQuantizer":
+        with open(path, "rb") as file:
+            return cls(np.load(file))
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Índices de los top_k scores en orden descendente"""
+    if top_k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if top_k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _nearest_centroid(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    # ||x - c||² = ||x||² - 2 x·c + ||c||²; ||x||² no cambia el argmin
+    distances = (centroids * centroids).sum(axis=1) - 2.0 * (vectors @ centroids.T)
+    return distances.argmin(axis=1)
+
+
+def _kmeans(
+    vectors: np.ndarray, n_centroids: int, n_iter: int, rng: np.random.Generator
+) -> np.ndarray:
+    centroids = vectors[rng.choice(len(vectors), n_centroids, replace=False)].copy()
+
+    for _ in range(n_iter):
+        assignments = _nearest_centroid(vectors, centroids)
+        counts = np.bincount(assignments, minlength=n_centroids)
+        sums = np.stack(
+            [
+                np.bincount(assignments, weights=vectors[:, d], minlength=n_centroids)
+                for d in range(vectors.shape[1])
+            ],
+            axis=1,
+        ).astype(np.float32)
+
+        non_empty = counts > 0
+        centroids[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+
+        # Re-inicializar clusters vacíos con puntos aleatorios
+        empty = np.flatnonzero(~non_empty)
+        if len(empty):
+            centroids[empty] = vectors[rng.choice(len(vectors), len(empty))]
+
+    return centroids
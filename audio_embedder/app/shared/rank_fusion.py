@@ -0,0 +1,22 @@
+from collections.abc import Hashable, Iterable
+
+# Valor habitual de la constante de RRF: amortigua el peso de los primeros
+# puestos para que ningún ranking domine por sí solo
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[list[Hashable]], k: int = RRF_K
+) -> list[tuple[Hashable, float]]:
+    """Fusiona varios rankings con Reciprocal Rank Fusion.
+
+    Cada elemento suma `1 / (k + posición)` por cada ranking en el que
+    aparece; sólo cuentan las posiciones, no los scores, así que se pueden
+    mezclar escalas incomparables (BM25 y similitud coseno). Devuelve
+    (elemento, score) de mayor a menor score.
+    """
+    fused: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for position, key in enumerate(ranking, 1):
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + position)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
@@ -1,14 +1,29 @@
 import re
 from typing import List, Dict, Any
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+# Ritmo de habla supuesto para estimar timestamps a partir del texto
+WORDS_PER_MINUTE = 150
+
+
+def estimate_timestamp_minutes(position: int, text_length: int, total_words: int) -> float:
+    """Minuto estimado del carácter `position` de una transcripción,
+    suponiendo un ritmo de habla constante"""
+    progress = position / text_length
+    return round(progress * (total_words / WORDS_PER_MINUTE), 2)
 
 
 class SemanticChunker:
     """Chunker semántico especializado para transcripciones de podcast"""
+
+    # Incrementar cuando cambie la forma de dividir: forma parte del id de cada chunk
+    VERSION = "1"
     
     def __init__(self, chunk_size: int = 1500, chunk_overlap: int = 200):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        # Import diferido: LangChain es caro de importar y sólo hace falta aquí
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -44,9 +59,7 @@ class SemanticChunker:
         boundaries = self.detect_topic_boundaries(text)
         chunks = []
         
-        # Estimar duración total (asumiendo ~150 palabras por minuto)
         total_words = len(text.split())
-        estimated_duration_minutes = total_words / 150
         
         for i in range(len(boundaries) - 1):
             start_pos = boundaries[i]
@@ -62,14 +75,14 @@ class SemanticChunker:
                 sub_chunks = self.text_splitter.split_text(segment)
                 
                 for j, sub_chunk in enumerate(sub_chunks):
-                    # Calcular timestamp estimado
-                    progress = (start_pos + j * len(sub_chunk)) / len(text)
-                    estimated_timestamp = progress * estimated_duration_minutes
+                    estimated_timestamp = estimate_timestamp_minutes(
+                        start_pos + j * len(sub_chunk), len(text), total_words
+                    )
                     
                     chunk_metadata = {
                         **episode_metadata,
                         "chunk_index": len(chunks),
-                        "estimated_timestamp_minutes": round(estimated_timestamp, 2),
+                        "estimated_timestamp_minutes": estimated_timestamp,
                         "chunk_type": "semantic_sub",
                         "word_count": len(sub_chunk.split())
                     }
@@ -79,14 +92,14 @@ class SemanticChunker:
                         "metadata": chunk_metadata
                     })
             else:
-                # Calcular timestamp estimado
-                progress = start_pos / len(text)
-                estimated_timestamp = progress * estimated_duration_minutes
+                estimated_timestamp = estimate_timestamp_minutes(
+                    start_pos, len(text), total_words
+                )
                 
                 chunk_metadata = {
                     **episode_metadata,
                     "chunk_index": len(chunks),
-                    "estimated_timestamp_minutes": round(estimated_timestamp, 2),
+                    "estimated_timestamp_minutes": estimated_timestamp,
                     "chunk_type": "semantic",
                     "word_count": len(segment.split())
                 }
@@ -0,0 +1,50 @@
+import re
+import unicodedata
+from collections.abc import Iterator
+
+_COMBINING_MARKS = re.compile(r"[\u0300-\u036f]")
+_TOKEN = re.compile(r"[a-zñ0-9]+")
+_WORD = re.compile(r"[^\W_]+")
+
+# Palabras funcionales que aparecen en casi todos los chunks: su idf es ~0 y
+# sólo harían crecer las listas de postings (ya sin tildes)
+SPANISH_STOPWORDS = frozenset(
+    """
+    a al algo ante antes como con contra cual cuando de del desde donde
+    e el ella ellas ellos en entre era eran es esa esas ese eso esos esta
+    estaba estan estas este esto estos fue fueron ha hay la las le les lo los
+    mas me mi mis muy ni no nos o os para pero por porque que se sea ser si
+    sin sobre son su sus tambien te tiene tu tus un una unas uno unos y ya yo
+    """.split()
+)
+
+
+def fold_accents(text: str) -> str:
+    """Minúsculas sin tildes ni diéresis, conservando la ñ"""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    # La ñ se descompone en n + virgulilla: se recompone antes de quitar marcas
+    return _COMBINING_MARKS.sub("", decomposed.replace("n\u0303", "ñ"))
+
+
+def iter_tokens(text: str) -> Iterator[tuple[str, int, int]]:
+    """(término, posición, offset en caracteres) de cada palabra del texto.
+
+    Las stopwords no se emiten pero sí cuentan para la posición, así que la
+    distancia entre dos términos es la misma que en el texto original. Los
+    offsets se refieren al texto original (plegar tildes cambia longitudes).
+    """
+    position = 0
+    for word in _WORD.finditer(text):
+        folded = word.group().lower()
+        if not folded.isascii():
+            folded = fold_accents(folded)
+        for term in _TOKEN.findall(folded):
+            if term not in SPANISH_STOPWORDS:
+                yield term, position, word.start()
+            position += 1
+
+
+def tokenize(text: str) -> list[str]:
+    """Términos de búsqueda del texto: palabras y números plegados, sin
+    stopwords. `Revolución`, `revolucion` y `REVOLUCIÓN` dan el mismo término"""
+    return [term for term, _, _ in iter_tokens(text)]
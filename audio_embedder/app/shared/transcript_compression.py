@@ -0,0 +1,107 @@
+import gzip
+import zlib
+from typing import Optional
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+EXTENSIONS = {"none": ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+ZSTD_LEVEL = 9
+# Los episodios comparten entradilla y despedida: un diccionario pequeño basta
+DICTIONARY_SIZE = 32 * 1024
+
+
+class TranscriptDecodeError(ValueError):
+    """Fichero truncado o corrupto, o zstd sin el diccionario con el que se
+    comprimió"""
+
+
+def detect_compression(raw: bytes) -> str:
+    """Formato de un fichero por sus primeros bytes, no por su extensión"""
+    if raw.startswith(GZIP_MAGIC):
+        return "gzip"
+    if raw.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return "none"
+
+
+def train_dictionary(samples: list[bytes], size: int = DICTIONARY_SIZE) -> bytes:
+    """Entrena un diccionario zstd con transcripciones ya serializadas"""
+    return _zstd().train_dictionary(size, samples).as_bytes()
+
+
+class TranscriptCodec:
+    """Comprime al escribir con el formato elegido y detecta el formato al
+    leer, así que un directorio puede mezclar ficheros de varios formatos.
+
+    El diccionario sólo lo usa zstd. Los frames guardan el id del
+    diccionario, así que hace falta el mismo diccionario para leerlos.
+    """
+
+    def __init__(
+        self,
+        compression: str = "none",
+        dictionary: Optional[bytes] = None,
+        level: int = ZSTD_LEVEL,
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        self.compression = compression
+        self.dictionary = dictionary
+        self.level = level
+        self._compressor = None
+        self._decompressor = None
+
+    @property
+    def extension(self) -> str:
+        return EXTENSIONS[self.compression]
+
+    def encode(self, data: bytes) -> bytes:
+        if self.compression == "gzip":
+            # mtime fijo: la misma transcripción produce siempre los mismos bytes
+            return gzip.compress(data, mtime=0)
+        if self.compression == "zstd":
+            if self._compressor is None:
+                zstd = _zstd()
+                self._compressor = zstd.ZstdCompressor(
+                    level=self.level, dict_data=self._zstd_dictionary()
+                )
+            return self._compressor.compress(data)
+        return data
+
+    def decode(self, raw: bytes) -> bytes:
+        compression = detect_compression(raw)
+        if compression == "gzip":
+            try:
+                return gzip.decompress(raw)
+            except (EOFError, OSError, zlib.error) as e:
+                raise TranscriptDecodeError(f"Invalid gzip data: {e}") from e
+        if compression == "zstd":
+            zstd = _zstd()
+            if self._decompressor is None:
+                self._decompressor = zstd.ZstdDecompressor(
+                    dict_data=self._zstd_dictionary()
+                )
+            try:
+                return self._decompressor.decompress(raw)
+            except zstd.ZstdError as e:
+                raise TranscriptDecodeError(f"Invalid zstd data: {e}") from e
+        return raw
+
+    def _zstd_dictionary(self):
+        if self.dictionary is None:
+            return None
+        return _zstd().ZstdCompressionDict(self.dictionary)
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires the 'zstandard' package "
+            "(pip install 'audio_embedder[zstd]')"
+        ) from e
+    return zstandard
@@ -6,11 +6,15 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
+        "numpy",
         "langchain>=0.3.0",
         "langchain-openai>=0.3.0",
         "langchain-community>=0.3.0",
     ],
     extras_require={
+        "zstd": [
+            "zstandard",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov",
@@ -0,0 +1,44 @@
+-- Búsqueda por rango de fechas para podcast_embeddings.
+--
+-- La fecha de publicación se deriva del id del episodio (YYYYMMDD_HHMMSS) en
+-- una columna generada e indexada (entero YYYYMMDD, como en el backend
+-- SQLite), así que el rango descarta filas antes de calcular ninguna
+-- distancia. Ejecutar una vez en el editor SQL de Supabase.
+
+alter table podcast_embeddings
+    add column if not exists publish_date int
+    generated always as (
+        case
+            when metadata->>'episode_id' ~ '^\d{8}'
+            then left(metadata->>'episode_id', 8)::int
+        end
+    ) stored;
+
+create index if not exists podcast_embeddings_publish_date_idx
+    on podcast_embeddings (publish_date);
+
+create or replace function match_documents_by_date (
+    query_embedding vector(1536),
+    start_date int,
+    end_date int,
+    match_count int default 10,
+    filter jsonb default '{}'
+) returns table (
+    id uuid,
+    content text,
+    metadata jsonb,
+    similarity float
+)
+language sql stable
+as $$
+    select
+        id,
+        content,
+        metadata,
+        1 - (embedding <=> query_embedding) as similarity
+    from podcast_embeddings
+    where publish_date between start_date and end_date
+        and metadata @> filter
+    order by embedding <=> query_embedding
+    limit match_count;
+$$;
@@ -0,0 +1,22 @@
+import os
+from unittest.mock import patch
+
+from app.infrastructure.embedder.supabase_embedding_service import (
+    SupabaseEmbeddingService,
+)
+
+MODULE = "app.infrastructure.embedder.supabase_embedding_service"
+
+
+def build_supabase_embedding_service(**kwargs) -> SupabaseEmbeddingService:
+    """SupabaseEmbeddingService con los clientes de OpenAI y Supabase parcheados"""
+    with (
+        patch.dict(
+            os.environ, {"SUPABASE_URL": "http://localhost", "SUPABASE_KEY": "key"}
+        ),
+        patch(f"{MODULE}.OpenAIEmbeddings"),
+        patch(
+            "app.infrastructure.repositories.supabase_embedding_repository.create_client"
+        ),
+    ):
+        return SupabaseEmbeddingService(**kwargs)
@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from app.infrastructure.repositories.file_transcription_repository import (
+    FileTranscriptionRepository,
+)
+from app.infrastructure.repositories.local_lexical_index_repository import (
+    LocalLexicalIndexRepository,
+)
+from app.infrastructure.repositories.local_positional_index_repository import (
+    LocalPositionalIndexRepository,
+)
+from app.main import COMMANDS, parse_args
+from app.shared.logger import get_logger
+from tests.helpers.episode_mother import EpisodeMother
+
+
+def _search(*flags):
+    return parse_args(["--command", "search-supabase", "--query", "Colón", *flags])
+
+
+class TestSearchModeArguments:
+    @pytest.mark.parametrize("search_mode", ["lexical", "hybrid", "phrase"])
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            ["--group-by-episode"],
+            ["--start-date", "20240101"],
+            ["--end-date", "20241231"],
+        ],
+    )
+    def test_rejects_flags_only_supported_by_vector_search(
+        self, search_mode, flags, capsys
+    ):
+        with pytest.raises(SystemExit) as error:
+            _search("--search-mode", search_mode, *flags)
+
+        assert error.value.code == 2
+        message = capsys.readouterr().err
+        assert flags[0] in message
+        assert f"--search-mode {search_mode}" in message
+
+    def test_vector_search_accepts_grouping_and_dates(self):
+        args = _search(
+            "--group-by-episode", "--start-date", "20240101", "--end-date", "20241231"
+        )
+
+        assert args.group_by_episode
+        assert args.start_date == "20240101"
+
+    @pytest.mark.parametrize("search_mode", ["lexical", "hybrid"])
+    def test_other_modes_accept_episode_filter(self, search_mode):
+        args = _search("--search-mode", search_mode, "--episode-id", "ep1")
+
+        assert args.search_mode == search_mode
+
+
+class TestStatsDatabase:
+    def test_vector_search_does_not_create_the_stats_database(self, tmp_path):
+        args = parse_args(
+            [
+                "--command",
+                "search-supabase",
+                "--query",
+                "historia",
+                "--vector-backend",
+                "sqlite",
+                "--vector-db-file",
+                str(tmp_path / "vectors.sqlite3"),
+                "--mock-embeddings",
+                "--stats-db-file",
+                str(tmp_path / "episode_stats.sqlite3"),
+            ]
+        )
+
+        COMMANDS[args.command](args, get_logger("test"))
+
+        assert not (tmp_path / "episode_stats.sqlite3").exists()
+
+
+class TestQueriesFile:
+    def setup_method(self):
+        self.texts = {
+            "ep1": "Luis XIV, el Rey Sol, gobernó Francia desde Versalles",
+            "ep2": "En 1492 Colón llegó a América con tres carabelas",
+        }
+
+    def _run(self, tmp_path, search_mode):
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("Rey Sol\n1492\n", encoding="utf-8")
+        output_file = tmp_path / "results.jsonl"
+        args = parse_args(
+            [
+                "--command",
+                "search-supabase",
+                "--search-mode",
+                search_mode,
+                "--queries-file",
+                str(queries_file),
+                "--output-file",
+                str(output_file),
+                "--lexical-index-dir",
+                str(tmp_path / "lexical_index"),
+                "--transcriptions-dir",
+                str(tmp_path / "transcriptions"),
+                "--vector-backend",
+                "sqlite",
+                "--vector-db-file",
+                str(tmp_path / "vectors.sqlite3"),
+                "--mock-embeddings",
+            ]
+        )
+        COMMANDS[args.command](args, get_logger("test"))
+        with open(output_file, encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_hybrid_batch_fuses_lexical_results(self, tmp_path):
+        LocalLexicalIndexRepository(str(tmp_path / "lexical_index")).rebuild(
+            [
+                EpisodeMother.create_embedding(
+                    episode_id=episode_id,
+                    chunk_text=text,
+                    metadata={"episode_id": episode_id, "chunk_id": episode_id},
+                )
+                for episode_id, text in self.texts.items()
+            ]
+        )
+
+        records = self._run(tmp_path, "hybrid")
+
+        assert [record["query"] for record in records] == ["Rey Sol", "1492"]
+        assert [record["results"][0]["episode_id"] for record in records] == [
+            "ep1",
+            "ep2",
+        ]
+        assert all(
+            "rrf_score" in record["results"][0]["metadata"] for record in records
+        )
+
+    def test_phrase_batch_searches_every_query(self, tmp_path):
+        transcriptions = [
+            EpisodeMother.create_transcription(episode_id=episode_id, text=text)
+            for episode_id, text in self.texts.items()
+        ]
+        repository = FileTranscriptionRepository(str(tmp_path / "transcriptions"))
+        for transcription in transcriptions:
+            repository.save(transcription)
+        LocalPositionalIndexRepository(str(tmp_path / "lexical_index")).rebuild(
+            transcriptions
+        )
+
+        records = self._run(tmp_path, "phrase")
+
+        assert [
+            [match["episode_id"] for match in record["results"]] for record in records
+        ] == [["ep1"], ["ep2"]]
+        assert "Rey Sol" in records[0]["results"][0]["snippet"]
@@ -0,0 +1,116 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.infrastructure.repositories.local_embedding_repository import (
+    LocalEmbeddingRepository,
+)
+from app.infrastructure.repositories.sqlite_embedding_repository import (
+    SQLiteEmbeddingRepository,
+)
+from app.shared.episode_dates import episode_date, parse_date
+from tests.helpers.episode_mother import EpisodeMother
+
+EPISODES = ["20240105_190000", "20240520_190000", "20240521_190000", "20250101_190000"]
+
+
+def _embeddings():
+    return [
+        EpisodeMother.create_embedding(
+            episode_id=episode_id,
+            chunk_index=chunk_index,
+            vector=[1.0, float(i + chunk_index)],
+            chunk_text=f"{episode_id} {chunk_index}",
+            metadata={"episode_id": episode_id, "chunk_type": f"type{chunk_index}"},
+        )
+        for i, episode_id in enumerate(EPISODES)
+        for chunk_index in range(2)
+    ]
+
+
+class TestEpisodeDates:
+    def test_parses_dates(self):
+        assert episode_date("20240520_190000") == 20240520
+        assert episode_date("sin-fecha") is None
+        assert parse_date("2024-05-20") == parse_date("20240520") == 20240520
+        with pytest.raises(ValueError):
+            parse_date("20-05-2024")
+
+
+class TestDateRangeSearch:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.local = LocalEmbeddingRepository(os.path.join(self.temp_dir, "local"))
+        self.sqlite = SQLiteEmbeddingRepository(
+            os.path.join(self.temp_dir, "vectors.sqlite3")
+        )
+        for repository in (self.local, self.sqlite):
+            repository.save_batch(_embeddings())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    @pytest.mark.parametrize("store", ["local", "sqlite"])
+    def test_only_episodes_in_range_are_scored(self, store):
+        repository = getattr(self, store)
+
+        results = repository.search_similar_in_date_range(
+            [1.0, 0.0], 20240501, 20240531, top_k=10
+        )
+
+        assert {r.episode_id for r in results} == set(EPISODES[1:3])
+        assert len(results) == 4
+
+    @pytest.mark.parametrize("store", ["local", "sqlite"])
+    def test_range_combines_with_metadata_filter(self, store):
+        repository = getattr(self, store)
+
+        results = repository.search_similar_in_date_range(
+            [1.0, 0.0],
+            20240101,
+            20241231,
+            top_k=10,
+            filter_metadata={"chunk_type": "type1"},
+        )
+
+        assert sorted(r.episode_id for r in results) == EPISODES[:3]
+
+    def test_deleted_chunks_leave_the_local_date_index(self):
+        self.local.delete_chunks(sorted(self.local.get_chunk_ids(EPISODES[1])))
+
+        results = self.local.search_similar_in_date_range(
+            [1.0, 0.0], 20240501, 20240531, top_k=10
+        )
+
+        assert {r.episode_id for r in results} == {EPISODES[2]}
+
+    def test_sqlite_tables_without_publish_date_are_migrated(self):
+        path = os.path.join(self.temp_dir, "old.sqlite3")
+        SQLiteEmbeddingRepository(path).save_batch(_embeddings())
+        connection = sqlite3.connect(path)
+        connection.execute("DROP INDEX idx_podcast_embeddings_publish_date")
+        connection.execute("ALTER TABLE podcast_embeddings DROP COLUMN publish_date")
+        connection.commit()
+        connection.close()
+
+        results = SQLiteEmbeddingRepository(path).search_similar_in_date_range(
+            [1.0, 0.0], 20250101, 20250101, top_k=10
+        )
+
+        assert {r.episode_id for r in results} == {EPISODES[3]}
+
+    def test_use_case_searches_by_date_range(self):
+        embeddings = Mock()
+        embeddings.embed_query.return_value = [1.0, 0.0]
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=self.sqlite, embeddings=embeddings
+        )
+
+        results = use_case.search_by_date_range("consulta", "2024-05-21", "2025-12-31")
+
+        assert {r["episode_id"] for r in results} == set(EPISODES[2:])
@@ -0,0 +1,82 @@
+from unittest.mock import Mock
+
+from app.shared.embedding_batcher import EmbeddingBatcher
+from tests.helpers.episode_mother import EpisodeMother
+from tests.helpers.supabase_service_factory import build_supabase_embedding_service
+
+
+def _long_text(word: str, paragraphs: int) -> str:
+    return "\n\n".join(f"{word} " * 40 + str(i) for i in range(paragraphs))
+
+
+class TestEmbeddingBatcher:
+    def test_splits_when_token_budget_is_exceeded(self):
+        batcher = EmbeddingBatcher(max_tokens=10, token_counter=len)
+        items = [(i, "x" * 4) for i in range(5)]
+
+        batches = list(batcher.batches(items))
+
+        assert [[ref for ref, _ in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+
+    def test_splits_when_input_limit_is_reached(self):
+        batcher = EmbeddingBatcher(max_inputs=2, token_counter=lambda text: 1)
+
+        batches = list(batcher.batches([(i, "x") for i in range(5)]))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+class TestSupabaseEmbeddingServiceBatching:
+    def test_packs_chunks_from_several_transcriptions_into_one_request(self):
+        service = build_supabase_embedding_service(
+            batcher=EmbeddingBatcher(max_inputs=100, token_counter=lambda text: 1)
+        )
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.side_effect = lambda texts: [
+            [float(i)] for i in range(len(texts))
+        ]
+        transcriptions = [
+            EpisodeMother.create_transcription(
+                episode_id="ep1", text=_long_text("uno", 3)
+            ),
+            EpisodeMother.create_transcription(
+                episode_id="ep2", text=_long_text("dos", 2)
+            ),
+        ]
+
+        results = service.create_embeddings_batch(transcriptions)
+
+        service.embeddings.embed_documents.assert_called_once()
+        assert len(results["ep1"]) == 3
+        assert len(results["ep2"]) == 2
+        assert all("uno" in e.chunk_text for e in results["ep1"])
+        assert all("dos" in e.chunk_text for e in results["ep2"])
+
+    def test_vectors_map_back_to_their_episode_documents(self):
+        embedding_repository = Mock()
+        embedding_repository.save_batch.side_effect = lambda embeddings: embeddings
+        embedding_repository.get_chunk_ids.return_value = set()
+        service = build_supabase_embedding_service(
+            batcher=EmbeddingBatcher(max_inputs=2, token_counter=lambda text: 1),
+            embedding_repository=embedding_repository,
+        )
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.side_effect = lambda texts: [
+            [1.0] if "uno" in text else [2.0] for text in texts
+        ]
+        transcriptions = [
+            EpisodeMother.create_transcription(
+                episode_id="ep1", text=_long_text("uno", 3)
+            ),
+            EpisodeMother.create_transcription(
+                episode_id="ep2", text=_long_text("dos", 2)
+            ),
+        ]
+
+        service.create_embeddings_batch(transcriptions)
+
+        assert embedding_repository.save_batch.call_count == 3
+        for call in embedding_repository.save_batch.call_args_list:
+            for embedding in call.args[0]:
+                expected = [1.0] if embedding.episode_id == "ep1" else [2.0]
+                assert embedding.vector == expected
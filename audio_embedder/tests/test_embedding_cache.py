@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from app.infrastructure.repositories.sqlite_embedding_cache_repository import (
+    SQLiteEmbeddingCacheRepository,
+)
+from app.shared.hashing import sha256_text
+from tests.helpers.supabase_service_factory import build_supabase_embedding_service
+
+
+class TestSQLiteEmbeddingCacheRepository:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = SQLiteEmbeddingCacheRepository(
+            os.path.join(self.temp_dir, "cache.sqlite3")
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_returns_saved_vectors_by_model_and_hash(self):
+        self.cache.save_many("model-a", {"hash-1": [0.5, 0.25]})
+
+        assert self.cache.get_many("model-a", ["hash-1", "hash-2"]) == {
+            "hash-1": [0.5, 0.25]
+        }
+        assert self.cache.get_many("model-b", ["hash-1"]) == {}
+
+
+class TestSupabaseEmbeddingServiceCache:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = SQLiteEmbeddingCacheRepository(
+            os.path.join(self.temp_dir, "cache.sqlite3")
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_only_cache_misses_are_sent_to_the_api(self):
+        service = build_supabase_embedding_service(embedding_cache=self.cache)
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.return_value = [[2.0], [3.0]]
+        self.cache.save_many(service.MODEL_NAME, {sha256_text("cached"): [1.0]})
+
+        vectors = service.embed_documents(["cached", "new one", "new two"])
+
+        service.embeddings.embed_documents.assert_called_once_with(
+            ["new one", "new two"]
+        )
+        assert vectors == [[1.0], [2.0], [3.0]]
+
+    def test_second_run_does_not_call_the_api(self):
+        service = build_supabase_embedding_service(embedding_cache=self.cache)
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.return_value = [[1.0], [2.0]]
+
+        service.embed_documents(["a", "b"])
+        vectors = service.embed_documents(["a", "b"])
+
+        assert service.embeddings.embed_documents.call_count == 1
+        assert vectors == [[1.0], [2.0]]
@@ -0,0 +1,320 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+from supabase import create_client
+
+from app.application.use_cases.reconcile_embeddings import ReconcileEmbeddingsUseCase
+from app.infrastructure.repositories.local_embedding_repository import (
+    LocalEmbeddingRepository,
+)
+from app.infrastructure.repositories.mirrored_embedding_repository import (
+    MirroredEmbeddingRepository,
+)
+from app.infrastructure.repositories.supabase_embedding_repository import (
+    SupabaseEmbeddingRepository,
+)
+from app.shared.embedding_batcher import EmbeddingBatcher
+from app.shared.embedding_pipeline import EmbeddingPipeline
+from app.shared.hashing import chunk_id
+from tests.helpers.episode_mother import EpisodeMother
+from tests.helpers.supabase_service_factory import build_supabase_embedding_service
+
+
+class FakePostgrestHandler(BaseHTTPRequestHandler):
+    """Stand-in mínimo de PostgREST que guarda las filas recibidas"""
+
+    rows: list = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.rows.extend(json.loads(body))
+        self.send_response(201)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestEmbeddingPipeline:
+    def test_writes_every_embedded_batch(self):
+        written = []
+        pipeline = EmbeddingPipeline(
+            embed=lambda batch: [len(item) for item in batch],
+            write=lambda batch, vectors: written.append((batch, vectors)) or vectors,
+        )
+
+        results = pipeline.run([["a"], ["bb", "c"], ["ddd"]])
+
+        assert sorted(map(tuple, results)) == [(1,), (2, 1), (3,)]
+        assert len(written) == 3
+
+    def test_embedding_and_writing_overlap(self):
+        second_batch_embedding = threading.Event()
+        overlapped = []
+
+        def embed(batch):
+            if batch == [1]:
+                second_batch_embedding.set()
+            return batch
+
+        def write(batch, vectors):
+            if batch == [0]:
+                # El primer lote sólo termina si el segundo se calcula a la vez
+                overlapped.append(second_batch_embedding.wait(timeout=5))
+            return vectors
+
+        pipeline = EmbeddingPipeline(embed=embed, write=write, embed_workers=1)
+        pipeline.run([[i] for i in range(4)])
+
+        assert overlapped == [True]
+
+    def test_failed_batches_are_skipped(self):
+        def embed(batch):
+            if batch == ["fail"]:
+                raise RuntimeError("API error")
+            return batch
+
+        pipeline = EmbeddingPipeline(embed=embed, write=lambda batch, vectors: batch)
+
+        results = pipeline.run([["ok"], ["fail"], ["ok2"]])
+
+        assert sorted(map(tuple, results)) == [("ok",), ("ok2",)]
+
+    def test_on_written_receives_results_without_buffering_them(self):
+        delivered = []
+        pipeline = EmbeddingPipeline(
+            embed=lambda batch: batch, write=lambda batch, vectors: vectors
+        )
+
+        results = pipeline.run([["a"], ["b"], ["c"]], on_written=delivered.append)
+
+        assert results == []
+        assert sorted(map(tuple, delivered)) == [("a",), ("b",), ("c",)]
+
+
+class TestSupabaseEmbeddingRepository:
+    def setup_method(self):
+        FakePostgrestHandler.rows = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakePostgrestHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.repository = SupabaseEmbeddingRepository(
+            create_client(url, "key"), write_batch_size=2
+        )
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_save_batch_upserts_precomputed_vectors(self):
+        embeddings = [
+            EpisodeMother.create_embedding(
+                chunk_index=i, vector=[float(i)] * 3, metadata={"episode_id": "ep1"}
+            )
+            for i in range(3)
+        ]
+
+        self.repository.save_batch(embeddings)
+
+        assert [row["embedding"] for row in FakePostgrestHandler.rows] == [
+            [0.0] * 3,
+            [1.0] * 3,
+            [2.0] * 3,
+        ]
+        assert all(
+            row["metadata"]["episode_id"] == "ep1" for row in FakePostgrestHandler.rows
+        )
+
+
+class TestSupabaseEmbeddingServicePipeline:
+    def test_returns_embeddings_in_chunk_order_without_vectors(self):
+        embedding_repository = Mock()
+        embedding_repository.save_batch.side_effect = lambda embeddings: embeddings
+        embedding_repository.get_chunk_ids.return_value = set()
+        service = build_supabase_embedding_service(
+            batcher=EmbeddingBatcher(max_inputs=1, token_counter=lambda text: 1),
+            embedding_repository=embedding_repository,
+            embed_workers=3,
+        )
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.side_effect = lambda texts: [
+            [1.0] for _ in texts
+        ]
+        text = "\n\n".join("palabra " * 40 + str(i) for i in range(4))
+        transcription = EpisodeMother.create_transcription(episode_id="ep1", text=text)
+
+        embeddings = service.create_embeddings(transcription)
+
+        assert [e.chunk_index for e in embeddings] == [0, 1, 2, 3]
+        assert all(e.vector == [] for e in embeddings)
+        assert embedding_repository.save_batch.call_count == 4
+
+
+class TestLocalMirror:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.local_repository = LocalEmbeddingRepository(self.temp_dir)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_vectors_sent_to_supabase_are_mirrored_locally(self):
+        remote = Mock()
+        remote.save_batch.side_effect = lambda embeddings: embeddings
+        remote.get_chunk_ids.return_value = set()
+        service = build_supabase_embedding_service(
+            batcher=EmbeddingBatcher(max_inputs=2, token_counter=lambda text: 1),
+            embedding_repository=remote,
+            local_mirror=self.local_repository,
+        )
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.side_effect = lambda texts: [
+            [1.0, 0.0] for _ in texts
+        ]
+        text = "\n\n".join("palabra " * 40 + str(i) for i in range(3))
+
+        service.create_embeddings(
+            EpisodeMother.create_transcription(episode_id="ep1", text=text)
+        )
+
+        mirrored = self.local_repository.get_by_episode_id("ep1")
+        assert sorted(e.chunk_index for e in mirrored) == [0, 1, 2]
+        assert all(e.vector == [1.0, 0.0] for e in mirrored)
+
+    def test_failed_remote_write_is_not_mirrored(self):
+        remote = Mock()
+        remote.save_batch.side_effect = RuntimeError("connection refused")
+        repository = MirroredEmbeddingRepository(remote, self.local_repository)
+
+        with pytest.raises(RuntimeError):
+            repository.save_batch([EpisodeMother.create_embedding(vector=[1.0])])
+
+        assert self.local_repository.count() == 0
+
+    def test_reconcile_reports_chunks_missing_on_either_side(self):
+        embeddings = [
+            EpisodeMother.create_embedding(
+                episode_id="ep1",
+                chunk_index=i,
+                metadata={"chunk_id": f"id-{i}"},
+            )
+            for i in range(3)
+        ]
+        self.local_repository.save_batch(embeddings)
+        remote = Mock()
+        remote.get_chunk_keys.return_value = {
+            "id-0": ("ep1", 0),
+            "id-1": ("ep1", 1),
+            "legacy": ("ep1", 0),
+        }
+
+        report = ReconcileEmbeddingsUseCase(self.local_repository, remote).execute()
+
+        assert report["only_local"] == ["id-2"]
+        assert report["only_remote"] == ["legacy"]
+
+
+class TestIdempotentChunks:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.remote = LocalEmbeddingRepository(os.path.join(self.temp_dir, "remote"))
+        self.service = build_supabase_embedding_service(
+            batcher=EmbeddingBatcher(max_inputs=10, token_counter=lambda text: 1),
+            embedding_repository=self.remote,
+        )
+        self.service.embeddings = Mock()
+        self.service.embeddings.embed_documents.side_effect = lambda texts: [
+            [1.0, float(len(text))] for text in texts
+        ]
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _transcription(self, paragraphs):
+        text = "\n\n".join(f"{word} " * 40 for word in paragraphs)
+        return EpisodeMother.create_transcription(episode_id="ep1", text=text)
+
+    def test_chunk_ids_are_deterministic(self):
+        assert chunk_id("ep1", "1", 0, "texto") == chunk_id("ep1", "1", 0, "texto")
+        assert chunk_id("ep1", "1", 0, "texto") != chunk_id("ep1", "2", 0, "texto")
+        assert chunk_id("ep1", "1", 0, "texto") != chunk_id("ep1", "1", 1, "texto")
+
+    def test_rerun_sends_nothing(self):
+        transcription = self._transcription(["uno", "dos", "tres"])
+        self.service.create_embeddings(transcription)
+        self.service.embeddings.embed_documents.reset_mock()
+
+        embeddings = self.service.create_embeddings(transcription)
+
+        self.service.embeddings.embed_documents.assert_not_called()
+        assert len(embeddings) == 3
+        assert self.remote.count() == 3
+
+    def test_only_changed_chunks_are_sent_and_stale_ones_removed(self):
+        self.service.create_embeddings(self._transcription(["uno", "dos", "tres"]))
+        self.service.embeddings.embed_documents.reset_mock()
+
+        self.service.create_embeddings(self._transcription(["uno", "dos", "cuatro"]))
+
+        (texts,) = self.service.embeddings.embed_documents.call_args.args
+        assert len(texts) == 1 and "cuatro" in texts[0]
+        stored = self.remote.get_by_episode_id("ep1")
+        assert sorted("cuatro" in e.chunk_text for e in stored) == [False, False, True]
+        assert not any("tres" in e.chunk_text for e in stored)
+
+
+class TestLocalChunkIds:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = LocalEmbeddingRepository(self.temp_dir)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _embedding(self, i):
+        return EpisodeMother.create_embedding(
+            episode_id="ep1",
+            chunk_index=i,
+            vector=[1.0, float(i)],
+            metadata={"chunk_id": f"id-{i}"},
+        )
+
+    def test_batches_do_not_rescan_stored_records(self):
+        self.repository.save_batch([self._embedding(0), self._embedding(1)])
+
+        with patch.object(
+            self.repository, "_live_records", wraps=self.repository._live_records
+        ) as live_records:
+            self.repository.save_batch([self._embedding(1), self._embedding(2)])
+            self.repository.save_batch([self._embedding(2), self._embedding(3)])
+
+        live_records.assert_not_called()
+        assert self.repository.count() == 4
+
+    def test_deleted_chunks_can_be_stored_again(self):
+        self.repository.save_batch([self._embedding(0), self._embedding(1)])
+
+        self.repository.delete_chunks(["id-0"])
+        self.repository.save_batch([self._embedding(0)])
+
+        assert self.repository.get_chunk_keys() == {
+            "id-0": ("ep1", 0),
+            "id-1": ("ep1", 1),
+        }
+
+    def test_writes_from_another_instance_invalidate_the_ids(self):
+        self.repository.save_batch([self._embedding(0)])
+        other = LocalEmbeddingRepository(self.temp_dir)
+        other.save_batch([self._embedding(1)])
+        other.delete_chunks(["id-0"])
+
+        self.repository.save_batch([self._embedding(0), self._embedding(1)])
+
+        assert sorted(self.repository.get_chunk_keys()) == ["id-0", "id-1"]
+        assert self.repository.count() == 3
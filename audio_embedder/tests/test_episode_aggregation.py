@@ -0,0 +1,71 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.shared.episode_aggregation import aggregate_scores
+from tests.helpers.episode_mother import EpisodeMother
+
+# ep1 tiene un único chunk muy bueno; ep2 varios chunks buenos
+EPISODE_IDS = ["ep1", "ep2", "ep2", "ep2", "ep3"]
+SCORES = np.array([0.88, 0.85, 0.84, 0.83, 0.50])
+
+
+class TestAggregateScores:
+    def test_max_ranks_by_best_chunk(self):
+        episodes, scores = aggregate_scores(EPISODE_IDS, SCORES, "max")
+
+        assert episodes.tolist() == ["ep1", "ep2", "ep3"]
+        assert scores.tolist() == pytest.approx([0.88, 0.85, 0.50])
+
+    def test_softmax_sum_rewards_several_relevant_chunks(self):
+        episodes, scores = aggregate_scores(
+            EPISODE_IDS, SCORES, "softmax-sum", temperature=0.05
+        )
+
+        assert episodes.tolist() == ["ep2", "ep1", "ep3"]
+        assert scores[0] > 0.85
+
+    def test_top_n_mean_uses_best_chunks_of_each_episode(self):
+        episodes, scores = aggregate_scores(
+            EPISODE_IDS + ["ep1"], np.append(SCORES, 0.10), "top-n-mean", top_n=2
+        )
+
+        assert episodes.tolist() == ["ep2", "ep3", "ep1"]
+        assert scores.tolist() == pytest.approx([0.845, 0.50, 0.49])
+
+    def test_unknown_aggregation(self):
+        with pytest.raises(ValueError):
+            aggregate_scores(EPISODE_IDS, SCORES, "median")
+
+
+class TestSearchEpisodes:
+    def test_returns_ranked_episodes_with_best_snippets(self):
+        repository = Mock()
+        repository.search_similar.return_value = [
+            EpisodeMother.create_embedding(
+                episode_id=episode_id,
+                chunk_index=i,
+                chunk_text=f"texto {i}",
+                metadata={"episode_id": episode_id, "similarity_score": score},
+            )
+            for i, (episode_id, score) in enumerate(zip(EPISODE_IDS, SCORES))
+        ]
+        embeddings = Mock()
+        embeddings.embed_query.return_value = [1.0]
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=repository, embeddings=embeddings
+        )
+
+        episodes = use_case.search_episodes(
+            "consulta", k=2, aggregation="softmax-sum", snippets=2
+        )
+
+        assert repository.search_similar.call_args.kwargs["top_k"] == 20
+        assert [e["episode_id"] for e in episodes] == ["ep2", "ep1"]
+        assert episodes[0]["matched_chunks"] == 3
+        assert [s["content"] for s in episodes[0]["snippets"]] == [
+            "texto 1",
+            "texto 2",
+        ]
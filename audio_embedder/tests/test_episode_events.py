@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest.mock import Mock
+
+from app.application.use_cases.consume_episode_events import (
+    ConsumeEpisodeEventsUseCase,
+)
+from app.domain.entities.episode import Episode
+from app.infrastructure.repositories.sqlite_episode_event_repository import (
+    SQLiteEpisodeEventRepository,
+)
+
+
+def _episode(day: int) -> Episode:
+    return Episode(
+        id=f"202405{day:02d}_190000",
+        title=f"Episodio {day}",
+        description="Descripción",
+        url=f"https://example.com/{day}.mp3",
+        published_date=datetime(2024, 5, day, 19, 0, 0),
+        duration=900,
+        file_size=1000,
+        local_file_path=f"/audios/2024_05_{day:02d}_19.mp3",
+        podcast={"title": "Acontece que no es poco"},
+    )
+
+
+class TestConsumeEpisodeEvents:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.events = SQLiteEpisodeEventRepository(
+            os.path.join(self.temp_dir, "episode_events.sqlite3")
+        )
+        self.process_episodes = Mock()
+        self.use_case = ConsumeEpisodeEventsUseCase(self.events, self.process_episodes)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_processes_pending_events_in_order_and_acks_them(self):
+        self.events.publish_downloaded(_episode(1))
+        self.events.publish_downloaded(_episode(2))
+        self.process_episodes.process_episode.return_value = True
+
+        consumed = self.use_case.run_once(batch_size=1)
+
+        episodes = [
+            c.args[0] for c in self.process_episodes.process_episode.call_args_list
+        ]
+        assert consumed == 2
+        assert episodes == [_episode(1), _episode(2)]
+        assert self.events.pending() == []
+
+    def test_failed_events_are_retried_on_the_next_pass(self):
+        self.events.publish_downloaded(_episode(1))
+        self.process_episodes.process_episode.side_effect = [
+            RuntimeError("audio not found"),
+            False,
+            True,
+        ]
+
+        assert self.use_case.run_once() == 0
+        assert self.use_case.run_once() == 0
+        assert self.events.pending()[0].attempts == 2
+        assert self.use_case.run_once() == 1
+        assert self.events.pending() == []
+
+    def test_gives_up_after_max_attempts(self):
+        self.events.publish_downloaded(_episode(1))
+        self.process_episodes.process_episode.return_value = False
+
+        for _ in range(SQLiteEpisodeEventRepository.MAX_ATTEMPTS):
+            self.use_case.run_once()
+
+        assert self.events.pending() == []
+        assert (
+            self.process_episodes.process_episode.call_count
+            == SQLiteEpisodeEventRepository.MAX_ATTEMPTS
+        )
+
+    def test_run_once_mode_returns_after_draining(self):
+        self.events.publish_downloaded(_episode(1))
+        self.process_episodes.process_episode.return_value = True
+
+        self.use_case.run(poll_interval=3600, once=True)
+
+        assert self.events.pending() == []
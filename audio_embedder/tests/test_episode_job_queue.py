@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+from app.application.use_cases.process_episode_jobs import ProcessEpisodeJobsUseCase
+from app.domain.entities.episode import Episode
+from app.infrastructure.repositories.sqlite_episode_job_queue import (
+    SQLiteEpisodeJobQueue,
+)
+
+
+def _episode(day: int) -> Episode:
+    return Episode(
+        id=f"202405{day:02d}_190000",
+        title=f"Episodio {day}",
+        description="Descripción",
+        url=f"https://example.com/{day}.mp3",
+        published_date=datetime(2024, 5, day, 19, 0, 0),
+        duration=900,
+        file_size=1000,
+        local_file_path=f"/audios/2024_05_{day:02d}_19.mp3",
+        podcast={"title": "Acontece que no es poco"},
+    )
+
+
+class TestSQLiteEpisodeJobQueue:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "episode_jobs.sqlite3")
+        self.queue = SQLiteEpisodeJobQueue(self.file_path)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_enqueue_ignores_known_episodes(self):
+        assert self.queue.enqueue([_episode(1), _episode(2)]) == 2
+        assert self.queue.enqueue([_episode(2), _episode(3)]) == 1
+
+        assert self.queue.counts()["pending"] == 3
+
+    def test_claimed_episode_is_not_handed_out_twice(self):
+        self.queue.enqueue([_episode(1)])
+        other = SQLiteEpisodeJobQueue(self.file_path)
+
+        job = self.queue.claim("a", lease_seconds=60)
+
+        assert job.episode == _episode(1)
+        assert job.attempts == 1
+        assert other.claim("b", lease_seconds=60) is None
+
+    def test_expired_lease_is_requeued_and_old_worker_cannot_complete(self):
+        self.queue.enqueue([_episode(1)])
+        self.queue.claim("a", lease_seconds=0.01)
+        time.sleep(0.02)
+
+        job = self.queue.claim("b", lease_seconds=60)
+
+        assert job.previous_worker_id == "a"
+        assert job.attempts == 2
+        assert self.queue.complete(_episode(1).id, "a") is False
+        assert self.queue.heartbeat(_episode(1).id, "a", 60) is False
+        assert self.queue.complete(_episode(1).id, "b") is True
+        assert self.queue.counts()["done"] == 1
+
+    def test_heartbeat_extends_the_lease(self):
+        self.queue.enqueue([_episode(1)])
+        self.queue.claim("a", lease_seconds=0.05)
+
+        assert self.queue.heartbeat(_episode(1).id, "a", lease_seconds=60)
+        time.sleep(0.06)
+
+        assert self.queue.claim("b", lease_seconds=60) is None
+
+    def test_fails_after_max_attempts(self):
+        self.queue.enqueue([_episode(1)])
+
+        for _ in range(SQLiteEpisodeJobQueue.MAX_ATTEMPTS):
+            self.queue.claim("a", lease_seconds=60)
+            self.queue.fail(_episode(1).id, "a", "audio not found")
+
+        assert self.queue.claim("a", lease_seconds=60) is None
+        assert self.queue.counts()["failed"] == 1
+
+
+class TestProcessEpisodeJobs:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "episode_jobs.sqlite3")
+        self.episodes = [_episode(day) for day in range(1, 9)]
+        self.transcribed = []
+        self.lock = threading.Lock()
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _process_episodes(self, result=True):
+        def slow_transcription(episode, label):
+            time.sleep(0.01)
+            with self.lock:
+                self.transcribed.append(episode.id)
+            return result
+
+        process_episodes = Mock()
+        process_episodes.episode_repository.get_all.return_value = self.episodes
+        process_episodes.process_episode.side_effect = slow_transcription
+        return process_episodes
+
+    def _use_case(self, worker_id, process_episodes, lease_seconds=60.0):
+        return ProcessEpisodeJobsUseCase(
+            SQLiteEpisodeJobQueue(self.file_path),
+            process_episodes,
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+        )
+
+    def test_parallel_workers_transcribe_each_episode_once(self):
+        completed = {}
+
+        def work(worker_id):
+            use_case = self._use_case(worker_id, self._process_episodes())
+            completed[worker_id] = use_case.execute()
+
+        workers = [threading.Thread(target=work, args=(w,)) for w in ("a", "b")]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert sorted(self.transcribed) == [e.id for e in self.episodes]
+        assert sum(completed.values()) == len(self.episodes)
+        assert SQLiteEpisodeJobQueue(self.file_path).counts()["done"] == 8
+
+    def test_heartbeat_keeps_a_slow_episode_leased(self):
+        process_episodes = self._process_episodes()
+        process_episodes.episode_repository.get_all.return_value = self.episodes[:1]
+
+        def very_slow_transcription(episode, label):
+            time.sleep(0.3)
+            return True
+
+        process_episodes.process_episode.side_effect = very_slow_transcription
+        other = SQLiteEpisodeJobQueue(self.file_path)
+        worker = threading.Thread(
+            target=self._use_case("a", process_episodes, lease_seconds=0.1).execute
+        )
+        worker.start()
+        time.sleep(0.2)
+
+        stolen = other.claim("b", lease_seconds=60)
+        worker.join()
+
+        assert stolen is None
+        assert other.counts()["done"] == 1
+
+    def test_failed_episodes_are_retried_then_given_up(self):
+        process_episodes = self._process_episodes(result=False)
+        process_episodes.episode_repository.get_all.return_value = self.episodes[:1]
+
+        completed = self._use_case("a", process_episodes).execute()
+
+        assert completed == 0
+        assert len(self.transcribed) == SQLiteEpisodeJobQueue.MAX_ATTEMPTS
+        assert SQLiteEpisodeJobQueue(self.file_path).counts()["failed"] == 1
@@ -0,0 +1,150 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.use_cases.backfill_episode_stats import (
+    BackfillEpisodeStatsUseCase,
+)
+from app.application.use_cases.get_episode_summary import GetEpisodeSummaryUseCase
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.domain.entities.episode_stats import EpisodeStats
+from app.domain.entities.transcription_handle import TranscriptionHandle
+from app.infrastructure.repositories.sqlite_episode_stats_repository import (
+    SQLiteEpisodeStatsRepository,
+)
+from tests.helpers.episode_mother import EpisodeMother
+from tests.helpers.supabase_service_factory import build_supabase_embedding_service
+
+CHUNKS_METADATA = [
+    {
+        "title": "Episodio 1",
+        "word_count": 120,
+        "estimated_timestamp_minutes": 0.0,
+        "chunk_type": "intro",
+    },
+    {
+        "title": "Episodio 1",
+        "word_count": 80,
+        "estimated_timestamp_minutes": 12.5,
+        "chunk_type": "content",
+    },
+    {
+        "title": "Episodio 1",
+        "word_count": 100,
+        "estimated_timestamp_minutes": 25.0,
+        "chunk_type": "content",
+    },
+]
+
+
+class TestEpisodeStats:
+    def test_from_chunk_metadata(self):
+        stats = EpisodeStats.from_chunk_metadata("ep1", CHUNKS_METADATA)
+
+        assert stats.title == "Episodio 1"
+        assert stats.chunks_count == 3
+        assert stats.total_words == 300
+        assert stats.duration_minutes == 25.0
+        assert stats.chunk_types == {"intro": 1, "content": 2}
+        assert stats.avg_chunk_words == 100
+
+
+class TestSQLiteEpisodeStatsRepository:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = SQLiteEpisodeStatsRepository(
+            os.path.join(self.temp_dir, "stats.sqlite3")
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_roundtrip_and_overwrite(self):
+        self.repository.save(EpisodeStats.from_chunk_metadata("ep1", CHUNKS_METADATA))
+        self.repository.save(
+            EpisodeStats.from_chunk_metadata("ep1", CHUNKS_METADATA[:2])
+        )
+
+        stats = self.repository.get("ep1")
+
+        assert stats.chunks_count == 2
+        assert stats.chunk_types == {"intro": 1, "content": 1}
+        assert self.repository.get("missing") is None
+
+    def test_summary_reads_stored_stats(self):
+        self.repository.save(EpisodeStats.from_chunk_metadata("ep1", CHUNKS_METADATA))
+
+        summary = GetEpisodeSummaryUseCase(self.repository).execute("ep1")
+
+        assert summary["chunks_count"] == 3
+        assert summary["avg_chunk_words"] == pytest.approx(100)
+        assert GetEpisodeSummaryUseCase(self.repository).execute("missing") is None
+
+    def test_search_use_case_skips_similarity_search(self):
+        self.repository.save(EpisodeStats.from_chunk_metadata("ep1", CHUNKS_METADATA))
+        embedding_repository = Mock()
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=embedding_repository,
+            embeddings=Mock(),
+            stats_repository=self.repository,
+        )
+
+        summary = use_case.get_episode_summary("ep1")
+
+        assert summary["total_words"] == 300
+        embedding_repository.search_similar.assert_not_called()
+
+    def test_missing_stats_are_reported_instead_of_estimated(self):
+        embedding_repository = Mock()
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=embedding_repository,
+            embeddings=Mock(),
+            stats_repository=self.repository,
+        )
+
+        summary = use_case.get_episode_summary("missing")
+
+        assert summary["chunks_count"] == 0
+        assert "backfill-stats" in summary["error"]
+        embedding_repository.search_similar.assert_not_called()
+
+    def test_service_stores_stats_on_ingest(self):
+        embedding_repository = Mock()
+        embedding_repository.save_batch.side_effect = lambda embeddings: embeddings
+        embedding_repository.get_chunk_ids.return_value = set()
+        service = build_supabase_embedding_service(
+            embedding_repository=embedding_repository,
+            stats_repository=self.repository,
+        )
+        service.embeddings = Mock()
+        service.embeddings.embed_documents.side_effect = lambda texts: [
+            [1.0] for _ in texts
+        ]
+        text = "\n\n".join("palabra " * 40 + str(i) for i in range(4))
+
+        embeddings = service.create_embeddings(
+            EpisodeMother.create_transcription(episode_id="ep1", text=text)
+        )
+
+        stats = self.repository.get("ep1")
+        assert stats.chunks_count == len(embeddings)
+        assert stats.total_words == sum(e.metadata["word_count"] for e in embeddings)
+
+    def test_backfill_from_transcriptions(self):
+        transcription_repository = Mock()
+        transcription_repository.iter_handles.return_value = [
+            TranscriptionHandle.from_transcription(
+                EpisodeMother.create_transcription(episode_id=episode_id, text=text)
+            )
+            for episode_id, text in [("ep1", "hola " * 50), ("ep2", "adiós " * 50)]
+        ]
+
+        saved = BackfillEpisodeStatsUseCase(
+            transcription_repository, self.repository
+        ).execute()
+
+        assert saved == 2
+        assert self.repository.get("ep2").total_words == 50
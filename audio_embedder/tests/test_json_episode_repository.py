@@ -0,0 +1,88 @@
+import json
+import os
+import shutil
+import tempfile
+
+from app.infrastructure.repositories.json_episode_repository import (
+    JSONEpisodeRepository,
+)
+
+
+def _episode_dict(episode_id: str, published_date: str) -> dict:
+    return {
+        "id": episode_id,
+        "title": f"Episodio {episode_id}",
+        "description": "Descripción",
+        "url": f"https://example.com/{episode_id}.mp3",
+        "published_date": published_date,
+        "duration": 900,
+        "file_size": 1000,
+        "local_file_path": None,
+        "podcast": None,
+    }
+
+
+class TestJSONEpisodeRepository:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "episodes.json")
+        self._write(
+            [
+                _episode_dict("20240520_190000", "2024-05-20T19:00:00"),
+                _episode_dict("20230101_190000", "2023-01-01T19:00:00"),
+                _episode_dict("20240102_190000", "2024-01-02T19:00:00"),
+            ]
+        )
+        self.repository = JSONEpisodeRepository(self.file_path)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, episodes: list[dict]) -> None:
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            json.dump(episodes, file)
+
+    def test_get_by_id_and_url(self):
+        episode = self.repository.get_by_id("20240102_190000")
+
+        assert episode.title == "Episodio 20240102_190000"
+        assert self.repository.get_by_url(episode.url) == episode
+        assert self.repository.get_by_id(episode.url) is None
+
+    def test_published_between_is_inclusive_and_sorted(self):
+        episodes = self.repository.get_published_between(20230101, 20240520)
+        in_2024 = self.repository.get_published_between(20240101, 20241231)
+
+        assert [e.id for e in episodes] == [
+            "20230101_190000",
+            "20240102_190000",
+            "20240520_190000",
+        ]
+        assert [e.id for e in in_2024] == ["20240102_190000", "20240520_190000"]
+
+    def test_file_is_parsed_once_and_reloaded_when_it_changes(self):
+        self.repository.get_all()
+        index = self.repository._index
+
+        self.repository.get_by_id("20240520_190000")
+        assert self.repository._index is index
+
+        self._write([_episode_dict("20250101_190000", "2025-01-01T19:00:00")])
+        os.utime(self.file_path, ns=(0, 10**18))
+
+        assert [e.id for e in self.repository.get_all()] == ["20250101_190000"]
+        assert self.repository.get_by_id("20240520_190000") is None
+
+    def test_partially_written_file_keeps_previous_episodes(self):
+        self.repository.get_all()
+        with open(self.file_path, "w", encoding="utf-8") as file:
+            file.write('[{"id": ')
+        os.utime(self.file_path, ns=(0, 10**18))
+
+        assert len(self.repository.get_all()) == 3
+
+    def test_missing_file(self):
+        repository = JSONEpisodeRepository(os.path.join(self.temp_dir, "missing.json"))
+
+        assert repository.get_all() == []
+        assert repository.get_by_id("20240520_190000") is None
@@ -0,0 +1,172 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import numpy as np
+
+from app.application.use_cases.build_lexical_index import BuildLexicalIndexUseCase
+from app.application.use_cases.search_lexical import SearchLexicalUseCase
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.domain.entities.transcription_handle import TranscriptionHandle
+from app.infrastructure.repositories.local_lexical_index_repository import (
+    LocalLexicalIndexRepository,
+)
+from app.shared.bm25_index import BM25Index
+from app.shared.rank_fusion import reciprocal_rank_fusion
+from app.shared.text_tokenizer import tokenize
+from tests.helpers.episode_mother import EpisodeMother
+
+DOCUMENTS = [
+    "Luis XIV, el Rey Sol, gobernó Francia desde Versalles",
+    "En 1492 Colón llegó a América con tres carabelas",
+    "La revolución francesa empezó en 1789 en París",
+    "Francia y España firmaron la paz; Francia salió reforzada",
+]
+
+
+def _chunks():
+    return [
+        EpisodeMother.create_embedding(
+            episode_id=f"ep{i % 2}",
+            chunk_index=i,
+            chunk_text=text,
+            metadata={"episode_id": f"ep{i % 2}", "chunk_id": f"id-{i}"},
+        )
+        for i, text in enumerate(DOCUMENTS)
+    ]
+
+
+class TestTokenizer:
+    def test_folds_accents_and_case_but_keeps_enye(self):
+        assert tokenize("REVOLUCIÓN, pingüino y año 1492") == [
+            "revolucion",
+            "pinguino",
+            "año",
+            "1492",
+        ]
+
+    def test_drops_stopwords(self):
+        assert tokenize("el rey de la casa") == ["rey", "casa"]
+
+
+class TestBM25Index:
+    def setup_method(self):
+        self.index = BM25Index.build(tokenize(text) for text in DOCUMENTS)
+
+    def test_postings_are_delta_encoded(self):
+        docs, freqs = self.index.postings("francia")
+
+        assert docs.tolist() == [0, 3]
+        assert freqs.tolist() == [1, 2]
+        assert self.index.doc_gaps.dtype == np.uint8
+
+    def test_rare_terms_and_accents_match(self):
+        docs, scores = self.index.search(tokenize("Revolucion Francesa"), top_k=2)
+
+        assert docs.tolist() == [2]
+        assert scores[0] > 0
+
+    def test_restricted_to_documents(self):
+        docs, _ = self.index.search(tokenize("francia"), top_k=5, docs=np.array([0]))
+
+        assert docs.tolist() == [0]
+
+    def test_save_and_load(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, "bm25.npz")
+            self.index.save(path)
+            loaded = BM25Index.load(path)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        query = tokenize("Francia 1492")
+        np.testing.assert_allclose(loaded.scores(query), self.index.scores(query))
+
+
+class TestReciprocalRankFusion:
+    def test_items_in_both_rankings_win(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+        assert [key for key, _ in fused] == ["c", "a", "b", "d"]
+
+
+class TestLexicalSearch:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = LocalLexicalIndexRepository(self.temp_dir)
+        self.repository.rebuild(_chunks())
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_search_reloads_from_disk_and_filters(self):
+        repository = LocalLexicalIndexRepository(self.temp_dir)
+
+        results = repository.search("francia", top_k=5)
+        filtered = repository.search("francia", 5, {"episode_id": "ep0"})
+
+        assert [r.chunk_index for r in results] == [3, 0]
+        assert results[0].metadata["bm25_score"] > results[1].metadata["bm25_score"]
+        assert [r.chunk_index for r in filtered] == [0]
+
+    def test_use_case_returns_search_results(self):
+        results = SearchLexicalUseCase(self.repository).execute("Colón 1492", k=3)
+
+        assert [r["metadata"]["chunk_id"] for r in results] == ["id-1"]
+        assert results[0]["rank"] == 1
+
+    def test_hybrid_fuses_vector_and_lexical_rankings(self):
+        vector_results = [_chunks()[i] for i in (2, 3)]
+        embedding_repository = Mock()
+        embedding_repository.search_similar.return_value = [
+            EpisodeMother.create_embedding(
+                episode_id=chunk.episode_id,
+                chunk_index=chunk.chunk_index,
+                chunk_text=chunk.chunk_text,
+                metadata={**chunk.metadata, "similarity_score": 0.9},
+            )
+            for chunk in vector_results
+        ]
+        embeddings = Mock()
+        embeddings.embed_query.return_value = [1.0]
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=embedding_repository,
+            embeddings=embeddings,
+            lexical_index=self.repository,
+        )
+
+        results = use_case.search_hybrid("Francia", k=3)
+
+        assert [r["metadata"]["chunk_id"] for r in results] == ["id-3", "id-2", "id-0"]
+        assert results[0]["similarity_score"] == 0.9
+        assert results[0]["metadata"]["bm25_score"] > 0
+
+
+class TestBuildLexicalIndex:
+    def test_indexes_chunks_of_every_transcription(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            transcription_repository = Mock()
+            transcription_repository.iter_handles.return_value = [
+                TranscriptionHandle.from_transcription(
+                    EpisodeMother.create_transcription(episode_id=episode_id, text=text)
+                )
+                for episode_id, text in [
+                    ("ep1", "Luis XIV reinó en Francia. " * 20),
+                    ("ep2", "Colón llegó en 1492. " * 20),
+                ]
+            ]
+            repository = LocalLexicalIndexRepository(temp_dir)
+
+            indexed = BuildLexicalIndexUseCase(
+                transcription_repository, repository
+            ).execute()
+            results = repository.search("1492")
+        finally:
+            shutil.rmtree(temp_dir)
+
+        assert indexed == repository.count()
+        assert {r.episode_id for r in results} == {"ep2"}
+        assert all(r.metadata["chunk_id"] for r in results)
@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+
+from app.infrastructure.repositories.local_embedding_repository import (
+    LocalEmbeddingRepository,
+)
+from app.shared.metadata_index import MetadataIndex
+from tests.helpers.episode_mother import EpisodeMother
+
+METADATA = [
+    {"episode_id": "ep1", "chunk_type": "semantic", "tags": ["a"]},
+    {"episode_id": "ep1", "chunk_type": "semantic_sub", "tags": ["b"]},
+    {"episode_id": "ep2", "chunk_type": "semantic", "flag": True},
+    {"episode_id": "ep2", "chunk_type": "semantic", "flag": 1},
+]
+
+
+class TestMetadataIndex:
+    def setup_method(self):
+        self.index = MetadataIndex(enumerate(METADATA))
+
+    def test_intersects_scalar_keys(self):
+        rows, residual = self.index.candidates(
+            {"episode_id": "ep2", "chunk_type": "semantic"}
+        )
+
+        assert rows.tolist() == [2, 3]
+        assert residual == {}
+
+    def test_booleans_do_not_match_numbers(self):
+        rows, _ = self.index.candidates({"flag": True})
+
+        assert rows.tolist() == [2]
+
+    def test_unknown_value_matches_nothing(self):
+        rows, _ = self.index.candidates({"episode_id": "ep3", "tags": ["a"]})
+
+        assert rows.tolist() == []
+
+    def test_non_scalar_values_are_left_as_residual(self):
+        rows, residual = self.index.candidates({"episode_id": "ep1", "tags": ["b"]})
+
+        assert rows.tolist() == [0, 1]
+        assert residual == {"tags": ["b"]}
+
+
+class TestLocalStoreFilters:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = LocalEmbeddingRepository(self.temp_dir)
+        self.repository.save_batch(
+            [
+                EpisodeMother.create_embedding(
+                    episode_id=metadata["episode_id"],
+                    chunk_index=i,
+                    vector=[1.0, float(i)],
+                    metadata=metadata,
+                )
+                for i, metadata in enumerate(METADATA)
+            ]
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_filter_combines_index_and_residual_check(self):
+        results = self.repository.search_similar(
+            [1.0, 0.0], top_k=10, filter_metadata={"episode_id": "ep1", "tags": ["b"]}
+        )
+
+        assert [r.chunk_index for r in results] == [1]
+
+    def test_index_is_rebuilt_after_deletes(self):
+        self.repository.search_similar([1.0, 0.0], filter_metadata={"flag": 1})
+        self.repository.delete_chunks(sorted(self.repository.get_chunk_ids("ep2")))
+
+        results = self.repository.search_similar(
+            [1.0, 0.0], filter_metadata={"episode_id": "ep2"}
+        )
+
+        assert results == []
@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+import numpy as np
+
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.shared.mmr import mmr_indices
+from tests.helpers.episode_mother import EpisodeMother
+
+# Dos chunks casi idénticos (solapados) y uno distinto algo menos relevante
+CANDIDATES = np.array([[1.0, 0.1, 0.0], [1.0, 0.12, 0.0], [0.7, 0.0, 0.7]])
+QUERY = np.array([1.0, 0.0, 0.2])
+
+
+class TestMMR:
+    def test_lambda_one_keeps_relevance_order(self):
+        order = mmr_indices(QUERY, CANDIDATES, top_k=3, lambda_mult=1.0)
+
+        assert order.tolist() == [0, 1, 2]
+
+    def test_near_duplicates_are_penalized(self):
+        order = mmr_indices(QUERY, CANDIDATES, top_k=2, lambda_mult=0.5)
+
+        assert order.tolist() == [0, 2]
+
+    def test_top_k_larger_than_candidates(self):
+        assert len(mmr_indices(QUERY, CANDIDATES, top_k=10)) == 3
+        assert len(mmr_indices(QUERY, CANDIDATES[:0], top_k=10)) == 0
+
+
+class TestSearchWithMMR:
+    def _chunks(self, with_vectors: bool):
+        return [
+            EpisodeMother.create_embedding(
+                chunk_index=i,
+                vector=vector.tolist() if with_vectors else [],
+                metadata={"chunk_id": f"id-{i}", "similarity_score": 1.0 - i / 10},
+            )
+            for i, vector in enumerate(CANDIDATES)
+        ]
+
+    def _use_case(self, repository):
+        embeddings = Mock()
+        embeddings.embed_query.return_value = QUERY.tolist()
+        return SearchSupabaseUseCase(
+            embedding_repository=repository,
+            embeddings=embeddings,
+            mmr_lambda=0.5,
+            mmr_fetch_k=3,
+        )
+
+    def test_overfetches_and_returns_diverse_top_k(self):
+        repository = Mock()
+        repository.search_similar.return_value = self._chunks(with_vectors=True)
+
+        results = self._use_case(repository).execute("consulta", k=2)
+
+        assert repository.search_similar.call_args.kwargs["top_k"] == 3
+        assert [r["metadata"]["chunk_id"] for r in results] == ["id-0", "id-2"]
+
+    def test_fetches_missing_vectors_from_the_store(self):
+        repository = Mock()
+        repository.search_similar.return_value = self._chunks(with_vectors=False)
+        repository.get_vectors.return_value = {
+            f"id-{i}": vector.tolist() for i, vector in enumerate(CANDIDATES)
+        }
+
+        results = self._use_case(repository).execute("consulta", k=2)
+
+        repository.get_vectors.assert_called_once_with(["id-0", "id-1", "id-2"])
+        assert [r["metadata"]["chunk_id"] for r in results] == ["id-0", "id-2"]
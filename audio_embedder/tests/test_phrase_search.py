@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.use_cases.search_phrase import SearchPhraseUseCase
+from app.infrastructure.repositories.local_positional_index_repository import (
+    LocalPositionalIndexRepository,
+)
+from app.shared.positional_index import PositionalIndex
+from app.shared.semantic_chunker import estimate_timestamp_minutes
+from tests.helpers.episode_mother import EpisodeMother
+
+TEXTS = [
+    "Luis XIV, el Rey Sol, vivía en Versalles. El rey de Francia bailaba.",
+    "El sol salía y el rey dormía. Luis XIII fue rey de Francia antes.",
+]
+
+
+class TestPositionalIndex:
+    def setup_method(self):
+        self.index = PositionalIndex.build(TEXTS)
+
+    def test_phrase_matches_consecutive_terms_only(self):
+        docs, offsets = self.index.phrase("rey sol")
+
+        assert docs.tolist() == [0]
+        assert offsets.tolist() == [TEXTS[0].index("Rey Sol")]
+
+    def test_phrase_keeps_stopword_gaps(self):
+        docs, _ = self.index.phrase("rey de Francia")
+
+        assert docs.tolist() == [0, 1]
+        assert len(self.index.phrase("rey Francia")[0]) == 0
+
+    def test_near_in_any_order(self):
+        docs, offsets = self.index.near("sol", "rey", 4)
+
+        assert docs.tolist() == [0, 1]
+        assert offsets.tolist() == [TEXTS[0].index("Sol"), TEXTS[1].index("sol")]
+        assert len(self.index.near("versalles", "dormia", 10)[0]) == 0
+
+    def test_near_does_not_cross_documents(self):
+        # "bailaba" cierra el primer texto y "sol" abre casi el segundo
+        assert len(self.index.near("bailaba", "sol", 5)[0]) == 0
+
+    def test_rejects_distances_beyond_document_gap(self):
+        with pytest.raises(ValueError):
+            self.index.near("rey", "sol", 1000)
+
+
+class TestSearchPhrase:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.transcriptions = [
+            EpisodeMother.create_transcription(episode_id=f"ep{i}", text=text)
+            for i, text in enumerate(TEXTS)
+        ]
+        LocalPositionalIndexRepository(self.temp_dir).rebuild(self.transcriptions)
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_carry_offsets_timestamps_and_snippets(self):
+        transcription_repository = Mock()
+        transcription_repository.get_by_episode_id.side_effect = lambda episode_id: (
+            self.transcriptions[int(episode_id[-1])]
+        )
+        use_case = SearchPhraseUseCase(
+            LocalPositionalIndexRepository(self.temp_dir),
+            transcription_repository,
+            snippet_chars=20,
+        )
+
+        matches = use_case.execute('"Luis XIII"')
+
+        offset = TEXTS[1].index("Luis XIII")
+        assert matches == [
+            {
+                "rank": 1,
+                "episode_id": "ep1",
+                "char_offset": offset,
+                "estimated_timestamp_minutes": estimate_timestamp_minutes(
+                    offset, len(TEXTS[1]), len(TEXTS[1].split())
+                ),
+                "snippet": TEXTS[1][offset - 10 : offset + 10],
+            }
+        ]
+
+    def test_near_query_syntax(self):
+        use_case = SearchPhraseUseCase(LocalPositionalIndexRepository(self.temp_dir))
+
+        matches = use_case.execute("Versalles NEAR/4 sol")
+
+        assert [m["episode_id"] for m in matches] == ["ep0"]
+        assert matches[0]["snippet"] == ""
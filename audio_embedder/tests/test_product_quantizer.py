@@ -0,0 +1,115 @@
+import shutil
+import tempfile
+
+import numpy as np
+
+from app.application.use_cases.train_product_quantizer import (
+    TrainProductQuantizerUseCase,
+)
+from app.infrastructure.repositories.local_embedding_repository import (
+    LocalEmbeddingRepository,
+)
+from app.shared.product_quantizer import ProductQuantizer
+from tests.helpers.episode_mother import EpisodeMother
+
+
+def _clustered_vectors(n: int = 600, dimension: int = 32, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, dimension))
+    return (
+        centers[rng.integers(0, 20, n)] + 0.05 * rng.normal(size=(n, dimension))
+    ).astype(np.float32)
+
+
+class TestProductQuantizer:
+    def test_encodes_vectors_into_one_byte_per_subvector(self):
+        vectors = _clustered_vectors()
+        quantizer = ProductQuantizer.train(vectors, n_subvectors=8, n_centroids=32)
+
+        codes = quantizer.encode(vectors)
+
+        assert codes.shape == (600, 8)
+        assert codes.dtype == np.uint8
+        assert quantizer.compression_ratio() == 32 * 4 / 8
+
+    def test_asymmetric_scores_approximate_inner_product(self):
+        vectors = _clustered_vectors()
+        quantizer = ProductQuantizer.train(vectors, n_subvectors=8, n_centroids=64)
+        codes = quantizer.encode(vectors)
+        query = vectors[0]
+
+        approximate = quantizer.asymmetric_scores(query, codes)
+        exact = vectors @ query
+
+        assert np.corrcoef(approximate, exact)[0, 1] > 0.99
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        quantizer = ProductQuantizer.train(_clustered_vectors(), n_subvectors=4)
+        path = str(tmp_path / "pq_codebooks.npy")
+
+        quantizer.save(path)
+        loaded = ProductQuantizer.load(path)
+
+        np.testing.assert_array_equal(loaded.codebooks, quantizer.codebooks)
+
+
+class TestLocalEmbeddingRepositoryWithPQ:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = LocalEmbeddingRepository(self.temp_dir)
+        self.vectors = _clustered_vectors()
+        self.repository.save_batch(
+            [
+                EpisodeMother.create_embedding(
+                    episode_id=f"episode_{i % 10}",
+                    vector=vector.tolist(),
+                    chunk_index=i,
+                )
+                for i, vector in enumerate(self.vectors)
+            ]
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_exact_search_returns_most_similar_chunk(self):
+        results = self.repository.search_similar(self.vectors[42].tolist(), top_k=1)
+
+        assert results[0].chunk_index == 42
+
+    def test_search_many_matches_one_search_per_query(self):
+        queries = [self.vectors[i].tolist() for i in (3, 42, 250)] + [[]]
+        self.repository.delete_chunks(
+            sorted(self.repository.get_chunk_ids("episode_2"))
+        )
+
+        batched = self.repository.search_similar_many(queries, top_k=5)
+
+        assert [[e.chunk_index for e in results] for results in batched] == [
+            [e.chunk_index for e in self.repository.search_similar(query, top_k=5)]
+            for query in queries
+        ]
+        assert batched[-1] == []
+
+    def test_pq_search_with_rerank_matches_exact_search(self):
+        use_case = TrainProductQuantizerUseCase(self.repository)
+        use_case.execute(n_subvectors=8, n_iter=10)
+        pq_repository = LocalEmbeddingRepository(
+            self.temp_dir, use_pq=True, rerank_candidates=50
+        )
+
+        results = pq_repository.search_similar(self.vectors[42].tolist(), top_k=1)
+        report = use_case.evaluate(n_queries=20, top_k=5, rerank_candidates=50)
+
+        assert results[0].chunk_index == 42
+        assert report["code_size_bytes"] == 8
+        assert report["recall@5_rerank"] >= report["recall@5"]
+
+    def test_vectors_saved_after_training_are_encoded(self):
+        TrainProductQuantizerUseCase(self.repository).execute(n_subvectors=8, n_iter=5)
+
+        self.repository.save(
+            EpisodeMother.create_embedding(vector=self.vectors[0].tolist())
+        )
+
+        assert len(self.repository.get_codes()) == 601
@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from app.application.services.query_embedding_cache import QueryEmbeddingCache
+from app.infrastructure.repositories.sqlite_embedding_cache_repository import (
+    SQLiteEmbeddingCacheRepository,
+)
+
+
+class TestQueryEmbeddingCache:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.disk_cache = SQLiteEmbeddingCacheRepository(
+            os.path.join(self.temp_dir, "cache.sqlite3"),
+            table_name="query_embedding_cache",
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_equivalent_queries_share_one_embedding_call(self):
+        cache = QueryEmbeddingCache("model", self.disk_cache)
+        compute = Mock(return_value=[0.5, 0.5])
+
+        first = cache.get_or_compute("Luis XIV", compute)
+        second = cache.get_or_compute("  luis   xiv ", compute)
+
+        compute.assert_called_once_with("luis xiv")
+        assert first == second == [0.5, 0.5]
+
+    def test_many_queries_computed_in_one_call(self):
+        cache = QueryEmbeddingCache("model", self.disk_cache)
+        cache.get_or_compute("uno", Mock(return_value=[1.0]))
+        compute_many = Mock(side_effect=lambda texts: [[2.0] for _ in texts])
+
+        vectors = cache.get_or_compute_many(["Uno", "dos", "DOS "], compute_many)
+
+        compute_many.assert_called_once_with(["dos"])
+        assert vectors == [[1.0], [2.0], [2.0]]
+
+    def test_disk_tier_survives_a_new_process(self):
+        QueryEmbeddingCache("model", self.disk_cache).get_or_compute(
+            "Iglesia católica", Mock(return_value=[1.0])
+        )
+        compute = Mock()
+
+        vector = QueryEmbeddingCache("model", self.disk_cache).get_or_compute(
+            "iglesia católica", compute
+        )
+
+        compute.assert_not_called()
+        assert vector == [1.0]
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = QueryEmbeddingCache("model", capacity=2)
+        compute = Mock(side_effect=lambda query: [float(len(query))])
+
+        cache.get_or_compute("a", compute)
+        cache.get_or_compute("bb", compute)
+        cache.get_or_compute("a", compute)
+        cache.get_or_compute("ccc", compute)
+        cache.get_or_compute("bb", compute)
+
+        assert [call.args[0] for call in compute.call_args_list] == [
+            "a",
+            "bb",
+            "ccc",
+            "bb",
+        ]
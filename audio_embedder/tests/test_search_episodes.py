@@ -33,3 +33,20 @@ class TestSearchEpisodesUseCase:
         embedding_repository.search_similar.assert_called_once_with(query_vector, 5)
         assert len(results) == 1
         assert results[0] == embedding
+
+    def test_search_many_embeds_all_queries_together(self):
+        embedding_repository = Mock()
+        embedding_repository.search_similar_many.return_value = [[], []]
+        embedding_service = Mock()
+        embedding_service.create_query_embeddings.return_value = [[0.1], [0.2]]
+
+        use_case = SearchEpisodesUseCase(embedding_repository, embedding_service)
+        results = use_case.search_many(["uno", "dos"], top_k=3)
+
+        embedding_service.create_query_embeddings.assert_called_once_with(
+            ["uno", "dos"]
+        )
+        embedding_repository.search_similar_many.assert_called_once_with(
+            [[0.1], [0.2]], 3
+        )
+        assert results == [[], []]
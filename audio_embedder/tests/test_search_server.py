@@ -0,0 +1,117 @@
+import asyncio
+import json
+import socket
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import Mock
+
+from app.infrastructure.http.search_server import SearchServer
+
+
+class TestSearchServer:
+    def setup_method(self):
+        self.use_case = Mock()
+        self.use_case.execute.return_value = [{"rank": 1, "episode_id": "ep1"}]
+        self.use_case.search_by_episode.return_value = [
+            {"rank": 1, "episode_id": "ep2"}
+        ]
+        self.use_case.get_episode_summary.return_value = {
+            "episode_id": "ep2",
+            "chunks_count": 3,
+        }
+
+        self.server = SearchServer(self.use_case, port=0)
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.server.start())
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait(timeout=5)
+        self.base_url = f"http://127.0.0.1:{self.server.port}"
+
+    def teardown_method(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+        self.server.executor.shutdown(wait=False)
+
+    def _get(self, path):
+        try:
+            with urllib.request.urlopen(self.base_url + path, timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def _raw(self, content_length):
+        request = (
+            "GET /health HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {content_length}\r\n\r\n"
+        )
+        with socket.create_connection(("127.0.0.1", self.server.port), 5) as conn:
+            conn.sendall(request.encode("latin-1"))
+            response = b""
+            while chunk := conn.recv(4096):
+                response += chunk
+        head, body = response.split(b"\r\n\r\n", 1)
+        return int(head.split()[1]), json.loads(body)
+
+    def test_search(self):
+        status, body = self._get("/search?q=Napole%C3%B3n&k=3")
+
+        assert status == 200
+        assert body["results"] == [{"rank": 1, "episode_id": "ep1"}]
+        self.use_case.execute.assert_called_once_with("Napoleón", 3)
+
+    def test_search_within_episode(self):
+        status, body = self._get("/search?q=rey&episode_id=ep2")
+
+        assert status == 200
+        assert body["results"][0]["episode_id"] == "ep2"
+        self.use_case.search_by_episode.assert_called_once_with("rey", "ep2", 5)
+
+    def test_episode_summary(self):
+        status, body = self._get("/episodes/ep2/summary")
+
+        assert status == 200
+        assert body["chunks_count"] == 3
+
+    def test_episode_without_stats_is_not_found(self):
+        self.use_case.get_episode_summary.return_value = {
+            "episode_id": "ep3",
+            "chunks_count": 0,
+            "error": "No hay estadísticas del episodio ep3",
+        }
+
+        status, body = self._get("/episodes/ep3/summary")
+
+        assert status == 404
+        assert "ep3" in body["error"]
+
+    def test_missing_query_is_bad_request(self):
+        status, body = self._get("/search")
+
+        assert status == 400
+        assert "q" in body["error"]
+
+    def test_unknown_route(self):
+        status, _ = self._get("/unknown")
+
+        assert status == 404
+
+    def test_invalid_content_length_is_bad_request(self):
+        for value in ["abc", "-1", "1e3"]:
+            status, body = self._raw(value)
+
+            assert status == 400
+            assert "Content-Length" in body["error"]
+
+    def test_body_over_the_limit_is_rejected(self):
+        status, _ = self._raw(SearchServer.MAX_BODY_BYTES + 1)
+
+        assert status == 413
@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from app.application.use_cases.search_supabase import SearchSupabaseUseCase
+from app.infrastructure.repositories.sqlite_embedding_repository import (
+    SQLiteEmbeddingRepository,
+)
+from app.shared.metadata_filter import metadata_contains
+from tests.helpers.episode_mother import EpisodeMother
+
+
+class TestMetadataContains:
+    def test_matches_jsonb_containment(self):
+        metadata = {"episode_id": "ep1", "tags": ["a", "b"], "info": {"lang": "es"}}
+
+        assert metadata_contains(metadata, {})
+        assert metadata_contains(metadata, {"episode_id": "ep1"})
+        assert metadata_contains(metadata, {"tags": ["b"]})
+        assert metadata_contains(metadata, {"info": {"lang": "es"}})
+        assert not metadata_contains(metadata, {"episode_id": "ep2"})
+        assert not metadata_contains(metadata, {"missing": "x"})
+        assert not metadata_contains({"flag": 1}, {"flag": True})
+        assert metadata_contains({"duration": 10.0}, {"duration": 10})
+
+
+class TestSQLiteEmbeddingRepository:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = SQLiteEmbeddingRepository(
+            os.path.join(self.temp_dir, "vectors.sqlite3")
+        )
+        self.repository.save_batch(
+            [
+                self._embedding("ep1", 0, [1.0, 0.0], chunk_type="semantic"),
+                self._embedding("ep1", 1, [0.8, 0.2], chunk_type="semantic_sub"),
+                self._embedding("ep2", 0, [0.9, 0.1], chunk_type="semantic"),
+                self._embedding("ep2", 1, [0.0, 1.0], chunk_type="semantic"),
+            ]
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _embedding(self, episode_id, chunk_index, vector, **metadata):
+        return EpisodeMother.create_embedding(
+            episode_id=episode_id,
+            chunk_index=chunk_index,
+            vector=vector,
+            chunk_text=f"{episode_id} chunk {chunk_index}",
+            metadata={
+                "episode_id": episode_id,
+                "chunk_index": chunk_index,
+                "chunk_id": f"{episode_id}-{chunk_index}",
+                **metadata,
+            },
+        )
+
+    def test_search_ranks_by_cosine_similarity(self):
+        results = self.repository.search_similar([1.0, 0.0], top_k=2)
+
+        assert [r.metadata["chunk_id"] for r in results] == ["ep1-0", "ep2-0"]
+        assert (
+            results[0].metadata["similarity_score"]
+            > results[1].metadata["similarity_score"]
+        )
+
+    def test_filter_restricts_to_matching_rows(self):
+        results = self.repository.search_similar(
+            [1.0, 0.0], top_k=10, filter_metadata={"episode_id": "ep2"}
+        )
+
+        assert [r.metadata["chunk_id"] for r in results] == ["ep2-0", "ep2-1"]
+
+    def test_filter_combines_keys(self):
+        results = self.repository.search_similar(
+            [1.0, 0.0],
+            top_k=10,
+            filter_metadata={"episode_id": "ep1", "chunk_type": "semantic_sub"},
+        )
+
+        assert [r.metadata["chunk_id"] for r in results] == ["ep1-1"]
+
+    def test_search_many_scores_all_queries_at_once(self):
+        results = self.repository.search_similar_many(
+            [[1.0, 0.0], [0.0, 1.0], []],
+            top_k=1,
+            filter_metadata={"chunk_type": "semantic"},
+        )
+
+        assert [[r.metadata["chunk_id"] for r in rs] for rs in results] == [
+            ["ep1-0"],
+            ["ep2-1"],
+            [],
+        ]
+
+    def test_upsert_by_chunk_id_does_not_duplicate(self):
+        self.repository.save_batch([self._embedding("ep1", 0, [0.0, 1.0])])
+
+        assert self.repository.count() == 4
+        assert self.repository.get_by_episode_id("ep1")[0].vector == [0.0, 1.0]
+
+    def test_delete_chunks(self):
+        self.repository.delete_chunks(["ep2-0", "ep2-1"])
+
+        assert self.repository.get_chunk_ids("ep2") == set()
+        results = self.repository.search_similar([1.0, 0.0], top_k=10)
+        assert {r.episode_id for r in results} == {"ep1"}
+
+    def test_search_supabase_use_case_runs_on_sqlite(self):
+        embeddings = Mock()
+        embeddings.embed_query.return_value = [1.0, 0.0]
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=self.repository, embeddings=embeddings
+        )
+
+        results = use_case.search_by_episode("consulta", "ep2", k=1)
+
+        assert len(results) == 1
+        assert results[0]["episode_id"] == "ep2"
+        assert results[0]["rank"] == 1
+
+    def test_search_supabase_search_many_embeds_in_one_call(self):
+        embeddings = Mock()
+        embeddings.embed_documents.return_value = [[1.0, 0.0], [0.0, 1.0]]
+        use_case = SearchSupabaseUseCase(
+            embedding_repository=self.repository, embeddings=embeddings
+        )
+
+        results = use_case.search_many(["uno", "dos"], k=1)
+
+        embeddings.embed_documents.assert_called_once_with(["uno", "dos"])
+        assert [r[0]["metadata"]["chunk_id"] for r in results] == ["ep1-0", "ep2-1"]
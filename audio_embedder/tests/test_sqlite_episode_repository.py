@@ -0,0 +1,100 @@
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+
+from app.application.use_cases.migrate_episodes import MigrateEpisodesUseCase
+from app.domain.entities.episode import Episode
+from app.infrastructure.repositories.json_episode_repository import (
+    JSONEpisodeRepository,
+)
+from app.infrastructure.repositories.sqlite_episode_repository import (
+    SQLiteEpisodeRepository,
+)
+
+
+def _episode(episode_id: str, url: str = "") -> Episode:
+    return Episode(
+        id=episode_id,
+        title=f"Episodio {episode_id}",
+        description="Descripción",
+        url=url or f"https://example.com/{episode_id}.mp3",
+        published_date=datetime.strptime(episode_id, "%Y%m%d_%H%M%S"),
+        duration=900,
+        file_size=1000,
+    )
+
+
+class TestSQLiteEpisodeRepository:
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = SQLiteEpisodeRepository(
+            os.path.join(self.temp_dir, "episodes.sqlite3")
+        )
+        self.repository.save_many(
+            [
+                _episode("20230101_190000"),
+                _episode("20240520_190000"),
+                _episode("20240102_190000"),
+            ]
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_lookups_by_id_url_and_date(self):
+        episode = self.repository.get_by_id("20240102_190000")
+
+        assert episode == _episode("20240102_190000")
+        assert self.repository.get_by_url(episode.url) == episode
+        assert [e.id for e in self.repository.get_all()] == [
+            "20240520_190000",
+            "20240102_190000",
+            "20230101_190000",
+        ]
+        assert [
+            e.id for e in self.repository.get_published_between(20240101, 20240520)
+        ] == ["20240102_190000", "20240520_190000"]
+
+    def test_sees_episodes_written_by_another_connection(self):
+        crawler = SQLiteEpisodeRepository(self.repository.file_path)
+
+        crawler.save(_episode("20250101_190000"))
+
+        assert self.repository.get_by_id("20250101_190000") is not None
+
+    def test_save_many_counts_only_new_or_changed_episodes(self):
+        unchanged = _episode("20230101_190000")
+        moved = _episode("20240520_190000", url="https://example.com/otro.mp3")
+
+        assert self.repository.save_many([unchanged, moved]) == 1
+        assert self.repository.get_by_id("20240520_190000") == moved
+
+
+class TestMigrateEpisodes:
+    def test_copies_episodes_json_and_can_be_repeated(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            episodes_file = os.path.join(temp_dir, "episodes.json")
+            episode = _episode("20230101_190000")
+            with open(episodes_file, "w", encoding="utf-8") as file:
+                json.dump(
+                    [
+                        {
+                            **asdict(episode),
+                            "published_date": episode.published_date.isoformat(),
+                        }
+                    ],
+                    file,
+                )
+            source = JSONEpisodeRepository(episodes_file)
+            target = SQLiteEpisodeRepository(os.path.join(temp_dir, "episodes.sqlite3"))
+            use_case = MigrateEpisodesUseCase(source, target)
+
+            assert use_case.execute() == (1, 1)
+            assert use_case.execute() == (1, 0)
+            assert target.get_all() == [episode]
+        finally:
+            shutil.rmtree(temp_dir)
@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from app.application.use_cases.migrate_transcriptions import (
+    MigrateTranscriptionsUseCase,
+)
+from app.domain.entities.transcription import Transcription
+from app.infrastructure.repositories.file_transcription_repository import (
+    FileTranscriptionRepository,
+)
+from app.infrastructure.repositories.sqlite_transcription_repository import (
+    SQLiteTranscriptionRepository,
+)
+
+
+def _transcription(episode_id: str, text: str = "Texto de prueba") -> Transcription:
+    return Transcription(
+        episode_id=episode_id,
+        text=text,
+        language="es",
+        created_at=datetime(2023, 1, 1, 12, 0, 0),
+        duration=900,
+        file_path=f"/audio/{episode_id}.mp3",
+    )
+
+
+class TestSQLiteTranscriptionRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = SQLiteTranscriptionRepository(
+            os.path.join(self.temp_dir, "transcriptions.sqlite3")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_and_get_by_episode_id(self):
+        transcription = _transcription("ep1")
+
+        self.repository.save(transcription)
+
+        self.assertEqual(self.repository.get_by_episode_id("ep1"), transcription)
+        self.assertIsNone(self.repository.get_by_episode_id("missing"))
+
+    def test_save_existing_transcription_does_not_overwrite(self):
+        original = _transcription("ep1", "Texto original")
+        self.repository.save(original)
+
+        result = self.repository.save(_transcription("ep1", "Texto nuevo"))
+
+        self.assertEqual(result.text, "Texto original")
+        self.assertEqual(
+            self.repository.get_by_episode_id("ep1").text, "Texto original"
+        )
+
+    def test_exists(self):
+        self.repository.save(_transcription("ep1"))
+
+        self.assertTrue(self.repository.exists("ep1"))
+        self.assertFalse(self.repository.exists("ep2"))
+
+    def test_iter_all_pages_through_every_transcription_in_order(self):
+        self.repository.ITER_BATCH_SIZE = 2
+        for episode_id in ["ep3", "ep1", "ep5", "ep2", "ep4"]:
+            self.repository.save(_transcription(episode_id))
+
+        episode_ids = [t.episode_id for t in self.repository.iter_all()]
+
+        self.assertEqual(episode_ids, ["ep1", "ep2", "ep3", "ep4", "ep5"])
+        self.assertEqual(len(self.repository.get_all()), 5)
+
+
+class TestMigrateTranscriptions(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = FileTranscriptionRepository(os.path.join(self.temp_dir, "json"))
+        self.target = SQLiteTranscriptionRepository(
+            os.path.join(self.temp_dir, "transcriptions.sqlite3")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_imports_directory_and_can_be_repeated(self):
+        self.source.save(_transcription("ep1"))
+        self.source.save(_transcription("ep2"))
+        use_case = MigrateTranscriptionsUseCase(self.source, self.target)
+
+        self.assertEqual(use_case.execute(), (2, 0))
+        self.source.save(_transcription("ep3"))
+        self.assertEqual(use_case.execute(), (1, 2))
+
+        self.assertEqual(self.target.get_all(), self.source.get_all())
@@ -0,0 +1,167 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+
+from app.application.use_cases.compress_transcriptions import (
+    CompressTranscriptionsUseCase,
+)
+from app.domain.entities.transcription import Transcription
+from app.infrastructure.repositories.file_transcription_repository import (
+    FileTranscriptionRepository,
+)
+from app.shared.transcript_compression import (
+    GZIP_MAGIC,
+    ZSTD_MAGIC,
+    TranscriptCodec,
+    TranscriptDecodeError,
+    detect_compression,
+)
+
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
+
+INTRO = "Bienvenidos a un nuevo episodio del podcast de historia. "
+OUTRO = " Gracias por escucharnos, nos vemos en el próximo episodio."
+
+
+def _transcription(episode_id: str, text: str = "Texto de prueba") -> Transcription:
+    return Transcription(
+        episode_id=episode_id,
+        text=text,
+        language="es",
+        created_at=datetime(2023, 1, 1, 12, 0, 0),
+        duration=900,
+        file_path=f"/audio/{episode_id}.mp3",
+    )
+
+
+class TestTranscriptCodec(unittest.TestCase):
+    def test_gzip_round_trip_is_detected_by_magic_bytes(self):
+        codec = TranscriptCodec("gzip")
+
+        raw = codec.encode(b'{"text": "hola"}')
+
+        self.assertEqual(detect_compression(raw), "gzip")
+        self.assertEqual(TranscriptCodec().decode(raw), b'{"text": "hola"}')
+
+    def test_plain_json_passes_through(self):
+        self.assertEqual(detect_compression(b"{}"), "none")
+        self.assertEqual(TranscriptCodec("gzip").decode(b"{}"), b"{}")
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            TranscriptCodec("brotli")
+
+    def test_truncated_gzip_raises_decode_error(self):
+        raw = TranscriptCodec("gzip").encode(b'{"text": "hola"}')
+
+        with self.assertRaises(TranscriptDecodeError):
+            TranscriptCodec().decode(raw[:-8])
+
+
+class TestCompressedFileTranscriptionRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_reads_files_of_any_format(self):
+        FileTranscriptionRepository(self.temp_dir).save(_transcription("ep1"))
+        gzip_repository = FileTranscriptionRepository(self.temp_dir, "gzip")
+        gzip_repository.save(_transcription("ep2"))
+
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["ep1.json", "ep2.json.gz"])
+        self.assertTrue(gzip_repository.exists("ep1"))
+        self.assertEqual(
+            FileTranscriptionRepository(self.temp_dir).get_by_episode_id("ep2"),
+            _transcription("ep2"),
+        )
+        self.assertEqual(
+            [t.episode_id for t in gzip_repository.iter_all()], ["ep1", "ep2"]
+        )
+
+    def test_save_does_not_duplicate_episode_in_another_format(self):
+        FileTranscriptionRepository(self.temp_dir).save(_transcription("ep1", "Viejo"))
+
+        result = FileTranscriptionRepository(self.temp_dir, "gzip").save(
+            _transcription("ep1", "Nuevo")
+        )
+
+        self.assertEqual(result.text, "Viejo")
+        self.assertEqual(os.listdir(self.temp_dir), ["ep1.json"])
+
+    def test_corrupt_files_are_skipped_when_iterating(self):
+        repository = FileTranscriptionRepository(self.temp_dir, "gzip")
+        repository.save(_transcription("ep1"))
+        repository.save(_transcription("ep3"))
+        with open(repository._get_file_path("ep1"), "rb") as file:
+            truncated = file.read()[:-8]
+        with open(os.path.join(self.temp_dir, "ep2.json.gz"), "wb") as file:
+            file.write(truncated)
+        with open(os.path.join(self.temp_dir, "ep4.json.gz"), "wb") as file:
+            file.write(GZIP_MAGIC + b"not gzip")
+        # Un frame zstd inválido, o uno escrito con un diccionario que falta
+        with open(os.path.join(self.temp_dir, "ep5.json.zst"), "wb") as file:
+            file.write(ZSTD_MAGIC + b"not zstd")
+
+        with self.assertLogs("FileTranscriptionRepository", "WARNING") as logs:
+            episode_ids = [t.episode_id for t in repository.iter_all()]
+            handle_ids = [h.episode_id for h in repository.iter_handles()]
+
+        self.assertEqual(episode_ids, ["ep1", "ep3"])
+        self.assertEqual(handle_ids, ["ep1", "ep3"])
+        self.assertTrue(any("ep2.json.gz" in line for line in logs.output))
+        self.assertTrue(any("ep5.json.zst" in line for line in logs.output))
+
+    @unittest.skipUnless(HAS_ZSTD, "zstandard is not installed")
+    def test_zstd_file_without_its_dictionary_is_skipped(self):
+        for i in range(40):
+            FileTranscriptionRepository(self.temp_dir).save(
+                _transcription(f"ep{i:02d}", f"{INTRO}Capítulo {i}.{OUTRO}")
+            )
+        repository = FileTranscriptionRepository(self.temp_dir, "zstd")
+        repository.train_dictionary(repository.iter_all())
+        repository.rewrite(repository.get_by_episode_id("ep00"))
+        os.remove(os.path.join(self.temp_dir, repository.DICTIONARY_FILE))
+
+        reloaded = FileTranscriptionRepository(self.temp_dir)
+        with self.assertLogs("FileTranscriptionRepository", "WARNING"):
+            episode_ids = [t.episode_id for t in reloaded.iter_all()]
+
+        self.assertEqual(len(episode_ids), 39)
+        self.assertNotIn("ep00", episode_ids)
+
+    def test_rewrite_replaces_the_old_format(self):
+        FileTranscriptionRepository(self.temp_dir).save(_transcription("ep1"))
+        repository = FileTranscriptionRepository(self.temp_dir, "gzip")
+
+        repository.rewrite(repository.get_by_episode_id("ep1"))
+
+        self.assertEqual(os.listdir(self.temp_dir), ["ep1.json.gz"])
+        self.assertEqual(repository.get_by_episode_id("ep1"), _transcription("ep1"))
+
+    @unittest.skipUnless(HAS_ZSTD, "zstandard is not installed")
+    def test_compress_use_case_trains_dictionary_and_reports(self):
+        source = FileTranscriptionRepository(self.temp_dir)
+        for i in range(40):
+            source.save(_transcription(f"ep{i:02d}", f"{INTRO}Capítulo {i}.{OUTRO}"))
+        repository = FileTranscriptionRepository(self.temp_dir, "zstd")
+
+        report = CompressTranscriptionsUseCase(repository).execute(read_repeats=1)
+
+        self.assertEqual(report["transcriptions"], 40)
+        self.assertGreater(report["dictionary_bytes"], 0)
+        self.assertGreater(report["compression_ratio"], 1)
+        self.assertIn(
+            FileTranscriptionRepository.DICTIONARY_FILE, os.listdir(self.temp_dir)
+        )
+        # Un repositorio nuevo carga el diccionario para leer los .json.zst
+        reloaded = FileTranscriptionRepository(self.temp_dir)
+        self.assertEqual(
+            reloaded.get_by_episode_id("ep07").text, f"{INTRO}Capítulo 7.{OUTRO}"
+        )
+        with self.assertRaises(ValueError):
+            repository.train_dictionary(repository.iter_all())
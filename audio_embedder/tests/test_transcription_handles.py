@@ -0,0 +1,168 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from app.application.use_cases.transcriptions_to_embeddings import (
+    TranscriptionsToEmbeddingsUseCase,
+)
+from app.domain.entities.transcription import Transcription
+from app.infrastructure.repositories.file_transcription_repository import (
+    FileTranscriptionRepository,
+)
+from app.infrastructure.repositories.sqlite_transcription_repository import (
+    SQLiteTranscriptionRepository,
+)
+
+
+def _transcription(episode_id: str, text: str = "Texto de prueba") -> Transcription:
+    return Transcription(
+        episode_id=episode_id,
+        text=text,
+        language="es",
+        created_at=datetime(2023, 1, 1, 12, 0, 0),
+        duration=900,
+        file_path=f"/audio/{episode_id}.mp3",
+    )
+
+
+class TestSQLiteTranscriptionHandles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = SQLiteTranscriptionRepository(
+            os.path.join(self.temp_dir, "transcriptions.sqlite3")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_handles_load_text_on_access(self):
+        self.repository.ITER_BATCH_SIZE = 2
+        for episode_id in ["ep3", "ep1", "ep2"]:
+            self.repository.save(_transcription(episode_id, f"Texto de {episode_id}"))
+
+        handles = list(self.repository.iter_handles())
+
+        self.assertEqual([h.episode_id for h in handles], ["ep1", "ep2", "ep3"])
+        self.assertEqual(handles[0].size, len("Texto de ep1"))
+        self.assertEqual(handles[0].text, "Texto de ep1")
+        self.assertEqual(handles[1].load(), _transcription("ep2", "Texto de ep2"))
+
+    def test_handle_of_deleted_row_raises(self):
+        self.repository.save(_transcription("ep1"))
+        handle = next(self.repository.iter_handles())
+
+        self.repository.connection.execute("DELETE FROM transcriptions")
+        self.repository.connection.commit()
+
+        with self.assertRaises(KeyError):
+            handle.load()
+
+
+class TestFileTranscriptionHandles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = FileTranscriptionRepository(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_text_is_read_from_disk_on_access(self):
+        saved = self.repository.save(_transcription("ep1", "Texto original"))
+        handle = next(self.repository.iter_handles())
+
+        path = self.repository._get_file_path(saved.episode_id)
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        data["text"] = "Texto editado"
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+        self.assertEqual(handle.size, len("Texto original"))
+        self.assertEqual(handle.text, "Texto editado")
+
+    def test_handles_come_from_metadata_without_reading_files(self):
+        for episode_id in ["ep1", "ep2"]:
+            self.repository.save(_transcription(episode_id, f"Texto de {episode_id}"))
+        first = list(self.repository.iter_handles())
+
+        reloaded = FileTranscriptionRepository(self.temp_dir)
+        with patch.object(reloaded, "_read", wraps=reloaded._read) as read:
+            handles = list(reloaded.iter_handles())
+            self.assertEqual(read.call_count, 0)
+            self.assertEqual(handles[1].load(), _transcription("ep2", "Texto de ep2"))
+            self.assertEqual(read.call_count, 1)
+
+        self.assertEqual(
+            [(h.episode_id, h.size, h.created_at) for h in handles],
+            [(h.episode_id, h.size, h.created_at) for h in first],
+        )
+
+    def test_changed_and_deleted_files_refresh_the_metadata(self):
+        self.repository.save(_transcription("ep1", "Corto"))
+        self.repository.save(_transcription("ep2"))
+        list(self.repository.iter_handles())
+
+        os.remove(self.repository._get_file_path("ep2"))
+        self.repository.rewrite(_transcription("ep1", "Un texto más largo"))
+        with patch.object(
+            self.repository, "_read", wraps=self.repository._read
+        ) as read:
+            handles = list(self.repository.iter_handles())
+
+        self.assertEqual(read.call_count, 1)
+        self.assertEqual([h.episode_id for h in handles], ["ep1"])
+        self.assertEqual(handles[0].size, len("Un texto más largo"))
+        path = os.path.join(self.temp_dir, FileTranscriptionRepository.METADATA_FILE)
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual([json.loads(line)["file"] for line in file], ["ep1.json"])
+
+
+class TestTranscriptionsToEmbeddingsStreaming(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = FileTranscriptionRepository(self.temp_dir)
+        for episode_id in ["ep1", "ep2"]:
+            self.repository.save(
+                _transcription(episode_id, "La historia de Francia. " * 20)
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_batched_path_consumes_transcriptions_lazily(self):
+        consumed = []
+        embedding_service = Mock()
+        embedding_service.create_embeddings_batch.side_effect = lambda items: {
+            item.episode_id: consumed.append(item.episode_id) or ["embedding"]
+            for item in items
+        }
+        use_case = TranscriptionsToEmbeddingsUseCase(
+            self.repository, Mock(), embedding_service, use_supabase=True
+        )
+
+        use_case.execute()
+
+        (argument,), _ = embedding_service.create_embeddings_batch.call_args
+        self.assertNotIsInstance(argument, list)
+        self.assertEqual(consumed, ["ep1", "ep2"])
+
+    def test_local_path_skips_existing_embeddings_without_loading(self):
+        embedding_repository = Mock()
+        embedding_repository.get_by_episode_id.side_effect = lambda episode_id: (
+            ["embedding"] if episode_id == "ep1" else []
+        )
+        embedding_service = Mock()
+        embedding_service.create_embeddings.return_value = []
+        use_case = TranscriptionsToEmbeddingsUseCase(
+            self.repository, embedding_repository, embedding_service
+        )
+
+        use_case.execute()
+
+        (transcription,), _ = embedding_service.create_embeddings.call_args
+        self.assertEqual(transcription.episode_id, "ep2")
+        self.assertEqual(embedding_service.create_embeddings.call_count, 1)
@@ -14,6 +14,12 @@ from infrastructure.repositories.hardcoded_rss_url_repository import (
     HardcodedRSSUrlRepository,
 )
 from infrastructure.repositories.json_episode_repository import JSONEpisodeRepository
+from infrastructure.repositories.sqlite_episode_event_repository import (
+    SQLiteEpisodeEventRepository,
+)
+from infrastructure.repositories.sqlite_episode_repository import (
+    SQLiteEpisodeRepository,
+)
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +32,29 @@ def main() -> int:
         description="Podcast Crawler - Herramienta para hacer crawling de podcasts de Nieves Concostrina"
     )
     parser.add_argument("--version", action="version", version="podcast-crawler 1.0.0")
+    parser.add_argument(
+        "--episode-store",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Guardar los episodios en episodes.json o en el catálogo SQLite "
+        "compartido con audio_embedder",
+    )
+    parser.add_argument(
+        "--episodes-db-file",
+        default=os.path.join(data_dir, "episodes.sqlite3"),
+        help="Catálogo SQLite usado con --episode-store sqlite",
+    )
+    parser.add_argument(
+        "--publish-events",
+        action="store_true",
+        help="Publicar un evento por cada episodio descargado para el worker "
+        "de audio_embedder",
+    )
+    parser.add_argument(
+        "--events-db-file",
+        default=os.path.join(data_dir, "episode_events.sqlite3"),
+        help="Cola SQLite de eventos usada con --publish-events",
+    )
 
     args = parser.parse_args()
 
@@ -33,14 +62,23 @@ def main() -> int:
 
     audios_dir = os.path.join(os.path.dirname(data_dir), "audios")
     file_episode_repository = LocalFileEpisodeRepository(audios_dir)
+    episode_event_repository = None
+    if args.publish_events:
+        episode_event_repository = SQLiteEpisodeEventRepository(args.events_db_file)
     rss_url_repository = HardcodedRSSUrlRepository(
-        data_dir=data_dir, episode_downloader=EpisodeDownloader(file_episode_repository)
+        data_dir=data_dir,
+        episode_downloader=EpisodeDownloader(
+            file_episode_repository, episode_event_repository
+        ),
     )
 
-    episodes_json_path = os.path.join(data_dir, "episodes.json")
-    json_episode_repository = JSONEpisodeRepository(episodes_json_path)
+    if args.episode_store == "sqlite":
+        episode_repository = SQLiteEpisodeRepository(args.episodes_db_file)
+    else:
+        episodes_json_path = os.path.join(data_dir, "episodes.json")
+        episode_repository = JSONEpisodeRepository(episodes_json_path)
 
-    usecase = CrawlPodcastUseCase(rss_url_repository, json_episode_repository)
+    usecase = CrawlPodcastUseCase(rss_url_repository, episode_repository)
 
     podcasts = usecase.execute()
 
@@ -1,16 +1,22 @@
-from typing import List
+from typing import List, Optional
 
 import requests
 
 from domain.builders.episode_builder import EpisodeBuilder
 from domain.entities.podcast import Episode
+from domain.repositories.episode_event_repository import EpisodeEventRepository
 from domain.repositories.file_episode_repository import FileEpisodeRepository
 from shared.logger import get_logger
 
 
 class EpisodeDownloader:
-    def __init__(self, file_episode_repository: FileEpisodeRepository):
+    def __init__(
+        self,
+        file_episode_repository: FileEpisodeRepository,
+        episode_event_repository: Optional[EpisodeEventRepository] = None,
+    ):
         self.file_episode_repository = file_episode_repository
+        self.episode_event_repository = episode_event_repository
         self.logger = get_logger(__name__)
 
     def run(self, episodes: List[Episode]) -> List[Episode]:
@@ -48,5 +54,13 @@ class EpisodeDownloader:
                 audio_data += chunk
 
         file_path = self.file_episode_repository.save(episode, audio_data)
+        downloaded_episode = (
+            EpisodeBuilder(episode).with_local_file_path(file_path).build()
+        )
 
-        return EpisodeBuilder(episode).with_local_file_path(file_path).build()
+        # Sólo los episodios recién descargados: el worker del embedder no
+        # tiene que revisar el resto
+        if self.episode_event_repository:
+            self.episode_event_repository.publish_downloaded(downloaded_episode)
+
+        return downloaded_episode
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from domain.entities.podcast import Episode
+
+
+class EpisodeEventRepository(ABC):
+    @abstractmethod
+    def publish_downloaded(self, episode: Episode) -> None:
+        pass
@@ -11,29 +11,7 @@ class JSONEpisodeRepository(EpisodeRepository):
         self.file_path = file_path
 
     def save(self, episodes: List[Episode]) -> None:
-        episodes_data = []
-        for episode in episodes:
-            episode_dict = {
-                "id": episode.id,
-                "title": episode.title,
-                "description": episode.description,
-                "url": episode.url,
-                "published_date": episode.published_date.isoformat(),
-                "duration": episode.duration,
-                "file_size": episode.file_size,
-                "local_file_path": episode.local_file_path,
-                "podcast": None,
-            }
-
-            if episode.podcast:
-                episode_dict["podcast"] = {
-                    "title": episode.podcast.title,
-                    "description": episode.podcast.description,
-                    "feed_url": episode.podcast.feed_url,
-                    "last_updated": episode.podcast.last_updated.isoformat(),
-                }
-
-            episodes_data.append(episode_dict)
+        episodes_data = [episode_to_dict(episode) for episode in episodes]
 
         with open(self.file_path, "w", encoding="utf-8") as f:
             json.dump(episodes_data, f, indent=2, ensure_ascii=False)
@@ -81,3 +59,27 @@ class JSONEpisodeRepository(EpisodeRepository):
             if episode.title == title:
                 return episode
         raise ValueError(f"Episode with title '{title}' not found")
+
+
+def episode_to_dict(episode: Episode) -> dict:
+    episode_dict = {
+        "id": episode.id,
+        "title": episode.title,
+        "description": episode.description,
+        "url": episode.url,
+        "published_date": episode.published_date.isoformat(),
+        "duration": episode.duration,
+        "file_size": episode.file_size,
+        "local_file_path": episode.local_file_path,
+        "podcast": None,
+    }
+
+    if episode.podcast:
+        episode_dict["podcast"] = {
+            "title": episode.podcast.title,
+            "description": episode.podcast.description,
+            "feed_url": episode.podcast.feed_url,
+            "last_updated": episode.podcast.last_updated.isoformat(),
+        }
+
+    return episode_dict
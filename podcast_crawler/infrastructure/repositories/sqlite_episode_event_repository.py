@@ -0,0 +1,65 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from domain.entities.podcast import Episode
+from domain.repositories.episode_event_repository import EpisodeEventRepository
+from infrastructure.repositories.json_episode_repository import episode_to_dict
+from shared.logger import get_logger
+
+EPISODE_DOWNLOADED = "episode_downloaded"
+
+# audio_embedder (app/infrastructure/repositories/
+# sqlite_episode_event_repository.py) crea la misma tabla y consume los
+# eventos: si cambia el esquema hay que cambiarlo en los dos
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episode_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    type TEXT NOT NULL,
+    episode_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    consumed_at TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_episode_events_pending
+    ON episode_events (seq) WHERE consumed_at IS NULL;
+"""
+
+
+class SQLiteEpisodeEventRepository(EpisodeEventRepository):
+    """Cola de eventos en SQLite que consume el worker de audio_embedder.
+
+    Cada evento lleva el episodio con el mismo formato que episodes.json. El
+    evento se guarda con commit antes de volver, así que sobrevive aunque
+    el crawler o el worker se caigan.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.logger = get_logger(__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(file_path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def publish_downloaded(self, episode: Episode) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO episode_events (type, episode_id, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    EPISODE_DOWNLOADED,
+                    episode.id,
+                    json.dumps(episode_to_dict(episode), ensure_ascii=False),
+                    datetime.now().isoformat(),
+                ],
+            )
+        self.logger.info(f"Published {EPISODE_DOWNLOADED} event for {episode.id}")
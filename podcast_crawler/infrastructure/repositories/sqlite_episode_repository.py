@@ -0,0 +1,150 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from domain.entities.podcast import Episode, Podcast
+from domain.repositories.episode_repository import EpisodeRepository
+from shared.logger import get_logger
+
+COLUMNS = (
+    "id, title, description, url, published_date, publish_date, "
+    "duration, file_size, local_file_path, podcast"
+)
+
+# audio_embedder (app/infrastructure/repositories/sqlite_episode_repository.py)
+# crea la misma tabla: si cambia el esquema hay que cambiarlo en los dos
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_date TEXT NOT NULL,
+    publish_date INTEGER NOT NULL,
+    duration INTEGER,
+    file_size INTEGER,
+    local_file_path TEXT,
+    podcast TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_url ON episodes (url);
+CREATE INDEX IF NOT EXISTS idx_episodes_publish_date ON episodes (publish_date);
+"""
+
+# Sólo se reescribe una fila si algo ha cambiado
+UPSERT = f"""
+INSERT INTO episodes ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    url = excluded.url,
+    published_date = excluded.published_date,
+    publish_date = excluded.publish_date,
+    duration = excluded.duration,
+    file_size = excluded.file_size,
+    local_file_path = excluded.local_file_path,
+    podcast = excluded.podcast
+WHERE (title, description, url, published_date, duration, file_size,
+       local_file_path, podcast)
+   IS NOT (excluded.title, excluded.description, excluded.url,
+           excluded.published_date, excluded.duration, excluded.file_size,
+           excluded.local_file_path, excluded.podcast)
+"""
+
+
+class SQLiteEpisodeRepository(EpisodeRepository):
+    """Catálogo de episodios compartido con audio_embedder.
+
+    En vez de reescribir episodes.json entero en cada crawl, sólo se insertan
+    los episodios nuevos y se actualizan los que han cambiado. El embedder lee
+    la misma base con índices por id, URL y fecha de publicación.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.logger = get_logger(__name__)
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(file_path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def save(self, episodes: list[Episode]) -> None:
+        # Un mismo audio puede aparecer en dos feeds con el mismo id: se
+        # queda la última aparición
+        rows = {episode.id: self._episode_to_row(episode) for episode in episodes}
+        with self.connection:
+            changed = self.connection.executemany(UPSERT, rows.values()).rowcount
+        self.logger.info(
+            f"Saved {changed} new or changed episodes to {self.file_path} "
+            f"({len(rows)} in this crawl)"
+        )
+
+    def find_all(self) -> list[Episode]:
+        return self._select("ORDER BY published_date DESC")
+
+    def find_by_title(self, title: str) -> Episode:
+        episodes = self._select("WHERE title = ? LIMIT 1", [title])
+        if not episodes:
+            raise ValueError(f"Episode with title '{title}' not found")
+        return episodes[0]
+
+    def _select(self, where: str, params: list | None = None) -> list[Episode]:
+        rows = self.connection.execute(
+            f"SELECT {COLUMNS} FROM episodes {where}", params or []
+        ).fetchall()
+        return [self._row_to_episode(row) for row in rows]
+
+    def _episode_to_row(self, episode: Episode) -> list:
+        published = episode.published_date
+        podcast = None
+        if episode.podcast:
+            podcast = json.dumps(
+                {
+                    "title": episode.podcast.title,
+                    "description": episode.podcast.description,
+                    "feed_url": episode.podcast.feed_url,
+                    "last_updated": episode.podcast.last_updated.isoformat(),
+                },
+                ensure_ascii=False,
+            )
+
+        return [
+            episode.id,
+            episode.title,
+            episode.description,
+            episode.url,
+            published.isoformat(),
+            published.year * 10000 + published.month * 100 + published.day,
+            episode.duration,
+            episode.file_size,
+            episode.local_file_path,
+            podcast,
+        ]
+
+    def _row_to_episode(self, row: tuple) -> Episode:
+        podcast = None
+        if row[9]:
+            podcast_data = json.loads(row[9])
+            podcast = Podcast(
+                title=podcast_data["title"],
+                description=podcast_data["description"],
+                feed_url=podcast_data["feed_url"],
+                last_updated=datetime.fromisoformat(podcast_data["last_updated"]),
+            )
+
+        return Episode(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            url=row[3],
+            published_date=datetime.fromisoformat(row[4]),
+            duration=row[6],
+            file_size=row[7],
+            podcast=podcast,
+            local_file_path=row[8],
+        )
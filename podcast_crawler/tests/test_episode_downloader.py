@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import tempfile
@@ -10,6 +11,9 @@ from application.services.episode_downloader import EpisodeDownloader
 from infrastructure.repositories.local_file_episode_repository import (
     LocalFileEpisodeRepository,
 )
+from infrastructure.repositories.sqlite_episode_event_repository import (
+    SQLiteEpisodeEventRepository,
+)
 from tests.helpers.podcast_mother import EpisodeMother
 
 
@@ -93,6 +97,34 @@ class TestEpisodeDownloader:
                 assert len(episodes) == 1
                 assert episodes[0].local_file_path is None
 
+    def test_publishes_event_only_for_new_downloads(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repository = LocalFileEpisodeRepository(temp_dir)
+            events = SQLiteEpisodeEventRepository(
+                os.path.join(temp_dir, "episode_events.sqlite3")
+            )
+            downloader = EpisodeDownloader(repository, events)
+            episode = EpisodeMother.with_title("New Episode")
+
+            with patch("requests.get") as mock_get:
+                mock_response = Mock()
+                mock_response.raise_for_status.return_value = None
+                mock_response.iter_content.return_value = [b"audio"]
+                mock_get.return_value.__enter__.return_value = mock_response
+
+                downloaded = downloader.run([episode])[0]
+                downloader.run([episode])
+
+            rows = events.connection.execute(
+                "SELECT type, episode_id, payload FROM episode_events"
+            ).fetchall()
+            events.connection.close()
+
+            assert len(rows) == 1
+            assert rows[0][:2] == ("episode_downloaded", episode.id)
+            payload = json.loads(rows[0][2])
+            assert payload["local_file_path"] == downloaded.local_file_path
+
 
 class TestLocalFileEpisodeRepository:
     def test_saves_episode_audio_data(self):
@@ -0,0 +1,86 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities.podcast import Episode
+from infrastructure.repositories.sqlite_episode_repository import (
+    SQLiteEpisodeRepository,
+)
+from tests.helpers.podcast_mother import EpisodeBuilder, PodcastMother
+
+
+def _episode(title: str, published_date: datetime) -> Episode:
+    return (
+        EpisodeBuilder().with_title(title).with_published_date(published_date).build()
+    )
+
+
+class TestSQLiteEpisodeRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "episodes.sqlite3")
+        self.repository = SQLiteEpisodeRepository(self.file_path)
+
+    def tearDown(self):
+        self.repository.connection.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_saves_and_finds_episodes_newest_first(self):
+        older = _episode("Older", datetime(2023, 1, 1, 19, 0, 0))
+        newer = _episode("Newer", datetime(2024, 5, 20, 19, 0, 0))
+
+        self.repository.save([older, newer])
+
+        self.assertEqual(self.repository.find_all(), [newer, older])
+
+    def test_round_trips_podcast_data(self):
+        episode = Episode(
+            title="Test Episode",
+            description="Test Description",
+            url="https://example.com/test.mp3",
+            published_date=datetime(2023, 1, 1, 12, 0, 0),
+            duration=1800,
+            file_size=50000000,
+            podcast=PodcastMother.with_title("Test Podcast"),
+            local_file_path="/path/to/local/file.mp3",
+        )
+
+        self.repository.save([episode])
+
+        self.assertEqual(self.repository.find_by_title("Test Episode"), episode)
+
+    def test_saving_again_only_updates_changed_episodes(self):
+        episode = _episode("Episode 1", datetime(2023, 1, 1, 19, 0, 0))
+        second = _episode("Episode 2", datetime(2023, 1, 2, 19, 0, 0))
+        self.repository.save([episode, second])
+
+        changed = Episode(
+            title="Episode 1",
+            description=episode.description,
+            url=episode.url,
+            published_date=episode.published_date,
+            duration=episode.duration,
+            file_size=episode.file_size,
+            local_file_path="/audios/episode_1.mp3",
+        )
+        self.repository.save([changed])
+
+        self.assertEqual(len(self.repository.find_all()), 2)
+        self.assertEqual(
+            self.repository.find_by_title("Episode 1").local_file_path,
+            "/audios/episode_1.mp3",
+        )
+        self.assertEqual(self.repository.connection.total_changes, 3)
+
+    def test_find_by_title_not_found(self):
+        with self.assertRaises(ValueError):
+            self.repository.find_by_title("Missing")
+
+
+if __name__ == "__main__":
+    unittest.main()